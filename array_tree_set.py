@@ -0,0 +1,1247 @@
+"""
+array_tree_set module.
+
+This module provides the ArrayTreeSet class, a TreeSet whose red-black tree is
+stored as a struct of arrays instead of one object per node. Every node is an
+integer id that indexes the parallel arrays holding its value, sort key,
+children, parent, color and subtree size, so the tree does not create
+reference cycles and uses much less memory. Node id 0 is the null leaf of the
+tree.
+
+An ArrayTreeSet is usually created through the TreeSet constructor:
+
+    tree = TreeSet(int, values, engine="array")
+"""
+from array import array
+from bisect import bisect_left
+from typing import *
+from tree_set import RedBlackTree, TreeSet, E
+from tree_set_exceptions import NullPointerException
+
+
+class ArrayTreeSet(TreeSet):
+    """
+    Class that represents a TreeSet that stores its red-black tree in parallel
+    arrays indexed by integer node ids. The ids of the removed nodes are kept
+    in a free list, chained through the left children array, and reused by
+    the next insertions. If the tree has no key function, the keys array is
+    the values array itself.
+
+    It provides the same API and time costs than :class:`TreeSet`.
+    """
+
+    _RedBlackTree__attributes = RedBlackTree._RedBlackTree__attributes | {
+        "_ArrayTreeSet__root", "_ArrayTreeSet__values", "_ArrayTreeSet__left",
+        "_ArrayTreeSet__right", "_ArrayTreeSet__parent",
+        "_ArrayTreeSet__colors", "_ArrayTreeSet__free", "_ArrayTreeSet__keys",
+        "_ArrayTreeSet__sizes", "_ArrayTreeSet__first", "_ArrayTreeSet__last"
+    }
+
+    _NIL = 0
+    _RED = 1
+    _BLACK = 0
+    _ID_TYPE = "i"
+    _REBUILD_RATIO = 2
+
+    def __init__(self, generic_type: Type, sequence: Collection[E] = None,
+                 engine: str = "array", validate: bool = True,
+                 key: Callable[[E], Any] = None) -> None:
+        """
+        Initialize an empty ArrayTreeSet if type is given or constructs one
+        with the elements contained into the given collection.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param sequence: a collection to take items from and add them to
+            the ArrayTreeSet
+        :type sequence: Collection[E]
+        :param engine: the storage engine, always "array"
+        :type engine: str
+        :param validate: if False, the values given to the ArrayTreeSet are
+            not validated
+        :type validate: bool
+        :param key: function that returns the sort key of an element
+        :type key: Callable[[E], Any]
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__reset(0, key is not None)
+        super().__init__(generic_type, sequence, engine, validate, key)
+
+    def __reset(self, size: int, keyed: bool) -> None:
+        """
+        Private method that allocates empty arrays for the given number of
+        nodes, plus the null leaf.
+
+        :param size: number of nodes to allocate
+        :type size: int
+        :param keyed: if True, the keys are stored in their own array
+        :type keyed: bool
+        """
+        self.__root = self.__first = self.__last = self._NIL
+        self.__free = self._NIL
+        self.__values = [None] * (size + 1)
+        self.__keys = [None] * (size + 1) if keyed else self.__values
+        self.__left = array(self._ID_TYPE, [self._NIL]) * (size + 1)
+        self.__right = array(self._ID_TYPE, [self._NIL]) * (size + 1)
+        self.__parent = array(self._ID_TYPE, [self._NIL]) * (size + 1)
+        self.__colors = bytearray(size + 1)
+        self.__sizes = array(self._ID_TYPE, [0]) * (size + 1)
+
+    def __new_node(self, value: E, key: Any, parent: int) -> int:
+        """
+        Private method that allocates a new red node, reusing a free id if
+        there is any.
+
+        :param value: the value of the node
+        :type value: E
+        :param key: the sort key of the value
+        :type key: Any
+        :param parent: the id of the parent node
+        :type parent: int
+        :return: the id of the new node
+        :rtype: int
+        """
+        if node := self.__free:
+            self.__free = self.__left[node]
+            self.__values[node] = value
+            self.__keys[node] = key
+            self.__left[node] = self._NIL
+            self.__right[node] = self._NIL
+            self.__parent[node] = parent
+            self.__colors[node] = self._RED
+            self.__sizes[node] = 1
+        else:
+            node = len(self.__values)
+            self.__values.append(value)
+            if self.__keys is not self.__values:
+                self.__keys.append(key)
+            self.__left.append(self._NIL)
+            self.__right.append(self._NIL)
+            self.__parent.append(parent)
+            self.__colors.append(self._RED)
+            self.__sizes.append(1)
+
+        return node
+
+    def __free_node(self, node: int) -> None:
+        """
+        Private method that releases the given node id into the free list.
+
+        :param node: the id of the node to release
+        :type node: int
+        """
+        self.__values[node] = None
+        self.__keys[node] = None
+        self.__left[node] = self.__free
+        self.__free = node
+
+    @RedBlackTree._validation
+    def add(self, value: E) -> bool:
+        """
+        Inserts a new value into the ArrayTreeSet.
+
+        :param value: the value to insert
+        :type value: E
+        :return: False if the value already exists in the tree, True otherwise
+        :rtype: bool
+        """
+        self._own()
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        keys, left, right = self.__keys, self.__left, self.__right
+        parent = candidate = self._NIL
+        current = self.__root
+        is_left = False
+
+        while current:
+            parent = current
+            if is_left := key < keys[current]:
+                current = left[current]
+            else:
+                candidate = current
+                current = right[current]
+
+        if candidate and keys[candidate] == key:
+            return False
+
+        self.__attach(value, key, parent, is_left)
+        return True
+
+    def __attach(self, value: E, key: Any, parent: int,
+                 is_left: bool) -> int:
+        """
+        Private method that links a new node as a child of the given leaf
+        position and rebalances the tree.
+
+        :param value: the value of the new node
+        :type value: E
+        :param key: the key of the value
+        :type key: Any
+        :param parent: the id of the parent node, or 0 if the tree is empty
+        :type parent: int
+        :param is_left: if True, the new node is the left child
+        :type is_left: bool
+        :return: the id of the new node
+        :rtype: int
+        """
+        node = self.__new_node(value, key, parent)
+        if not parent:
+            self.__root = self.__first = self.__last = node
+        elif is_left:
+            self.__left[parent] = node
+            if parent == self.__first:
+                self.__first = node
+        else:
+            self.__right[parent] = node
+            if parent == self.__last:
+                self.__last = node
+
+        sizes, parents = self.__sizes, self.__parent
+        while parent:
+            sizes[parent] += 1
+            parent = parents[parent]
+
+        self.__fix_after_insertion(node)
+        self._RedBlackTree__size += 1
+        return node
+
+    def _insert_before(self, node: int, value: E, key: Any) -> int:
+        """
+        Inserts a new value just before the given node. See
+        :meth:`RedBlackTree._insert_before`.
+
+        :param node: the id of the node that follows the new value, or 0 to
+            insert it after the last node
+        :type node: int
+        :param value: the value to insert
+        :type value: E
+        :param key: the key of the value
+        :type key: Any
+        :return: the id of the new node
+        :rtype: int
+        """
+        if not node:
+            return self.__attach(value, key, self.__last, False)
+        if not self.__left[node]:
+            return self.__attach(value, key, node, True)
+        return self.__attach(value, key,
+                             self.__walk_end(self.__left[node], True), False)
+
+    def _remove_node(self, node: int) -> int:
+        """
+        Removes the given node from the tree without searching it.
+
+        :param node: the id of the node to remove
+        :type node: int
+        :return: the id of the node that followed the removed one, or 0
+        :rtype: int
+        """
+        following = self._step(node, False)
+        self.__unlink(node)
+        return following
+
+    def _step(self, node: int, reverse: bool) -> int:
+        """
+        Returns the node that follows the given one in order, or the one that
+        precedes it if reverse is True. See :meth:`RedBlackTree._step`.
+
+        :param node: the id of the current node
+        :type node: int
+        :param reverse: if True, the previous node is returned
+        :type reverse: bool
+        :return: the id of the next or previous node, or 0
+        :rtype: int
+        """
+        far = self.__left if reverse else self.__right
+        if far[node]:
+            return self.__walk_end(far[node], reverse)
+
+        parent = self.__parent[node]
+        while parent and node == far[parent]:
+            node, parent = parent, self.__parent[parent]
+        return parent
+
+    def _item(self, node: int) -> Tuple[Any, Union[E, None]]:
+        """
+        Returns the key and the value of the given node.
+
+        :param node: the id of the node
+        :type node: int
+        :return: the key and the value, both None for the null leaf
+        :rtype: Tuple[Any, Union[E, None]]
+        """
+        return self.__keys[node], self.__values[node]
+
+    def _finger(self, node: Union[int, None], key: Any,
+                reverse: bool = False) -> int:
+        """
+        Finds the node with the least key greater than or equal to the given
+        one, or the greatest key lower than or equal to it if reverse is True,
+        starting from the given node. See :meth:`RedBlackTree._finger`.
+
+        :param node: the id of the node to start from, None to start from the
+            root or 0 if a lower key (a greater one if reverse is True) had no
+            answer
+        :type node: Union[int, None]
+        :param key: the key to seek
+        :type key: Any
+        :param reverse: if True, the floor of the key is sought
+        :type reverse: bool
+        :return: the id of the found node or 0
+        :rtype: int
+        """
+        keys, parents = self.__keys, self.__parent
+        near, far = (self.__right, self.__left) if reverse \
+            else (self.__left, self.__right)
+        candidate = self._NIL
+        if node is None:
+            current = self.__root
+        elif not node:
+            return node
+        else:
+            current = node
+            ahead = bool((key < keys[node]) if reverse else (keys[node] < key))
+            while parent := parents[current]:
+                if (current == near[parent]) == ahead \
+                        and (not ((key < keys[parent]) if reverse
+                                  else (keys[parent] < key))) == ahead:
+                    if ahead:
+                        candidate = parent
+                    break
+                current = parent
+
+        while current:
+            if (key < keys[current]) if reverse else (keys[current] < key):
+                current = far[current]
+            else:
+                candidate = current
+                current = near[current]
+        return candidate
+
+    @RedBlackTree._validation
+    def remove(self, value: E) -> bool:
+        """
+        Deletes a value from the ArrayTreeSet.
+
+        :param value: the value to delete
+        :type value: E
+        :return: False if the value does not exist in the tree, True otherwise
+        :rtype: bool
+        """
+        self._own()
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        if not (node := self.__find(key)):
+            return False
+
+        self.__unlink(node)
+        return True
+
+    def _extreme(self, last: bool) -> Union[E, None]:
+        """
+        Returns the lowest element of the ArrayTreeSet, or the greatest one
+        if last is True. See :meth:`RedBlackTree._extreme`.
+
+        :param last: if True, the greatest element is returned
+        :type last: bool
+        :return: the lowest or greatest element, or None if it is empty
+        :rtype: Union[E, None]
+        """
+        return self.__values[self.__last if last else self.__first]
+
+    def _poll(self, last: bool) -> Union[E, None]:
+        """
+        Removes and returns the lowest element of the ArrayTreeSet, or the
+        greatest one if last is True. See :meth:`RedBlackTree._poll`.
+
+        :param last: if True, the greatest element is removed
+        :type last: bool
+        :return: the removed element, or None if it is empty
+        :rtype: Union[E, None]
+        """
+        self._own()
+        if not (node := self.__last if last else self.__first):
+            return None
+
+        value = self.__values[node]
+        self.__unlink(node)
+        return value
+
+    def __unlink(self, node: int) -> None:
+        """
+        Private method that removes the given node from the tree, updating
+        the cached first and last nodes, and releases its id.
+
+        :param node: the id of the node to remove
+        :type node: int
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        self._RedBlackTree__epoch += 1
+        if node == self.__first:
+            self.__first = self.__walk_end(right[node], False) \
+                if right[node] else parent[node]
+        if node == self.__last:
+            self.__last = self.__walk_end(left[node], True) \
+                if left[node] else parent[node]
+
+        colors, sizes = self.__colors, self.__sizes
+        successor = node
+        if left[node] and right[node]:
+            successor = right[node]
+            while left[successor]:
+                successor = left[successor]
+
+        ancestor = parent[successor]
+        while ancestor:
+            sizes[ancestor] -= 1
+            ancestor = parent[ancestor]
+
+        successor_color = colors[successor]
+        if not left[node]:
+            replacement = right[node]
+            self.__replace(node, replacement)
+        elif not right[node]:
+            replacement = left[node]
+            self.__replace(node, replacement)
+        else:
+            replacement = right[successor]
+            if parent[successor] == node:
+                parent[replacement] = successor
+            else:
+                self.__replace(successor, replacement)
+                right[successor] = right[node]
+                parent[right[successor]] = successor
+
+            self.__replace(node, successor)
+            left[successor] = left[node]
+            parent[left[successor]] = successor
+            colors[successor] = colors[node]
+            sizes[successor] = sizes[node]
+
+        if successor_color == self._BLACK:
+            self.__fix_after_deletion(replacement)
+
+        self.__free_node(node)
+        self._RedBlackTree__size -= 1
+
+    def __walk_end(self, node: int, last: bool) -> int:
+        """
+        Private method that returns the first node of the given subtree, or
+        the last one if last is True.
+
+        :param node: the id of the subtree root
+        :type node: int
+        :param last: if True, the last node is returned
+        :type last: bool
+        :return: the id of the first or last node, or 0 if it is empty
+        :rtype: int
+        """
+        children = self.__right if last else self.__left
+        while children[node]:
+            node = children[node]
+        return node
+
+    def clear(self) -> None:
+        """
+        Clears the ArrayTreeSet, releasing its arrays.
+        """
+        self._own(False)
+        self.__reset(0, self.key is not None)
+        self._RedBlackTree__size = 0
+        self._RedBlackTree__epoch += 1
+
+    def _adopt_nodes(self, other: 'ArrayTreeSet') -> None:
+        """
+        Makes the current empty ArrayTreeSet hold the arrays of the given
+        one, without copying them. See :meth:`RedBlackTree._adopt_nodes`.
+
+        :param other: the tree whose arrays are adopted
+        :type other: ArrayTreeSet
+        """
+        self.__values, self.__keys = other.__values, other.__keys
+        self.__left, self.__right = other.__left, other.__right
+        self.__parent, self.__colors = other.__parent, other.__colors
+        self.__sizes, self.__free = other.__sizes, other.__free
+        self.__root, self.__first, self.__last = \
+            other.__root, other.__first, other.__last
+        self._RedBlackTree__size = other.size()
+
+    def _copy_nodes(self) -> None:
+        """
+        Replaces the arrays of the ArrayTreeSet with copies, which are made
+        by the arrays themselves without visiting the nodes. See
+        :meth:`RedBlackTree._copy_nodes`.
+        """
+        keyed = self.__keys is not self.__values
+        self.__values = self.__values[:]
+        self.__keys = self.__keys[:] if keyed else self.__values
+        self.__left, self.__right = self.__left[:], self.__right[:]
+        self.__parent, self.__colors = self.__parent[:], self.__colors[:]
+        self.__sizes = self.__sizes[:]
+
+    def _sorted_items(self) -> Tuple[List, List]:
+        """
+        Returns the keys of the ArrayTreeSet in order and the list of their
+        values.
+
+        :return: the sorted list of keys and the list of their values
+        :rtype: Tuple[List, List]
+        """
+        nodes = list(self.__nodes(True))
+        values = [self.__values[node] for node in nodes]
+        if self.__keys is self.__values:
+            return values, values
+        return [self.__keys[node] for node in nodes], values
+
+    def _keys(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the keys of the ArrayTreeSet in ascending
+        order, without copying them.
+
+        :return: an iterator over the sorted keys
+        :rtype: Iterator[Any]
+        """
+        return map(self.__keys.__getitem__, self.__nodes(True))
+
+    def _load_sorted(self, keys: List, values: List) -> None:
+        """
+        Replaces the content of the ArrayTreeSet with the given values,
+        building a balanced tree bottom-up into new arrays. See
+        :meth:`RedBlackTree._load_sorted`.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        """
+        self._own(False)
+        self.__reset(len(values), self.key is not None)
+        self.__values[1:] = values
+        if self.__keys is not self.__values:
+            self.__keys[1:] = keys
+        self.__root = self.__build(0, len(values), 0,
+                                   len(values).bit_length() - 1, self._NIL)
+        self.__colors[self.__root] = self._BLACK
+        self._RedBlackTree__size = len(values)
+        self._RedBlackTree__epoch += 1
+        self.__first = self.__walk_end(self.__root, False)
+        self.__last = self.__walk_end(self.__root, True)
+
+    def _remove_range(self, low: Any, low_inclusive: bool, high: Any,
+                      high_inclusive: bool) -> int:
+        """
+        Removes the nodes whose keys are between the given bounds, which must
+        be ordered. The subtrees of the arrays cannot be detached into
+        another tree, so a short range is removed node by node from its first
+        node and a long one is cut out of the sorted values, rebuilding the
+        tree in *O(n)*. See :meth:`RedBlackTree._remove_range`.
+
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is removed
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is removed
+        :type high_inclusive: bool
+        :return: the number of removed nodes
+        :rtype: int
+        """
+        size = self.size()
+        start = 0 if low is None else self._count_below(low, not low_inclusive)
+        end = size if high is None else self._count_below(high, high_inclusive)
+        removed = max(end - start, 0)
+        if not removed:
+            return 0
+
+        if removed * size.bit_length() < self._REBUILD_RATIO * size:
+            self._own()
+            node = self.__first if low is None else self._finger(None, low)
+            if not low_inclusive and not low < self.__keys[node]:
+                node = self._step(node, False)
+            for _ in range(removed):
+                node = self._remove_node(node)
+            return removed
+
+        keys, values = self._sorted_items()
+        values = values[:start] + values[end:]
+        self._load_sorted(values if self.key is None
+                          else keys[:start] + keys[end:], values)
+        return removed
+
+    @RedBlackTree._validation
+    def split(self, value: E) -> Tuple['ArrayTreeSet', Union[E, None],
+                                       'ArrayTreeSet']:
+        """
+        Splits the ArrayTreeSet by the given value into two new ArrayTreeSets,
+        leaving it empty. Since the node ids index the arrays of one tree, the
+        values are copied into the new trees in *O(n)*. See
+        :meth:`RedBlackTree.split`.
+
+        :param value: the value to split by
+        :type value: E
+        :return: the tree with the lower values, the value equal to the given
+            one or None, and the tree with the greater values
+        :rtype: Tuple[ArrayTreeSet, Union[E, None], ArrayTreeSet]
+        """
+        key = value if (key_function := self.key) is None \
+            else key_function(value)
+        keys, values = self._sorted_items()
+        start = bisect_left(keys, key)
+        end = start + (start < len(keys) and not key < keys[start])
+        found = values[start] if end > start else None
+        lower = self.__tree(keys[:start], values[:start])
+        higher = self.__tree(keys[end:], values[end:])
+        self.clear()
+        return lower, found, higher
+
+    def _join(self, pivot: Any, right: 'ArrayTreeSet') -> 'ArrayTreeSet':
+        """
+        Joins the current ArrayTreeSet, the pivot and the given one into a new
+        ArrayTreeSet in *O(n)*, leaving both empty. See
+        :meth:`RedBlackTree.join`.
+
+        :param pivot: the value between both trees, or None
+        :type pivot: Any
+        :param right: the tree with the greater values
+        :type right: ArrayTreeSet
+        :return: a new ArrayTreeSet with the values of both trees and the
+            pivot
+        :rtype: ArrayTreeSet
+        """
+        self._check_joinable(right)
+        keys, values = self._sorted_items()
+        right_keys, rights = right._sorted_items()
+        key = self._pivot_key(pivot, keys[-1] if keys else None,
+                              right_keys[0] if right_keys else None)
+
+        middle = [] if pivot is None else [pivot]
+        joined = values + middle + rights
+        tree = self.__tree(joined if self.key is None else
+                           keys + [key] * len(middle) + right_keys, joined)
+        self.clear()
+        right.clear()
+        return tree
+
+    def __tree(self, keys: List, values: List) -> 'ArrayTreeSet':
+        """
+        Returns a new ArrayTreeSet of the same class and key function built
+        from the given sorted keys and values.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :return: the new ArrayTreeSet
+        :rtype: ArrayTreeSet
+        """
+        tree = type(self)(self.object_type, key=self.key)
+        tree._load_sorted(keys, values)
+        return tree
+
+    def __build(self, start: int, end: int, depth: int, red_depth: int,
+                parent: int) -> int:
+        """
+        Links a balanced subtree with the nodes between the start (inclusive)
+        and end (exclusive) indexes of the sorted values. The value at index i
+        and its key are stored in the node with id i + 1.
+
+        :param start: index of the first value of the subtree
+        :type start: int
+        :param end: index after the last value of the subtree
+        :type end: int
+        :param depth: depth of the subtree root
+        :type depth: int
+        :param red_depth: depth of the nodes that must be colored red
+        :type red_depth: int
+        :param parent: id of the parent of the subtree root
+        :type parent: int
+        :return: the id of the subtree root
+        :rtype: int
+        """
+        if start >= end:
+            return self._NIL
+
+        middle = (start + end) // 2
+        node = middle + 1
+        self.__parent[node] = parent
+        self.__colors[node] = depth == red_depth
+        self.__sizes[node] = end - start
+        self.__left[node] = self.__build(start, middle, depth + 1, red_depth,
+                                         node)
+        self.__right[node] = self.__build(middle + 1, end, depth + 1,
+                                          red_depth, node)
+        return node
+
+    @RedBlackTree._validation
+    def higher(self, value: E) -> Union[E, None]:
+        """
+        Returns the next higher value in the tree compared to the given
+        value.
+
+        :param value: value to compare
+        :return: the next higher value in the tree compared to the given value
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        values, keys = self.__values, self.__keys
+        left, right = self.__left, self.__right
+        current = self.__root
+        result = None
+
+        while current:
+            if key < keys[current]:
+                result = values[current]
+                current = left[current]
+            else:
+                current = right[current]
+
+        return result
+
+    @RedBlackTree._validation
+    def lower(self, value: E) -> Union[E, None]:
+        """
+        Returns the contiguous lower element of the given value from the
+        ArrayTreeSet.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element lower than the given value. If it was not
+            found, None will be returned.
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        values, keys = self.__values, self.__keys
+        left, right = self.__left, self.__right
+        current = self.__root
+        result = None
+
+        while current:
+            if keys[current] < key:
+                result = values[current]
+                current = right[current]
+            else:
+                current = left[current]
+
+        return result
+
+    @RedBlackTree._validation
+    def ceiling(self, value: E) -> Union[E, None]:
+        """
+        Returns the least element in this set greater than or equal to the
+        given element, or None if there is no such element.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least element in this set greater than or equal
+            to the given element. If it was not found, None will be returned
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        values, keys = self.__values, self.__keys
+        left, right = self.__left, self.__right
+        current = self.__root
+        result = None
+
+        while current:
+            if keys[current] < key:
+                current = right[current]
+            else:
+                result = values[current]
+                current = left[current]
+
+        return result
+
+    @RedBlackTree._validation
+    def floor(self, value: E) -> Union[E, None]:
+        """
+        Returns the greatest element in this set less than or equal to the
+        given element, or None if there is no such element.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest element in this set less than or
+            equal to the given element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        values, keys = self.__values, self.__keys
+        left, right = self.__left, self.__right
+        current = self.__root
+        result = None
+
+        while current:
+            if key < keys[current]:
+                current = left[current]
+            else:
+                result = values[current]
+                current = right[current]
+
+        return result
+
+    def _count_below(self, key: Any, inclusive: bool) -> int:
+        """
+        Returns the number of elements whose keys are lower than the given
+        key, or lower than or equal to it if inclusive is True. See
+        :meth:`TreeSet._count_below`.
+
+        :param key: the sort key to compare
+        :type key: Any
+        :param inclusive: if True, the elements with the given key are counted
+        :type inclusive: bool
+        :return: the number of elements below the given key
+        :rtype: int
+        """
+        keys, sizes = self.__keys, self.__sizes
+        left, right = self.__left, self.__right
+        current = self.__root
+        count = 0
+
+        while current:
+            if (not key < keys[current]) if inclusive else keys[current] < key:
+                count += sizes[left[current]] + 1
+                current = right[current]
+            else:
+                current = left[current]
+
+        return count
+
+    def _iter_range(self, low: Any, low_inclusive: bool, high: Any,
+                    high_inclusive: bool,
+                    reverse: bool = False) -> Iterator[E]:
+        """
+        Generator that yields the elements whose keys are between the given
+        bounds, in ascending order or descending if reverse is True. See
+        :meth:`TreeSet._iter_range`.
+
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is included
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is included
+        :type high_inclusive: bool
+        :param reverse: if True, the elements are yielded in descending order
+        :type reverse: bool
+        """
+        values, keys = self.__values, self.__keys
+        if reverse:
+            start = self.__seek(high, high_inclusive, True)
+            for node in self.__walk(start, True):
+                if low is not None and (keys[node] < low if low_inclusive
+                                        else not low < keys[node]):
+                    return
+                yield values[node]
+        else:
+            start = self.__seek(low, low_inclusive, False)
+            for node in self.__walk(start, False):
+                if high is not None and (high < keys[node] if high_inclusive
+                                         else not keys[node] < high):
+                    return
+                yield values[node]
+
+    def __seek(self, key: Any, inclusive: bool, reverse: bool) -> int:
+        """
+        Private method that finds the node with the least key greater than
+        the given one, or the greatest key lower than it if reverse is True.
+        See :meth:`TreeSet._TreeSet__seek`.
+
+        :param key: the key to seek, or None to seek the first node
+        :type key: Any
+        :param inclusive: if True, the node with the given key is found
+        :type inclusive: bool
+        :param reverse: if True, seeks the greatest node below the key
+        :type reverse: bool
+        :return: the id of the found node or 0 if there is no such node
+        :rtype: int
+        """
+        keys, left, right = self.__keys, self.__left, self.__right
+        current = self.__root
+        result = self._NIL
+
+        while current:
+            if key is None:
+                go_right = reverse
+            elif reverse:
+                go_right = (not key < keys[current]) if inclusive \
+                    else keys[current] < key
+            else:
+                go_right = keys[current] < key if inclusive \
+                    else not key < keys[current]
+
+            if go_right == reverse:
+                result = current
+            current = right[current] if go_right else left[current]
+
+        return result
+
+    def _seek_many(self, keys: List, reverse: bool) -> Tuple[List, List]:
+        """
+        Finds the node with the least key greater than or equal to each of the
+        given ascending keys, or the greatest key lower than or equal to each
+        of the given descending keys if reverse is True, moving a finger
+        between the answers with :meth:`_finger`. See
+        :meth:`TreeSet._seek_many`.
+
+        :param keys: the sorted keys to seek
+        :type keys: List
+        :param reverse: if True, the keys are descending and the floors are
+            sought
+        :type reverse: bool
+        :return: the keys and the values of the found nodes, or None for the
+            keys without answer, in the order of the given keys
+        :rtype: Tuple[List, List]
+        """
+        node_keys = self.__keys
+        found = []
+        finger = None
+        for key in keys:
+            if finger is None or finger and (
+                    (key < node_keys[finger]) if reverse
+                    else (node_keys[finger] < key)):
+                finger = self._finger(finger, key, reverse)
+            found.append(finger)
+
+        return [node_keys[node] for node in found], \
+            [self.__values[node] for node in found]
+
+    def select(self, index: int) -> E:
+        """
+        Returns the element of the ArrayTreeSet at the given index. See
+        :meth:`TreeSet.select`.
+
+        :param index: the index of the element, between 0 and size - 1
+        :type index: int
+        :return: the element at the given index
+        :rtype: E
+        :raises IndexError: if the index is out of range
+        """
+        if not 0 <= index < self.size():
+            raise IndexError(f"TreeSet index out of range: {index}")
+
+        left, right, sizes = self.__left, self.__right, self.__sizes
+        current = self.__root
+        while index != (left_size := sizes[left[current]]):
+            if index < left_size:
+                current = left[current]
+            else:
+                index -= left_size + 1
+                current = right[current]
+
+        return self.__values[current]
+
+    def __find(self, key: Any) -> int:
+        """
+        Private method that searches the node having the given key, making a
+        single ordering comparison per level and checking the equality of the
+        last node whose key is not greater than the given one at the end.
+
+        :param key: the key to search
+        :type key: Any
+        :return: the id of the node having the key or 0 if the key is not
+            contained
+        :rtype: int
+        """
+        keys, left, right = self.__keys, self.__left, self.__right
+        candidate = self._NIL
+        current = self.__root
+
+        while current:
+            if key < keys[current]:
+                current = left[current]
+            else:
+                candidate = current
+                current = right[current]
+
+        if candidate and keys[candidate] == key:
+            return candidate
+
+        return self._NIL
+
+    def __fix_after_insertion(self, node: int) -> None:
+        """
+        Fixes the ArrayTreeSet after an insertion operation.
+
+        :param node: the id of the node that was inserted
+        :type node: int
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        colors = self.__colors
+
+        while colors[father := parent[node]] == self._RED:
+            grandfather = parent[father]
+            if father == right[grandfather]:
+                uncle = left[grandfather]
+                if colors[uncle] == self._RED:
+                    colors[uncle] = self._BLACK
+                    colors[father] = self._BLACK
+                    colors[grandfather] = self._RED
+                    node = grandfather
+                else:
+                    if node == left[father]:
+                        node = father
+                        self.__right_rotation(node)
+                        father = parent[node]
+                    colors[father] = self._BLACK
+                    colors[grandfather] = self._RED
+                    self.__left_rotation(grandfather)
+            else:
+                uncle = right[grandfather]
+                if colors[uncle] == self._RED:
+                    colors[uncle] = self._BLACK
+                    colors[father] = self._BLACK
+                    colors[grandfather] = self._RED
+                    node = grandfather
+                else:
+                    if node == right[father]:
+                        node = father
+                        self.__left_rotation(node)
+                        father = parent[node]
+                    colors[father] = self._BLACK
+                    colors[grandfather] = self._RED
+                    self.__right_rotation(grandfather)
+
+        colors[self.__root] = self._BLACK
+
+    def __fix_after_deletion(self, node: int) -> None:
+        """
+        Fixes the ArrayTreeSet after a deletion operation.
+
+        :param node: the id of the node that replaced the deleted one
+        :type node: int
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        colors = self.__colors
+
+        while node != self.__root and colors[node] == self._BLACK:
+            father = parent[node]
+            if node == left[father]:
+                sibling = right[father]
+                if colors[sibling] == self._RED:
+                    colors[sibling] = self._BLACK
+                    colors[father] = self._RED
+                    self.__left_rotation(father)
+                    sibling = right[father]
+
+                if colors[left[sibling]] == self._BLACK \
+                        and colors[right[sibling]] == self._BLACK:
+                    colors[sibling] = self._RED
+                    node = father
+                else:
+                    if colors[right[sibling]] == self._BLACK:
+                        colors[left[sibling]] = self._BLACK
+                        colors[sibling] = self._RED
+                        self.__right_rotation(sibling)
+                        sibling = right[father]
+
+                    colors[sibling] = colors[father]
+                    colors[father] = self._BLACK
+                    colors[right[sibling]] = self._BLACK
+                    self.__left_rotation(father)
+                    node = self.__root
+            else:
+                sibling = left[father]
+                if colors[sibling] == self._RED:
+                    colors[sibling] = self._BLACK
+                    colors[father] = self._RED
+                    self.__right_rotation(father)
+                    sibling = left[father]
+
+                if colors[right[sibling]] == self._BLACK \
+                        and colors[left[sibling]] == self._BLACK:
+                    colors[sibling] = self._RED
+                    node = father
+                else:
+                    if colors[left[sibling]] == self._BLACK:
+                        colors[right[sibling]] = self._BLACK
+                        colors[sibling] = self._RED
+                        self.__left_rotation(sibling)
+                        sibling = left[father]
+
+                    colors[sibling] = colors[father]
+                    colors[father] = self._BLACK
+                    colors[left[sibling]] = self._BLACK
+                    self.__right_rotation(father)
+                    node = self.__root
+
+        colors[node] = self._BLACK
+
+    def __left_rotation(self, node: int) -> None:
+        """
+        Performs a left rotation on a node.
+
+        :param node: the id of the node to perform the rotation on
+        :type node: int
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        other = right[node]
+        right[node] = left[other]
+        if left[other]:
+            parent[left[other]] = node
+
+        parent[other] = father = parent[node]
+        if not father:
+            self.__root = other
+        elif node == left[father]:
+            left[father] = other
+        else:
+            right[father] = other
+        left[other] = node
+        parent[node] = other
+        sizes = self.__sizes
+        sizes[other] = sizes[node]
+        sizes[node] = sizes[left[node]] + sizes[right[node]] + 1
+
+    def __right_rotation(self, node: int) -> None:
+        """
+        Performs a right rotation on a node.
+
+        :param node: the id of the node to perform the rotation on
+        :type node: int
+        """
+        left, right, parent = self.__left, self.__right, self.__parent
+        other = left[node]
+        left[node] = right[other]
+        if right[other]:
+            parent[right[other]] = node
+
+        parent[other] = father = parent[node]
+        if not father:
+            self.__root = other
+        elif node == right[father]:
+            right[father] = other
+        else:
+            left[father] = other
+        right[other] = node
+        parent[node] = other
+        sizes = self.__sizes
+        sizes[other] = sizes[node]
+        sizes[node] = sizes[left[node]] + sizes[right[node]] + 1
+
+    def __replace(self, node: int, other: int) -> None:
+        """
+        Replaces a node with another node.
+
+        :param node: the id of the node to be replaced
+        :type node: int
+        :param other: the id of the node to replace with
+        :type other: int
+        """
+        father = self.__parent[node]
+        if not father:
+            self.__root = other
+        elif node == self.__left[father]:
+            self.__left[father] = other
+        else:
+            self.__right[father] = other
+        self.__parent[other] = father
+
+    def __nodes(self, inorder: bool) -> Iterator[int]:
+        """
+        Generator that traverses the node ids of the ArrayTreeSet in-order or
+        reversed, starting from the cached first or last node.
+
+        :param inorder: if True the route will be in-order else reversed
+        :type inorder: bool
+        """
+        return self.__walk(self.__first if inorder else self.__last,
+                           not inorder)
+
+    def __walk(self, node: int, reverse: bool) -> Iterator[int]:
+        """
+        Generator that traverses the node ids of the ArrayTreeSet from the
+        given node, in order or reversed, stepping from every node to its
+        successor through the parent ids.
+
+        :param node: the id of the first node, or 0 to traverse nothing
+        :type node: int
+        :param reverse: if True the route will be reversed
+        :type reverse: bool
+        """
+        parent = self.__parent
+        first, second = (self.__right, self.__left) if reverse \
+            else (self.__left, self.__right)
+
+        while node:
+            yield node
+            if second[node]:
+                node = second[node]
+                while first[node]:
+                    node = first[node]
+            else:
+                father = parent[node]
+                while father and node == second[father]:
+                    node, father = father, parent[father]
+                node = father
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Method to iterate over the ArrayTreeSet instance.
+
+        :return: an iterator over the ArrayTreeSet instance
+        :rtype: Iterator[E]
+        """
+        return map(self.__values.__getitem__, self.__nodes(True))
+
+    def __reversed__(self) -> Iterator[E]:
+        """
+        Method to iterate reversely over the ArrayTreeSet instance.
+
+        :return: an iterator over the ArrayTreeSet instance
+        :rtype: Iterator[E]
+        """
+        return map(self.__values.__getitem__, self.__nodes(False))
+
+    @RedBlackTree._validation
+    def __contains__(self, value: E) -> bool:
+        """
+        Check if the given value is contained in the ArrayTreeSet or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
+        return self.__find(key) != self._NIL
+
+    def get(self, key: Any) -> Union[E, None]:
+        """
+        Returns the element of the current ArrayTreeSet whose sort key is
+        equal to the given key. See :meth:`TreeSet.get`.
+
+        :param key: the sort key to search
+        :type key: Any
+        :return: the element with the given key or None if it was not found
+        :rtype: Union[E, None]
+        :raises NullPointerException: if the given key is None
+        """
+        if key is None:
+            raise NullPointerException("Key cannot be None")
+
+        return self.__values[self.__find(key)]
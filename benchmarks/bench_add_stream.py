@@ -0,0 +1,52 @@
+"""
+Benchmark of the TreeSet streaming insertion, which consumes a generator once
+in chunks, compared with materializing the generator into a list for add_all.
+The peak memory traced during the insertion is also reported.
+
+Run it from the project root with ``python -m benchmarks.bench_add_stream``.
+"""
+import random
+import time
+import tracemalloc
+from tree_set import TreeSet
+
+SIZE = 200_000
+STREAM_SIZE = 500_000
+
+
+def measure(engine: str, insert) -> str:
+    """
+    Returns the time taken to insert into a new TreeSet of the given engine
+    and the peak of the memory traced while inserting into another one, since
+    tracing the memory slows the allocations down.
+    """
+    tree = TreeSet(int, range(0, 20 * SIZE, 20), engine=engine)
+    start = time.perf_counter()
+    insert(tree)
+    milliseconds = (time.perf_counter() - start) * 1e3
+    tree = TreeSet(int, range(0, 20 * SIZE, 20), engine=engine)
+    tracemalloc.start()
+    insert(tree)
+    peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+    tracemalloc.stop()
+    return f"{milliseconds:.0f} ms, peak {peak:.1f} MiB"
+
+
+def stream():
+    """Yields the random values of a reader."""
+    for _ in range(STREAM_SIZE):
+        yield random.randrange(10 * STREAM_SIZE)
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        materialized = measure(engine,
+                               lambda tree: tree.add_all(list(stream())))
+        streamed = measure(engine, lambda tree: tree.add_stream(stream()))
+        print(f"{engine} insertion of {STREAM_SIZE} into {SIZE}: list and "
+              f"add_all {materialized}; add_stream {streamed}")
+
+
+if __name__ == "__main__":
+    run()
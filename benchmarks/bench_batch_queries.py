@@ -0,0 +1,46 @@
+"""
+Benchmark of the batched navigation queries of the TreeSet, which sort the
+queries once and answer them moving a finger between neighboring answers,
+compared with a loop of single calls that descend from the root.
+
+Run it from the project root with ``python -m benchmarks.bench_batch_queries``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 1_000_000
+QUERIES = (1_000, 100_000)
+METHODS = (("contains", "contains_many"), ("floor", "floor_many"),
+           ("ceiling", "ceiling_many"))
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, range(0, 2 * SIZE, 2), engine=engine)
+        for count in QUERIES:
+            values = [random.randrange(2 * SIZE) for _ in range(count)]
+            for single, batch in METHODS:
+                method = getattr(tree, single)
+                looped = elapsed(lambda: [method(value) for value in values])
+                batched = elapsed(lambda: getattr(tree, batch)(values))
+                print(f"{engine:>5} {batch} of {count} in {SIZE}: loop "
+                      f"{looped:.0f} ms, batch {batched:.0f} ms")
+
+
+if __name__ == "__main__":
+    run()
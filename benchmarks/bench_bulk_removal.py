@@ -0,0 +1,48 @@
+"""
+Benchmark of the TreeSet bulk removals, which remove a small batch element by
+element moving a finger and filter a large one out in a linear merge, compared
+with the former loop of remove calls.
+
+Run it from the project root with ``python -m benchmarks.bench_bulk_removal``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 1_000_000
+FRACTIONS = (0.001, 0.01, 0.3, 0.9)
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def loop_remove(tree: TreeSet, values: list) -> None:
+    """Former bulk removal, calling remove for every value."""
+    for value in values:
+        tree.remove(value)
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for fraction in FRACTIONS:
+        batch = random.sample(range(SIZE), int(SIZE * fraction))
+        tree = TreeSet(int, range(SIZE))
+        loop = elapsed(lambda: loop_remove(tree, batch))
+        tree = TreeSet(int, range(SIZE))
+        bulk = elapsed(lambda: tree.remove_all(batch))
+        print(f"removal of {len(batch)} of {SIZE}: loop {loop:.0f} ms, "
+              f"remove_all {bulk:.0f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,45 @@
+"""
+Benchmark of the TreeSet clones, which copy the structure of the tree
+directly or share it until the first write, compared with the former clone
+that inserted every element into a new TreeSet.
+
+Run it from the project root with ``python -m benchmarks.bench_clone``.
+"""
+import time
+from tree_set import TreeSet
+
+SIZE = 1_000_000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        for key in (None, abs):
+            tree = TreeSet(int, range(SIZE), engine=engine, key=key)
+            insertion = elapsed(lambda: TreeSet(int, tree, engine=engine,
+                                                key=key))
+            structural = elapsed(tree.clone)
+            clone = tree.clone(copy_on_write=True)
+            shared = elapsed(lambda: tree.clone(copy_on_write=True))
+            first_write = elapsed(lambda: clone.add(-1))
+            print(f"{engine} clone of {SIZE}{' with key' if key else ''}: "
+                  f"insertion {insertion:.0f} ms, structural "
+                  f"{structural:.0f} ms, copy-on-write {shared:.3f} ms "
+                  f"and first write {first_write:.0f} ms")
+
+
+if __name__ == "__main__":
+    run()
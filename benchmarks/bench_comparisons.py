@@ -0,0 +1,115 @@
+"""
+Benchmark counting the comparisons made by the TreeSet lookups, compared with
+the former descent that checked the equality and then the order at every
+level. It also times the lookups with user defined values, whose comparisons
+are Python methods.
+
+Run it from the project root with ``python -m benchmarks.bench_comparisons``.
+"""
+import random
+import time
+from tests.tests_classes import CountedNumber, Person
+from tree_set import RedBlackTree, TreeSet
+
+SIZE = 10_000
+
+
+def legacy_contains(tree: TreeSet, value) -> bool:
+    """
+    Former descent of the tree, comparing the equality and then the order of
+    the value at every level.
+
+    :param tree: the tree to search
+    :param value: the value to search
+    :return: True if the value is contained else False
+    :rtype: bool
+    """
+    current = tree._RedBlackTree__root
+    while current is not RedBlackTree._NULL:
+        if current.value == value:
+            return True
+        elif value < current.value:
+            current = current.left
+        else:
+            current = current.right
+    return False
+
+
+def legacy_ceiling(tree: TreeSet, value):
+    """
+    Former ceiling descent of the tree.
+
+    :param tree: the tree to search
+    :param value: value to compare
+    :return: the least value greater than or equal to the given one
+    """
+    current = tree._RedBlackTree__root
+    result = None
+    while current is not RedBlackTree._NULL:
+        if current.value == value:
+            return value
+        elif current.value > value:
+            result = current.value
+            current = current.left
+        else:
+            current = current.right
+    return result
+
+
+def count(function, values: list) -> float:
+    """
+    Returns the mean number of comparisons made by the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean number of comparisons per call
+    :rtype: float
+    """
+    CountedNumber.comparisons = 0
+    for value in values:
+        function(value)
+    return CountedNumber.comparisons / len(values)
+
+
+def elapsed(function, values: list) -> float:
+    """
+    Returns the mean time per call of the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean time per call in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    numbers = [CountedNumber(number) for number in range(0, 2 * SIZE, 2)]
+    queries = [CountedNumber(number) for number in range(2 * SIZE)]
+    random.shuffle(queries)
+    tree = TreeSet(CountedNumber, numbers)
+    print(f"comparisons per contains: former "
+          f"{count(lambda value: legacy_contains(tree, value), queries):.1f}"
+          f", current {count(tree.contains, queries):.1f}")
+    print(f"comparisons per ceiling: former "
+          f"{count(lambda value: legacy_ceiling(tree, value), queries):.1f}"
+          f", current {count(tree.ceiling, queries):.1f}")
+
+    people = [Person(f"Person{age}", age) for age in range(0, 2 * SIZE, 2)]
+    queries = [Person(f"Person{age}", age) for age in range(2 * SIZE)]
+    random.shuffle(queries)
+    tree = TreeSet(Person, people)
+    print(f"Person contains: former "
+          f"{elapsed(lambda value: legacy_contains(tree, value), queries):.1f}"
+          f" us, current {elapsed(tree.contains, queries):.1f} us")
+    print(f"Person ceiling: former "
+          f"{elapsed(lambda value: legacy_ceiling(tree, value), queries):.1f}"
+          f" us, current {elapsed(tree.ceiling, queries):.1f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,112 @@
+"""
+Benchmark of the throughput of a ConcurrentTreeSet shared by many threads
+under several ratios of writes, compared with a TreeSet guarded by a single
+mutex.
+
+Run it from the project root with ``python -m benchmarks.bench_concurrent``.
+"""
+import random
+import threading
+import time
+from concurrent_tree_set import ConcurrentTreeSet
+from tree_set import TreeSet
+
+SIZE = 100_000
+THREADS = 4
+OPERATIONS = 20_000
+WRITE_RATIOS = (0.0, 0.1, 0.5)
+
+
+class MutexTreeSet:
+    """TreeSet whose operations are all guarded by a single mutex."""
+
+    def __init__(self, tree: TreeSet) -> None:
+        """
+        Initializes the guarded set.
+
+        :param tree: the TreeSet to guard
+        """
+        self.tree = tree
+        self.lock = threading.Lock()
+
+    def add(self, value: int) -> bool:
+        """Inserts the value holding the mutex."""
+        with self.lock:
+            return self.tree.add(value)
+
+    def remove(self, value: int) -> bool:
+        """Removes the value holding the mutex."""
+        with self.lock:
+            return self.tree.remove(value)
+
+    def contains(self, value: int) -> bool:
+        """Searches the value holding the mutex."""
+        with self.lock:
+            return self.tree.contains(value)
+
+    def floor(self, value: int) -> int:
+        """Finds the floor of the value holding the mutex."""
+        with self.lock:
+            return self.tree.floor(value)
+
+
+def work(shared, ratio: float) -> None:
+    """
+    Runs random operations on the shared set, a write with the given
+    probability and a query otherwise.
+
+    :param shared: the shared set
+    :param ratio: the probability of a write
+    """
+    rng = random.Random()
+    for _ in range(OPERATIONS):
+        value = rng.randrange(2 * SIZE)
+        if rng.random() < ratio:
+            if rng.random() < 0.5:
+                shared.add(value)
+            else:
+                shared.remove(value)
+        elif rng.random() < 0.5:
+            shared.contains(value)
+        else:
+            shared.floor(value)
+
+
+def throughput(shared, ratio: float) -> float:
+    """
+    Returns the operations per second made by all the threads together.
+
+    :param shared: the shared set
+    :param ratio: the probability of a write
+    :return: the operations per second
+    :rtype: float
+    """
+    threads = [threading.Thread(target=work, args=(shared, ratio))
+               for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return THREADS * OPERATIONS / (time.perf_counter() - start)
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        for ratio in WRITE_RATIOS:
+            values = range(0, 2 * SIZE, 2)
+            unlocked = throughput(TreeSet(int, values, engine=engine), 0.0) \
+                if ratio == 0.0 else None
+            mutex = throughput(
+                MutexTreeSet(TreeSet(int, values, engine=engine)), ratio)
+            shared = throughput(
+                ConcurrentTreeSet(int, values, engine=engine), ratio)
+            print(f"{engine} with {ratio:.0%} writes and {THREADS} threads: "
+                  f"mutex {mutex:,.0f} ops/s, read/write lock "
+                  f"{shared:,.0f} ops/s"
+                  + (f", unlocked {unlocked:,.0f} ops/s" if unlocked else ""))
+
+
+if __name__ == "__main__":
+    run()
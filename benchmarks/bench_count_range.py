@@ -0,0 +1,51 @@
+"""
+Scaling benchmark of the TreeSet range counting, which makes two rank
+descents, compared with counting the values of a full iteration of the
+TreeSet. The brute-force count is only timed up to BRUTE_FORCE_LIMIT values.
+
+Run it from the project root with ``python -m benchmarks.bench_count_range``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+BRUTE_FORCE_LIMIT = 100_000
+QUERIES = 1_000
+
+
+def elapsed(function, values: list) -> float:
+    """
+    Returns the mean time per call of the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean time per call in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for size in SIZES:
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(size), engine=engine)
+            bounds = [sorted(random.sample(range(size), 2))
+                      for _ in range(QUERIES)]
+            counted = elapsed(lambda bound: tree.count_range(*bound), bounds)
+            line = f"{engine:>5} {size:>9}: count_range {counted:5.2f} us"
+            if size <= BRUTE_FORCE_LIMIT:
+                brute = elapsed(
+                    lambda bound: sum(1 for value in tree
+                                      if bound[0] <= value < bound[1]),
+                    bounds[:10])
+                line += f", brute force {brute:10.1f} us"
+            print(line)
+
+
+if __name__ == "__main__":
+    run()
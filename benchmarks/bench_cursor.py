@@ -0,0 +1,76 @@
+"""
+Benchmark of the TreeSet cursor, which seeks and inserts near its previous
+position comparing *O(log d)* keys, compared with the ceiling and add calls
+that descend from the root every time. The keys are counted comparisons, so
+the cost of comparing the elements is also reported.
+
+Run it from the project root with ``python -m benchmarks.bench_cursor``.
+"""
+import time
+from tree_set import TreeSet
+from tests.tests_classes import CountedNumber
+
+SIZE = 200_000
+OPERATIONS = 20_000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def measure(function) -> str:
+    """Returns the time and the comparisons made by the function."""
+    CountedNumber.comparisons = 0
+    milliseconds = elapsed(function)
+    return f"{milliseconds:.0f} ms, {CountedNumber.comparisons} comparisons"
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(CountedNumber, [CountedNumber(number) for number
+                                       in range(0, 2 * SIZE, 2)],
+                       engine=engine)
+        sought = [CountedNumber(number) for number
+                  in range(SIZE, SIZE + 2 * OPERATIONS, 2)]
+        inserted = [CountedNumber(number) for number
+                     in range(SIZE + 1, SIZE + 2 * OPERATIONS, 2)]
+        cursor = tree.cursor(sought[0])
+
+        def ceilings():
+            for value in sought:
+                tree.ceiling(value)
+
+        def seeks():
+            for value in sought:
+                cursor.seek(value)
+
+        print(f"{engine} sweep of {OPERATIONS} in {SIZE}: ceiling "
+              f"{measure(ceilings)}; cursor {measure(seeks)}")
+
+        copy = TreeSet(CountedNumber, tree, engine=engine)
+        cursor = tree.cursor(inserted[0])
+
+        def adds():
+            for value in inserted:
+                copy.add(value)
+
+        def inserts():
+            for value in inserted:
+                cursor.insert_near(value)
+
+        print(f"{engine} insertion of {OPERATIONS} in {SIZE}: add "
+              f"{measure(adds)}; cursor {measure(inserts)}")
+
+
+if __name__ == "__main__":
+    run()
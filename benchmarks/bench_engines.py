@@ -0,0 +1,69 @@
+"""
+Benchmark comparing the "node" and "array" storage engines of the TreeSet:
+memory used by the tree, garbage collection time and cost of the basic
+operations.
+
+Run it from the project root with ``python -m benchmarks.bench_engines``.
+"""
+import gc
+import random
+import time
+import tracemalloc
+from tree_set import TreeSet
+
+SIZE = 200_000
+
+
+def memory(engine: str, values: list) -> float:
+    """
+    Measures the memory allocated by a TreeSet built with the given values.
+
+    :param engine: the storage engine
+    :param values: values to insert
+    :return: the allocated memory in megabytes
+    :rtype: float
+    """
+    tracemalloc.start()
+    tree = TreeSet(int, values, engine=engine)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tree
+    return allocated / 2 ** 20
+
+
+def elapsed(function) -> float:
+    """
+    Returns the seconds spent running the given function.
+
+    :param function: function without arguments to time
+    :return: the elapsed time in seconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    values = list(range(SIZE))
+    shuffled = values[:]
+    random.shuffle(shuffled)
+
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, engine=engine)
+        add = elapsed(lambda: [tree.add(value) for value in shuffled])
+        contains = elapsed(lambda: [value in tree for value in shuffled])
+        iterate = elapsed(lambda: list(tree))
+        collect = elapsed(gc.collect)
+        remove = elapsed(lambda: [tree.remove(value) for value in shuffled])
+        print(f"{engine}: memory {memory(engine, values):.1f} MB, "
+              f"add {add / SIZE * 1e6:.2f} us, "
+              f"contains {contains / SIZE * 1e6:.2f} us, "
+              f"iterate {iterate * 1e3:.0f} ms, "
+              f"gc.collect {collect * 1e3:.0f} ms, "
+              f"remove {remove / SIZE * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,64 @@
+"""
+Benchmark of the TreeSet iteration, which steps from every node to its
+successor through the parent pointers, compared with the former generator
+that kept the left spine of the current node in a SimpleStack.
+
+Run it from the project root with ``python -m benchmarks.bench_iteration``.
+"""
+import time
+from data_utils import SimpleStack
+from tree_set import RedBlackTree, TreeSet
+
+SIZE = 1_000_000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def stack_inorder(tree: TreeSet, inorder: bool):
+    """Former generator, pushing the left spine into a SimpleStack."""
+    null = RedBlackTree._NULL
+    stack = SimpleStack()
+    current = tree._RedBlackTree__root
+
+    while True:
+        if current is not null:
+            stack.push(current)
+            current = current.left if inorder else current.right
+        elif not stack.is_empty():
+            current = stack.pull()
+            yield current.value
+            current = current.right if inorder else current.left
+        else:
+            break
+
+
+def consume(iterator) -> None:
+    """Consumes the given iterator."""
+    for _ in iterator:
+        pass
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    tree = TreeSet(int, range(SIZE))
+    for name, inorder in (("ascending", True), ("descending", False)):
+        stack = elapsed(lambda: consume(stack_inorder(tree, inorder)))
+        stackless = elapsed(lambda: consume(iter(tree) if inorder
+                                            else reversed(tree)))
+        print(f"{name} iteration of {SIZE}: stack {stack:.0f} ms, "
+              f"parent pointers {stackless:.0f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,62 @@
+"""
+Benchmark of the in-place set operations of the TreeSet with a small set,
+which insert or remove its elements one by one moving a finger, compared with
+the linear merge that rebuilds the whole tree, and of the O(log n) split
+compared with the copying split of the array engine.
+
+Run it from the project root with ``python -m benchmarks.bench_join``.
+"""
+import random
+import time
+from tree_set import RedBlackTree, TreeSet
+
+SIZE = 1_000_000
+SMALL_SIZE = 10
+OPERATIONS = (
+    ("update", True, True, True),
+    ("intersection_update", False, True, False),
+    ("difference_update", True, False, False),
+    ("symmetric_difference_update", True, False, True),
+)
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def linear(tree: TreeSet, other: TreeSet, left: bool, both: bool,
+           right: bool) -> None:
+    """Merges both sets linearly and rebuilds the tree."""
+    tree._load_sorted(*RedBlackTree._RedBlackTree__merge(
+        *tree._sorted_items(), *other._sorted_items(), left, both, right))
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    values = range(0, 2 * SIZE, 2)
+    small = TreeSet(int, random.sample(range(2 * SIZE), SMALL_SIZE))
+    for method, left, both, right in OPERATIONS:
+        tree = TreeSet(int, values)
+        fingered = elapsed(lambda: getattr(tree, method)(small))
+        tree = TreeSet(int, values)
+        merged = elapsed(lambda: linear(tree, small, left, both, right))
+        print(f"{method} of {SMALL_SIZE} into {SIZE}: finger "
+              f"{fingered:.2f} ms, linear merge {merged:.0f} ms")
+
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, values, engine=engine)
+        print(f"{engine:>5} split of {SIZE}: "
+              f"{elapsed(lambda: tree.split(SIZE)):.2f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,48 @@
+"""
+Benchmark comparing a TreeSet of user defined values ordered by their rich
+comparison methods with one ordered by a key function, whose descents compare
+the integer keys cached in the nodes.
+
+Run it from the project root with ``python -m benchmarks.bench_key``.
+"""
+import random
+import time
+from tests.tests_classes import Person
+from tree_set import TreeSet
+
+SIZE = 20_000
+
+
+def elapsed(function, values: list) -> float:
+    """
+    Returns the mean time per call of the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean time per call in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    people = [Person(f"Person{age}", age) for age in range(SIZE)]
+    random.shuffle(people)
+    queries = people[:]
+    random.shuffle(queries)
+
+    for name, key in (("natural", None), ("key", lambda person: person.age)):
+        tree = TreeSet(Person, key=key)
+        add = elapsed(tree.add, people)
+        contains = elapsed(tree.contains, queries)
+        ceiling = elapsed(tree.ceiling, queries)
+        print(f"{name:>8}: add {add:.2f} us, contains {contains:.2f} us, "
+              f"ceiling {ceiling:.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""
+Benchmark comparing the RedBlackNode used by the RedBlackTree with the former
+property based TreeNode: memory per node and cost of the basic node
+operations.
+
+Run it from the project root with ``python -m benchmarks.bench_nodes``.
+"""
+import timeit
+import tracemalloc
+from data_utils import RedBlackNode, TreeNode
+
+NODES = 100_000
+REPEAT = 5
+
+
+def memory_per_node(factory) -> float:
+    """
+    Measures the memory allocated by a node created by the given factory.
+
+    :param factory: function without arguments that creates a node
+    :return: the number of bytes allocated per node
+    :rtype: float
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    nodes = [factory() for _ in range(NODES)]
+    end = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return (end - start) / NODES
+
+
+def best_time(statement: str, setup: str, number: int = NODES) -> float:
+    """
+    Returns the best time per execution of the given statement.
+
+    :param statement: statement to time
+    :param setup: setup statement
+    :param number: number of executions per repetition
+    :return: the best time per execution in nanoseconds
+    :rtype: float
+    """
+    times = timeit.repeat(statement, setup, repeat=REPEAT, number=number,
+                          globals=globals())
+    return min(times) / number * 1e9
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    utils = TreeNode.TreeNodeUtils
+    old_memory = memory_per_node(
+        lambda: TreeNode(1, None, None, utils.RED))
+    new_memory = memory_per_node(
+        lambda: RedBlackNode(1, None, None, RedBlackNode.RED))
+    print(f"memory per node: TreeNode {old_memory:.0f} B, "
+          f"RedBlackNode {new_memory:.0f} B "
+          f"({old_memory / new_memory:.2f}x)")
+
+    operations = {
+        "create": (
+            "TreeNode(1, None, None, utils.RED)",
+            "RedBlackNode(1, None, None, RedBlackNode.RED)"),
+        "recolor": (
+            "old.color = utils.BLACK",
+            "new.color = RedBlackNode.BLACK"),
+        "read child": ("old.left", "new.left"),
+        "read value": ("old.value", "new.value"),
+    }
+    setup = ("utils = TreeNode.TreeNodeUtils\n"
+             "old = TreeNode(1, None, None, utils.RED)\n"
+             "new = RedBlackNode(1, None, None, RedBlackNode.RED)")
+    for name, (old_statement, new_statement) in operations.items():
+        old_time = best_time(old_statement, setup)
+        new_time = best_time(new_statement, setup)
+        print(f"{name}: TreeNode {old_time:.1f} ns, "
+              f"RedBlackNode {new_time:.1f} ns "
+              f"({old_time / new_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    run()
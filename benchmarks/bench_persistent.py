@@ -0,0 +1,92 @@
+"""
+Benchmark of the versions of a PersistentTreeSet, which share every untouched
+subtree with the previous version, compared with keeping a clone of a TreeSet
+per version.
+
+Run it from the project root with ``python -m benchmarks.bench_persistent``.
+"""
+import random
+import time
+import tracemalloc
+from persistent_tree_set import PersistentTreeSet
+from tree_set import TreeSet
+
+SIZE = 100_000
+VERSIONS = 1000
+CLONES = 20
+
+
+def measure(function) -> tuple:
+    """
+    Returns the time taken by the function and the memory kept by its result.
+
+    :param function: function without arguments
+    :return: the time in milliseconds and the kept memory in KiB
+    :rtype: tuple
+    """
+    start = time.perf_counter()
+    function()
+    took = (time.perf_counter() - start) * 1e3
+    tracemalloc.start()
+    result = function()
+    kept = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    del result
+    return took, kept
+
+
+def persistent_versions(base: PersistentTreeSet, values: list) -> list:
+    """
+    Creates a version per value, alternating insertions and removals.
+
+    :param base: the first version
+    :param values: the values changed by every version
+    :return: the versions
+    :rtype: list
+    """
+    versions = [base]
+    for index, value in enumerate(values):
+        version = versions[-1]
+        versions.append(version.add(value) if index % 2
+                        else version.remove(value))
+    return versions
+
+
+def cloned_versions(base: TreeSet, values: list) -> list:
+    """
+    Creates a version per value by cloning the previous version and
+    modifying the clone.
+
+    :param base: the first version
+    :param values: the values changed by every version
+    :return: the versions
+    :rtype: list
+    """
+    versions = [base]
+    for index, value in enumerate(values):
+        version = versions[-1].clone()
+        if index % 2:
+            version.add(value)
+        else:
+            version.remove(value)
+        versions.append(version)
+    return versions
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    values = [random.randrange(SIZE) for _ in range(VERSIONS)]
+    base = PersistentTreeSet(int, range(0, 2 * SIZE, 2))
+    took, kept = measure(lambda: persistent_versions(base, values))
+    print(f"persistent versions of {SIZE}: {took / VERSIONS:.3f} ms and "
+          f"{kept / VERSIONS:.1f} KiB per version")
+
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, range(0, 2 * SIZE, 2), engine=engine)
+        took, kept = measure(lambda: cloned_versions(tree, values[:CLONES]))
+        print(f"{engine} clones of {SIZE}: {took / CLONES:.3f} ms and "
+              f"{kept / CLONES:.1f} KiB per version")
+
+
+if __name__ == "__main__":
+    run()
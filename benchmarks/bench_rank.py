@@ -0,0 +1,44 @@
+"""
+Benchmark comparing the TreeSet indexing, which uses the subtree sizes stored
+in the nodes, with building the list of the TreeSet values and indexing it.
+
+Run it from the project root with ``python -m benchmarks.bench_rank``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZES = (1_000, 10_000, 100_000)
+QUERIES = 200
+
+
+def elapsed(function, values: list) -> float:
+    """
+    Returns the mean time per call of the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean time per call in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for size in SIZES:
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(size), engine=engine)
+            indexes = [random.randrange(size) for _ in range(QUERIES)]
+            listed = elapsed(lambda index: list(tree)[index], indexes)
+            indexed = elapsed(tree.__getitem__, indexes)
+            rank = elapsed(tree.rank, indexes)
+            print(f"{engine:>5} {size:>7}: list(tree)[k] {listed:10.1f} us, "
+                  f"tree[k] {indexed:5.2f} us, rank {rank:5.2f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,46 @@
+"""
+Benchmark of the TreeSet range removals, which split the tree by the bounds
+and join the outer trees back, compared with the former loop of poll_first
+calls that removes and rebalances every element.
+
+Run it from the project root with ``python -m benchmarks.bench_remove_range``.
+"""
+import time
+from tree_set import TreeSet
+
+SIZE = 1_000_000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def poll_head(tree: TreeSet, high: int) -> None:
+    """Former truncation, polling the first element while it is lower."""
+    while not tree.is_empty() and tree.first() < high:
+        tree.poll_first()
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        for removed in (1_000, SIZE // 2):
+            tree = TreeSet(int, range(SIZE), engine=engine)
+            loop = elapsed(lambda: poll_head(tree, removed))
+            tree = TreeSet(int, range(SIZE), engine=engine)
+            truncation = elapsed(lambda: tree.remove_head(removed))
+            print(f"{engine} removal of {removed} of {SIZE}: poll_first "
+                  f"{loop:.1f} ms, remove_head {truncation:.1f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,51 @@
+"""
+Benchmark of the TreeSet comparisons, which walk the sorted keys of both sets
+in lockstep or seek the smaller set in the larger one, compared with searching
+every element of one set in the other one.
+
+Run it from the project root with
+``python -m benchmarks.bench_set_comparisons``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 1_000_000
+SMALL = 1000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, range(SIZE), engine=engine)
+        other = TreeSet(int, range(SIZE), engine=engine)
+        small = TreeSet(int, random.sample(range(SIZE), SMALL), engine=engine)
+        searched = elapsed(lambda: all(value in other for value in tree))
+        lockstep = elapsed(lambda: tree == other)
+        subset = elapsed(lambda: tree <= other)
+        print(f"{engine} equality of {SIZE}: membership {searched:.0f} ms, "
+              f"lockstep {lockstep:.0f} ms, subset {subset:.0f} ms")
+
+        searched = elapsed(lambda: all(value in tree for value in small))
+        sought = elapsed(lambda: small <= tree)
+        disjoint = elapsed(lambda: tree.isdisjoint(small))
+        print(f"{engine} subset of {SMALL} in {SIZE}: membership "
+              f"{searched:.1f} ms, finger {sought:.1f} ms, disjoint "
+              f"{disjoint:.1f} ms")
+
+
+if __name__ == "__main__":
+    run()
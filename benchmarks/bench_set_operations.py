@@ -0,0 +1,62 @@
+"""
+Benchmark comparing the TreeSet set operations, which merge both sets in one
+linear pass and build the result bottom-up, with the former loops of contains
+and add calls.
+
+Run it from the project root with
+``python -m benchmarks.bench_set_operations``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 100_000
+
+
+def elapsed(function) -> float:
+    """
+    Returns the time taken by the function.
+
+    :param function: function without arguments
+    :return: the time taken in milliseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) * 1e3
+
+
+def loop_union(tree: TreeSet, other: TreeSet) -> TreeSet:
+    """Former union, cloning the tree and adding the other values."""
+    result = tree.clone()
+    for value in other:
+        result.add(value)
+    return result
+
+
+def loop_intersection(tree: TreeSet, other: TreeSet) -> TreeSet:
+    """Former intersection, adding the values contained in the other."""
+    result = TreeSet(tree.object_type)
+    for value in tree:
+        if other.contains(value):
+            result.add(value)
+    return result
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    tree = TreeSet(int, random.sample(range(3 * SIZE), SIZE))
+    other = TreeSet(int, random.sample(range(3 * SIZE), SIZE))
+    print(f"union of {SIZE} and {SIZE}: loop "
+          f"{elapsed(lambda: loop_union(tree, other)):.0f} ms, merge "
+          f"{elapsed(lambda: tree | other):.0f} ms")
+    print(f"intersection of {SIZE} and {SIZE}: loop "
+          f"{elapsed(lambda: loop_intersection(tree, other)):.0f} ms, merge "
+          f"{elapsed(lambda: tree & other):.0f} ms")
+    print(f"difference of {SIZE} and {SIZE}: merge "
+          f"{elapsed(lambda: tree - other):.0f} ms, symmetric difference "
+          f"{elapsed(lambda: tree ^ other):.0f} ms")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,102 @@
+"""
+Benchmark of a writer that updates a shared set while other threads scan all
+of its elements, comparing the snapshot iterators of a SnapshotTreeSet with
+the scans of a ConcurrentTreeSet, which hold its read lock or copy the
+elements under it. Every scan pauses briefly each BATCH elements, like a
+report writing its rows, which releases the interpreter lock. It reports the
+updates per second of the writer, its longest wait for a single update and
+the scans made meanwhile.
+
+Run it from the project root with ``python -m benchmarks.bench_snapshot``.
+"""
+import random
+import threading
+import time
+from typing import Iterable, Tuple
+from concurrent_tree_set import ConcurrentTreeSet
+from snapshot_tree_set import SnapshotTreeSet
+
+SIZE = 100_000
+SCANNERS = 2
+WRITES = 20_000
+BATCH = 1_000
+PAUSE = 0.0005
+
+
+def consume(values: Iterable[int]) -> None:
+    """Walks the given values, pausing after each batch of them."""
+    for index, _ in enumerate(values, 1):
+        if not index % BATCH:
+            time.sleep(PAUSE)
+
+
+def locked_scan(shared: ConcurrentTreeSet) -> None:
+    """Walks the elements while holding the read lock."""
+    with shared.reading() as tree:
+        consume(tree)
+
+
+def copied_scan(shared: ConcurrentTreeSet) -> None:
+    """Walks the elements copied under the read lock."""
+    consume(shared)
+
+
+def snapshot_scan(shared: SnapshotTreeSet) -> None:
+    """Walks the elements of the snapshot taken by the iterator."""
+    consume(shared)
+
+
+def measure(shared, scan) -> Tuple[float, float, int]:
+    """
+    Runs a writer on the shared set while the scanners scan it.
+
+    :param shared: the shared set
+    :param scan: the function that scans the set once
+    :return: the updates per second, the longest update in milliseconds and
+        the number of scans
+    """
+    done = threading.Event()
+    scans = [0] * SCANNERS
+
+    def scanner(index):
+        while not done.is_set():
+            scan(shared)
+            scans[index] += 1
+
+    threads = [threading.Thread(target=scanner, args=(index,))
+               for index in range(SCANNERS)]
+    for thread in threads:
+        thread.start()
+
+    rng = random.Random(0)
+    longest = 0.0
+    start = time.perf_counter()
+    for _ in range(WRITES):
+        value = rng.randrange(2 * SIZE)
+        begin = time.perf_counter()
+        if not shared.remove(value):
+            shared.add(value)
+        longest = max(longest, time.perf_counter() - begin)
+    elapsed = time.perf_counter() - start
+
+    done.set()
+    for thread in threads:
+        thread.join()
+    return WRITES / elapsed, longest * 1000, sum(scans)
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    values = range(0, 2 * SIZE, 2)
+    cases = [("read-locked scans", ConcurrentTreeSet, locked_scan),
+             ("copied scans", ConcurrentTreeSet, copied_scan),
+             ("snapshot scans", SnapshotTreeSet, snapshot_scan)]
+    for name, cls, scan in cases:
+        writes, longest, scans = measure(cls(int, values), scan)
+        print(f"{name} with {SCANNERS} scanners of {SIZE:,} elements: "
+              f"writer {writes:,.0f} updates/s, longest update "
+              f"{longest:.1f} ms, {scans} scans")
+
+
+if __name__ == "__main__":
+    run()
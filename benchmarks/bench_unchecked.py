@@ -0,0 +1,64 @@
+"""
+Benchmark comparing the validated TreeSet with the unchecked one created with
+``validate=False`` for int and str sets. Every operation is called once per
+contained value (so ``add`` finds the value and inserts nothing) and the best
+of several rounds is reported.
+
+Run it from the project root with ``python -m benchmarks.bench_unchecked``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 10_000
+REPEAT = 7
+
+
+def per_call(function, values: list) -> float:
+    """
+    Returns the best mean time per call of the given function over the
+    values.
+
+    :param function: function with one argument to time
+    :param values: the arguments to call the function with
+    :return: the time per call in nanoseconds
+    :rtype: float
+    """
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for value in values:
+            function(value)
+        times.append(time.perf_counter() - start)
+    return min(times) / len(values) * 1e9
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    cases = {"int": (int, lambda index: index * 7),
+             "str": (str, lambda index: f"key{index * 7:08d}")}
+    operations = ("add", "contains", "higher", "floor")
+
+    for name, (value_type, factory) in cases.items():
+        values = [factory(index) for index in range(SIZE)]
+        random.shuffle(values)
+        for engine in TreeSet._ENGINES:
+            results = {}
+            for validate in (True, False):
+                tree = TreeSet(value_type, engine=engine, validate=validate)
+                tree.bulk_load(values)
+                results[validate] = [
+                    per_call(getattr(tree, operation), values)
+                    for operation in operations
+                ]
+
+            print(f"{name} ({engine} engine):")
+            for operation, checked, unchecked in zip(
+                    operations, results[True], results[False]):
+                print(f"    {operation}: validated {checked:.0f} ns, "
+                      f"unchecked {unchecked:.0f} ns "
+                      f"({checked / unchecked:.2f}x)")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,116 @@
+"""
+Microbenchmark of the per-call validation overhead of the TreeSet methods.
+It compares the time of a ``contains`` call with the raw descent of the tree,
+both for the current cached validation and for the former stack of three
+decorators (None check, type check and comparability probe on every call).
+
+Run it from the project root with ``python -m benchmarks.bench_validation``.
+"""
+import random
+import timeit
+from functools import wraps
+from tests.tests_classes import Person
+from tree_set import RedBlackTree, TreeSet
+from tree_set_exceptions import ClassCastException, NullPointerException
+
+SIZE = 10_000
+CALLS = 200_000
+REPEAT = 5
+
+
+def legacy_validation(function):
+    """
+    Decorator reproducing the former per-call validation: a None check, a
+    type check and a comparability probe evaluating ``item < item`` and
+    ``item > item``, each in its own wrapper.
+
+    :param function: function to decorate
+    :return: the decorated function
+    """
+
+    @wraps(function)
+    def check_comparable(self, item):
+        value_type = type(item)
+        if value_type.__eq__ is object.__eq__ \
+                or (value_type.__lt__ is object.__lt__
+                    and value_type.__gt__ is object.__gt__):
+            raise ClassCastException()
+        try:
+            if (item < item) is None or (item > item) is None:
+                raise ClassCastException()
+        except TypeError:
+            raise ClassCastException()
+        return function(self, item)
+
+    @wraps(function)
+    def check_type(self, item):
+        if not isinstance(item, self.object_type):
+            raise TypeError()
+        return check_comparable(self, item)
+
+    @wraps(function)
+    def check_null(self, item):
+        if item is None:
+            raise NullPointerException()
+        return check_type(self, item)
+
+    return check_null
+
+
+def raw_contains(tree, value) -> bool:
+    """
+    Checks if the value is contained using the raw descent of the tree.
+
+    :param tree: the tree to search
+    :param value: the value to search
+    :return: True if the value is contained else False
+    :rtype: bool
+    """
+    return tree._RedBlackTree__contains(value).value == value
+
+
+legacy_contains = legacy_validation(raw_contains)
+cached_contains = RedBlackTree._validation(raw_contains)
+
+
+def per_call(statement: str, namespace: dict) -> float:
+    """
+    Returns the best time per call of the given statement.
+
+    :param statement: statement to time
+    :param namespace: namespace used to run the statement
+    :return: the time per call in nanoseconds
+    :rtype: float
+    """
+    times = timeit.repeat(statement, repeat=REPEAT, number=CALLS,
+                          globals=namespace)
+    return min(times) / CALLS * 1e9
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    cases = {
+        "int": (int, lambda index: index),
+        "Person": (Person, lambda index: Person(f"Person{index}", index)),
+    }
+    for name, (value_type, factory) in cases.items():
+        values = [factory(index) for index in range(SIZE)]
+        tree = TreeSet(value_type, values)
+        namespace = {
+            "tree": tree, "value": random.choice(values),
+            "raw_contains": raw_contains, "legacy_contains": legacy_contains,
+            "cached_contains": cached_contains
+        }
+        raw = per_call("raw_contains(tree, value)", namespace)
+        legacy = per_call("legacy_contains(tree, value)", namespace)
+        cached = per_call("cached_contains(tree, value)", namespace)
+        method = per_call("tree.contains(value)", namespace)
+        print(f"{name}: raw descent {raw:.0f} ns, "
+              f"three decorators {legacy:.0f} ns "
+              f"(+{legacy - raw:.0f} ns), "
+              f"cached validation {cached:.0f} ns (+{cached - raw:.0f} ns), "
+              f"tree.contains {method:.0f} ns")
+
+
+if __name__ == "__main__":
+    run()
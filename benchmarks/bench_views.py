@@ -0,0 +1,47 @@
+"""
+Benchmark comparing the TreeSet range views with the former emulation of a
+range by filtering a full iteration of the TreeSet.
+
+Run it from the project root with ``python -m benchmarks.bench_views``.
+"""
+import random
+import time
+from tree_set import TreeSet
+
+SIZE = 100_000
+WIDTH = 100
+QUERIES = 50
+
+
+def elapsed(function, values: list) -> float:
+    """
+    Returns the mean time per call of the function.
+
+    :param function: function with one argument
+    :param values: the arguments to call the function with
+    :return: the mean time per call in microseconds
+    :rtype: float
+    """
+    start = time.perf_counter()
+    for value in values:
+        function(value)
+    return (time.perf_counter() - start) / len(values) * 1e6
+
+
+def run() -> None:
+    """Runs the benchmark and prints the results."""
+    for engine in TreeSet._ENGINES:
+        tree = TreeSet(int, range(SIZE), engine=engine)
+        lows = [random.randrange(SIZE - WIDTH) for _ in range(QUERIES)]
+        filtered = elapsed(lambda low: [value for value in tree
+                                        if low <= value < low + WIDTH], lows)
+        viewed = elapsed(lambda low: list(tree.sub_set(low, low + WIDTH)),
+                         lows)
+        counted = elapsed(lambda low: len(tree.sub_set(low, low + WIDTH)),
+                          lows)
+        print(f"{engine:>5}: {WIDTH} values of {SIZE}, filter {filtered:.0f} "
+              f"us, view {viewed:.1f} us, view len {counted:.1f} us")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,394 @@
+"""
+concurrent_tree_set module.
+
+This module provides the ConcurrentTreeSet class, a TreeSet that can be shared
+by many threads, and the ReadWriteLock class that guards it. The queries of
+the set hold the lock for reading, so many of them run at the same time,
+while the updates hold it for writing and run alone:
+
+    shared = ConcurrentTreeSet(int, range(100))
+    shared.add(100)
+    shared.floor(50)
+    with shared.reading() as tree:
+        view = list(tree.sub_set(10, 20))
+"""
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import *
+from tree_set import TreeSet
+
+E = TypeVar('E')
+
+
+class ReadWriteLock:
+    """
+    Class that represents a lock that is held by many readers or by a single
+    writer. A writer waits until the current readers release the lock, and
+    the readers that arrive while a writer is waiting wait behind it, so the
+    writers are not starved by a steady flow of readers. The lock is not
+    reentrant.
+    """
+
+    __slots__ = ("__mutex", "__condition", "__readers", "__writer",
+                 "__waiting")
+
+    def __init__(self) -> None:
+        """
+        Constructor of the class.
+        Initializes a new released ReadWriteLock.
+        """
+        self.__mutex = threading.Lock()
+        self.__condition = threading.Condition(self.__mutex)
+        self.__readers = 0
+        self.__writer = False
+        self.__waiting = 0
+
+    def acquire_read(self) -> None:
+        """
+        Acquires the lock for reading, waiting while a writer holds it or
+        waits for it.
+        """
+        with self.__mutex:
+            while self.__writer or self.__waiting:
+                self.__condition.wait()
+            self.__readers += 1
+
+    def release_read(self) -> None:
+        """
+        Releases the lock held for reading, waking the waiting writers when
+        the last reader leaves.
+        """
+        with self.__mutex:
+            self.__readers -= 1
+            if not self.__readers and self.__waiting:
+                self.__condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """
+        Acquires the lock for writing, waiting while any reader or writer
+        holds it.
+        """
+        with self.__mutex:
+            self.__waiting += 1
+            while self.__writer or self.__readers:
+                self.__condition.wait()
+            self.__waiting -= 1
+            self.__writer = True
+
+    def release_write(self) -> None:
+        """
+        Releases the lock held for writing, waking every waiting thread.
+        """
+        with self.__mutex:
+            self.__writer = False
+            self.__condition.notify_all()
+
+
+class ConcurrentTreeSet:
+    """
+    Class that represents a thread-safe set that wraps a :class:`TreeSet` of
+    any engine. Every query holds the read lock of the set and every update
+    holds its write lock, so the readers run together and never see a tree
+    being rebalanced, while every writer has the tree for itself.
+
+    The iterators walk a copy of the elements taken under the read lock, so
+    the set can be modified while they are being consumed. The views, the
+    cursors and the other operations that keep using the tree after they
+    return can be used inside :meth:`reading` or :meth:`writing`, which hold
+    the lock and give access to the wrapped TreeSet.
+
+    The set operations and comparisons are also available as operators, and
+    the in-place operators return the ConcurrentTreeSet itself.
+
+    Since the lock is not reentrant, the wrapped TreeSet must not be used to
+    call the methods of the ConcurrentTreeSet while the lock is held. A
+    ConcurrentTreeSet given to a method or an operator of another one, by
+    position or by keyword, is copied first, so both locks are never held
+    together.
+
+    With the global interpreter lock, the readers take turns instead of
+    running in parallel, but they still never wait for each other.
+    """
+
+    __slots__ = ("__tree", "__lock")
+
+    def __init__(self, generic_type: Type, sequence: Collection[E] = None,
+                 engine: str = "node", validate: bool = True,
+                 key: Callable[[E], Any] = None) -> None:
+        """
+        Constructor of the class.
+        Initializes a new ConcurrentTreeSet wrapping a new TreeSet created
+        with the given arguments. See :class:`TreeSet`.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param sequence: a collection to take items from
+        :type sequence: Collection[E]
+        :param engine: the storage engine, "node" (default) or "array"
+        :type engine: str
+        :param validate: if False, the values are not validated
+        :type validate: bool
+        :param key: function that returns the sort key of an element
+        :type key: Callable[[E], Any]
+        :raises TypeError: if the given values does not match the instance type
+        :raises ValueError: if the given engine does not exist
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__tree = TreeSet(generic_type, sequence, engine, validate, key)
+        self.__lock = ReadWriteLock()
+
+    def _locked(name: str, write: bool, sets: bool = False):
+        """
+        Creates a method that calls the method of the wrapped TreeSet with the
+        given name while holding the read lock, or the write lock if write is
+        True. If the TreeSet method returns the TreeSet itself, like the
+        in-place operators, the method returns the ConcurrentTreeSet instead.
+        The documentation of the method is the one of the TreeSet.
+
+        :param name: the name of the TreeSet method
+        :type name: str
+        :param write: if True, the method modifies the TreeSet
+        :type write: bool
+        :param sets: if True, the method receives other sets, and the
+            ConcurrentTreeSets among them are copied before holding the lock
+        :type sets: bool
+        :return: the locked method
+        :rtype: Callable
+        """
+        acquire, release = \
+            (ReadWriteLock.acquire_write, ReadWriteLock.release_write) \
+            if write else (ReadWriteLock.acquire_read,
+                           ReadWriteLock.release_read)
+
+        @wraps(getattr(TreeSet, name))
+        def method(self, *args, **kwargs):
+            if sets:
+                args = [arg.clone() if isinstance(arg, ConcurrentTreeSet)
+                        else arg for arg in args]
+                kwargs = {key: arg.clone()
+                          if isinstance(arg, ConcurrentTreeSet) else arg
+                          for key, arg in kwargs.items()}
+            lock = self.__lock
+            acquire(lock)
+            try:
+                result = getattr(self.__tree, name)(*args, **kwargs)
+            finally:
+                release(lock)
+            return self if result is self.__tree else result
+
+        return method
+
+    add = _locked("add", True)
+    remove = _locked("remove", True)
+    poll_first = _locked("poll_first", True)
+    poll_last = _locked("poll_last", True)
+    clear = _locked("clear", True)
+    remove_range = _locked("remove_range", True)
+    remove_head = _locked("remove_head", True)
+    remove_tail = _locked("remove_tail", True)
+    add_all = _locked("add_all", True, True)
+    add_stream = _locked("add_stream", True, True)
+    bulk_load = _locked("bulk_load", True, True)
+    remove_all = _locked("remove_all", True, True)
+    retain_all = _locked("retain_all", True, True)
+    update = _locked("update", True, True)
+    intersection_update = _locked("intersection_update", True, True)
+    difference_update = _locked("difference_update", True, True)
+    symmetric_difference_update = _locked("symmetric_difference_update",
+                                          True, True)
+    __ior__ = _locked("__ior__", True, True)
+    __iand__ = _locked("__iand__", True, True)
+    __isub__ = _locked("__isub__", True, True)
+    __ixor__ = _locked("__ixor__", True, True)
+
+    contains = _locked("contains", False)
+    contains_key = _locked("contains_key", False)
+    get = _locked("get", False)
+    higher = _locked("higher", False)
+    lower = _locked("lower", False)
+    ceiling = _locked("ceiling", False)
+    floor = _locked("floor", False)
+    first = _locked("first", False)
+    last = _locked("last", False)
+    rank = _locked("rank", False)
+    select = _locked("select", False)
+    count_range = _locked("count_range", False)
+    size = _locked("size", False)
+    is_empty = _locked("is_empty", False)
+    contains_many = _locked("contains_many", False)
+    floor_many = _locked("floor_many", False)
+    ceiling_many = _locked("ceiling_many", False)
+    union = _locked("union", False, True)
+    intersection = _locked("intersection", False, True)
+    difference = _locked("difference", False, True)
+    symmetric_difference = _locked("symmetric_difference", False, True)
+    issubset = _locked("issubset", False, True)
+    issuperset = _locked("issuperset", False, True)
+    isdisjoint = _locked("isdisjoint", False, True)
+    __or__ = _locked("__or__", False, True)
+    __and__ = _locked("__and__", False, True)
+    __sub__ = _locked("__sub__", False, True)
+    __xor__ = _locked("__xor__", False, True)
+    __le__ = _locked("__le__", False, True)
+    __lt__ = _locked("__lt__", False, True)
+    __ge__ = _locked("__ge__", False, True)
+    __gt__ = _locked("__gt__", False, True)
+    __contains__ = _locked("__contains__", False)
+    __getitem__ = _locked("__getitem__", False)
+    __len__ = _locked("__len__", False)
+    __str__ = _locked("__str__", False)
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the ConcurrentTreeSet object type.
+
+        :return: the ConcurrentTreeSet object type
+        :rtype: Type
+        """
+        return self.__tree.object_type
+
+    @property
+    def key(self) -> Union[Callable[[Any], Any], None]:
+        """
+        Getter method to retrieve the function used to compute the sort key of
+        the elements.
+
+        :return: the key function, or None if the elements are ordered using
+            its natural ordering
+        :rtype: Union[Callable[[Any], Any], None]
+        """
+        return self.__tree.key
+
+    @contextmanager
+    def reading(self) -> Iterator[TreeSet]:
+        """
+        Holds the read lock while the context is active and gives the wrapped
+        TreeSet, whose queries, views and cursors can be used inside the
+        context. The TreeSet must not be modified.
+
+        :return: the wrapped TreeSet
+        :rtype: Iterator[TreeSet]
+        """
+        self.__lock.acquire_read()
+        try:
+            yield self.__tree
+        finally:
+            self.__lock.release_read()
+
+    @contextmanager
+    def writing(self) -> Iterator[TreeSet]:
+        """
+        Holds the write lock while the context is active and gives the wrapped
+        TreeSet, so several operations can be made without other threads
+        seeing the intermediate states.
+
+        :return: the wrapped TreeSet
+        :rtype: Iterator[TreeSet]
+        """
+        self.__lock.acquire_write()
+        try:
+            yield self.__tree
+        finally:
+            self.__lock.release_write()
+
+    def clone(self) -> TreeSet:
+        """
+        Returns a TreeSet with a copy of the structure of the wrapped one,
+        taken under the read lock. The copy is not shared with the set, so it
+        can be used by a single thread without locking.
+
+        :return: a copy of the set
+        :rtype: TreeSet
+        """
+        with self.reading() as tree:
+            return tree.clone()
+
+    def iterator(self) -> Iterator[E]:
+        """
+        Returns an iterator over the elements in ascending order. See
+        :meth:`__iter__`.
+
+        :return: an ascending iterator
+        :rtype: Iterator[E]
+        """
+        return iter(self)
+
+    def descending_iterator(self) -> Iterator[E]:
+        """
+        Returns an iterator over the elements in descending order. See
+        :meth:`__reversed__`.
+
+        :return: a descending iterator
+        :rtype: Iterator[E]
+        """
+        return reversed(self)
+
+    def iter_from(self, value: E, inclusive: bool = True,
+                  reverse: bool = False) -> Iterator[E]:
+        """
+        Returns an iterator of the elements starting from the given one, in
+        ascending order or descending if reverse is True. See
+        :meth:`TreeSet.iter_from`. The elements are copied under the read
+        lock like in :meth:`__iter__`.
+
+        :param value: the element to start from
+        :type value: E
+        :param inclusive: if True, the given element is included if present
+        :type inclusive: bool
+        :param reverse: if True, the elements lower than the given one are
+            iterated in descending order
+        :type reverse: bool
+        :return: an iterator over the copied elements
+        :rtype: Iterator[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        with self.reading() as tree:
+            return iter(list(tree.iter_from(value, inclusive, reverse)))
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Method to iterate over the elements in ascending order. The elements
+        are copied under the read lock, so the iterator is not affected by
+        the later modifications of the set.
+
+        :return: an iterator over the copied elements
+        :rtype: Iterator[E]
+        """
+        with self.reading() as tree:
+            return iter(list(tree))
+
+    def __reversed__(self) -> Iterator[E]:
+        """
+        Method to iterate over the elements in descending order, copying them
+        under the read lock like :meth:`__iter__`.
+
+        :return: a descending iterator over the copied elements
+        :rtype: Iterator[E]
+        """
+        with self.reading() as tree:
+            return iter(list(reversed(tree)))
+
+    def __eq__(self, other) -> bool:
+        """
+        Check equality between the current set and a given object, which must
+        be a tree or a ConcurrentTreeSet with the same elements. A
+        ConcurrentTreeSet is copied before comparing it.
+        This method is called when using built-in operator '=='.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if instances are equal else False
+        :rtype: bool
+        """
+        if isinstance(other, ConcurrentTreeSet):
+            other = other.clone()
+        with self.reading() as tree:
+            return tree == other
+
+    __hash__ = None
@@ -1,10 +1,13 @@
 """
 data_utils module.
 
-This module provides three different minor data structures classes.
+This module provides six different minor data structures classes.
     1. SimpleStack
     2. Node
     3. TreeNode
+    4. RedBlackNode
+    5. NullLeaf
+    6. PersistentNode
 """
 
 from enum import Enum
@@ -395,6 +398,163 @@ class TreeNode(Node):
         return f"TreeNode({self.value}, {self.left}, {self.right}, {self.color})"
 
 
+class RedBlackNode:
+    """
+    Class that represents a node of a RedBlackTree. Unlike :class:`TreeNode`,
+    it stores its fields in ``__slots__`` as plain attributes and its color as
+    a bool, so it has no property indirection and no linked list fields. It is
+    the node used by the RedBlackTree data structure.
+
+    The node also caches the sort key of its value, computed once when the
+    value is inserted, and the number of nodes of its subtree. If the tree has
+    no key function, the key is the value itself.
+    """
+
+    __slots__ = ("value", "key", "left", "right", "parent", "color", "size")
+
+    RED = True
+    BLACK = False
+
+    def __init__(
+            self, value: Any, left: Union['RedBlackNode', None],
+            right: Union['RedBlackNode', None], color: bool = RED,
+            parent: Union['RedBlackNode', None] = None, key: Any = None,
+            size: int = 1
+    ) -> None:
+        """
+        Constructor of the class.
+        Initializes a new instance of RedBlackNode.
+
+        :param value: the value of the node
+        :type value: Any
+        :param left: the left child of the node
+        :type left: Union['RedBlackNode', None]
+        :param right: the right child of the node
+        :type right: Union['RedBlackNode', None]
+        :param color: the color of the node, default is RED
+        :type color: bool
+        :param parent: the parent of the node, default is None
+        :type parent: Union['RedBlackNode', None]
+        :param key: the sort key of the value, default is the value itself
+        :type key: Any
+        :param size: the number of nodes of the subtree, default is 1
+        :type size: int
+        """
+        self.value = value
+        self.key = value if key is None else key
+        self.left = left
+        self.right = right
+        self.parent = parent
+        self.color = color
+        self.size = size
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the node for debugging.
+
+        :return: a string representation of the node
+        :rtype: str
+        """
+        color = "RED" if self.color else "BLACK"
+        return f"RedBlackNode({self.value}, {color})"
+
+
+class NullLeaf(RedBlackNode):
+    """
+    Class that represents the null leaf of the RedBlackTree: a black node
+    without value, key nor children, whose subtree size is 0. A single leaf
+    is shared by every tree, so it is read-only: setting any of its fields
+    raises an AttributeError instead of letting an operation on one tree
+    change what the others read, even from another thread.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """
+        Constructor of the class.
+        Initializes a new instance of NullLeaf.
+        """
+        for name, value in (("value", None), ("key", None), ("left", None),
+                            ("right", None), ("parent", None),
+                            ("color", RedBlackNode.BLACK), ("size", 0)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, key, value) -> None:
+        """
+        Method called when trying to set a field of the leaf.
+
+        :param key: name of the field
+        :param value: value to assign to the field
+        :raises AttributeError: always, since the leaf is read-only
+        """
+        raise AttributeError(f"The null leaf is read-only: {key}")
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the leaf for debugging.
+
+        :return: a string representation of the leaf
+        :rtype: str
+        """
+        return "NullLeaf()"
+
+
+class PersistentNode:
+    """
+    Class that represents an immutable node of a PersistentTreeSet. Unlike
+    :class:`RedBlackNode`, it has no parent pointer, so a node can be the
+    child of nodes of many versions of the tree at the same time. Its fields
+    must not be modified once the node is linked to a tree: a change builds
+    new nodes instead.
+
+    The node caches the sort key of its value and the number of nodes of its
+    subtree, computed from its children when it is created.
+    """
+
+    __slots__ = ("value", "key", "left", "right", "color", "size")
+
+    RED = True
+    BLACK = False
+
+    def __init__(
+            self, value: Any, key: Any,
+            left: Union['PersistentNode', None],
+            right: Union['PersistentNode', None], color: bool = RED
+    ) -> None:
+        """
+        Constructor of the class.
+        Initializes a new instance of PersistentNode.
+
+        :param value: the value of the node
+        :type value: Any
+        :param key: the sort key of the value
+        :type key: Any
+        :param left: the left child of the node, or None for the null leaf
+        :type left: Union['PersistentNode', None]
+        :param right: the right child of the node, or None for the null leaf
+        :type right: Union['PersistentNode', None]
+        :param color: the color of the node, default is RED
+        :type color: bool
+        """
+        self.value = value
+        self.key = key
+        self.left = left
+        self.right = right
+        self.color = color
+        self.size = 0 if left is None else left.size + right.size + 1
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the node for debugging.
+
+        :return: a string representation of the node
+        :rtype: str
+        """
+        color = "RED" if self.color else "BLACK"
+        return f"PersistentNode({self.value}, {color})"
+
+
 if __name__ == "__main__":
     stack = SimpleStack()
 
@@ -408,3 +568,6 @@ if __name__ == "__main__":
 
     tree_node = TreeNode(10, None, None)
     print(tree_node)
+
+    red_black_node = RedBlackNode(10, None, None)
+    print(red_black_node)
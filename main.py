@@ -8,6 +8,31 @@ def suite():
     suite.addTest(loader.loadTestsFromName("tests.test_many_items_tree_set"))
     suite.addTest(loader.loadTestsFromName("tests.test_other_items_tree_set"))
     suite.addTest(loader.loadTestsFromName("tests.test_simple_stack"))
+    suite.addTest(loader.loadTestsFromName("tests.test_bulk_load"))
+    suite.addTest(loader.loadTestsFromName("tests.test_red_black_node"))
+    suite.addTest(loader.loadTestsFromName("tests.test_array_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_validation"))
+    suite.addTest(loader.loadTestsFromName("tests.test_unchecked_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_comparisons"))
+    suite.addTest(loader.loadTestsFromName("tests.test_key_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_order_statistics"))
+    suite.addTest(loader.loadTestsFromName("tests.test_tree_set_view"))
+    suite.addTest(loader.loadTestsFromName("tests.test_count_range"))
+    suite.addTest(loader.loadTestsFromName("tests.test_set_operations"))
+    suite.addTest(loader.loadTestsFromName("tests.test_split_join"))
+    suite.addTest(loader.loadTestsFromName("tests.test_first_last"))
+    suite.addTest(loader.loadTestsFromName("tests.test_iteration"))
+    suite.addTest(loader.loadTestsFromName("tests.test_iter_from"))
+    suite.addTest(loader.loadTestsFromName("tests.test_batch_queries"))
+    suite.addTest(loader.loadTestsFromName("tests.test_cursor"))
+    suite.addTest(loader.loadTestsFromName("tests.test_remove_range"))
+    suite.addTest(loader.loadTestsFromName("tests.test_bulk_removal"))
+    suite.addTest(loader.loadTestsFromName("tests.test_add_stream"))
+    suite.addTest(loader.loadTestsFromName("tests.test_clone"))
+    suite.addTest(loader.loadTestsFromName("tests.test_persistent_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_set_comparisons"))
+    suite.addTest(loader.loadTestsFromName("tests.test_concurrent_tree_set"))
+    suite.addTest(loader.loadTestsFromName("tests.test_snapshot_tree_set"))
     return suite
 
 
@@ -0,0 +1,1141 @@
+"""
+persistent_tree_set module.
+
+This module provides the PersistentTreeSet class, an immutable set of
+elements stored in a persistent red-black tree. Its add and remove methods
+leave the set unchanged and return a new version of it that shares every
+untouched subtree with the previous one: only the *O(log n)* nodes of the
+path to the changed element are copied, so keeping many versions of a large
+set costs *O(log n)* memory per change instead of a full copy.
+
+The nodes of a version are never modified, so every version can be read from
+any thread without locking while newer versions are being created:
+
+    empty = PersistentTreeSet(int)
+    version = empty.add(10).add(20)
+    newer = version.remove(10)
+"""
+from typing import *
+from data_utils import PersistentNode
+from tree_set import RedBlackTree
+from tree_set_exceptions import *
+from tree_set_view import TreeSetView
+
+E = TypeVar('E')
+
+
+class PersistentTreeSet:
+    """
+    Class that represents an immutable set based on a persistent red-black
+    tree. The elements are ordered using its natural ordering, or by the keys
+    returned by the given key function, and they are validated like the
+    elements of a :class:`tree_set.TreeSet`.
+
+    The insertions follow the functional balancing of Okasaki and the
+    removals the one of Kahrs: both rebuild the path from the root to the
+    changed node, rebalancing it on the way up, and reuse the rest of the
+    nodes, so every version costs *O(log n)* time and memory. The nodes have
+    no parent pointers, which is what lets a subtree belong to many versions.
+
+    The set supports the read-only operations of the TreeSet, iteration,
+    indexing, since every node also stores the size of its subtree, and
+    range views, which see the version they were created from forever.
+    """
+
+    __slots__ = ("__validator", "__root")
+
+    _RED = PersistentNode.RED
+    _BLACK = PersistentNode.BLACK
+    _NULL = PersistentNode(None, None, None, None, PersistentNode.BLACK)
+
+    def __init__(self, generic_type: Type, sequence: Iterable[E] = None,
+                 key: Callable[[E], Any] = None) -> None:
+        """
+        Constructor of the class.
+        Initializes an empty PersistentTreeSet if type is given or constructs
+        one with the elements of the given iterable. The elements are sorted
+        once and the tree is built bottom-up in *O(n)*. If a TreeSet with the
+        same key function is given, its elements are taken in order without
+        being compared again, and a PersistentTreeSet shares its nodes.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param sequence: an iterable to take items from
+        :type sequence: Iterable[E]
+        :param key: function that returns the sort key of an element. If it
+            is None, the elements are ordered using its natural ordering
+        :type key: Callable[[E], Any]
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__validator = RedBlackTree(generic_type, key)
+        self.__root = self._NULL
+
+        if sequence is None:
+            return
+
+        compatible = isinstance(sequence, (RedBlackTree, PersistentTreeSet)) \
+            and sequence.key is key \
+            and issubclass(sequence.object_type, generic_type)
+        if compatible and isinstance(sequence, PersistentTreeSet):
+            self.__root = sequence.__root
+            return
+
+        if compatible:
+            keys, values = sequence._sorted_items()
+        else:
+            keys, values = \
+                self.__validator._RedBlackTree__sorted_unique(sequence)
+
+        self.__root = self.__blacken(self.__build(
+            keys, values, 0, len(values), 0, len(values).bit_length() - 1))
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the PersistentTreeSet object type.
+
+        :return: the PersistentTreeSet object type
+        :rtype: Type
+        """
+        return self.__validator.object_type
+
+    @property
+    def key(self) -> Union[Callable[[Any], Any], None]:
+        """
+        Getter method to retrieve the function used to compute the sort key of
+        the values.
+
+        :return: the key function, or None if the values are ordered using
+            its natural ordering
+        :rtype: Union[Callable[[Any], Any], None]
+        """
+        return self.__validator.key
+
+    def add(self, value: E) -> 'PersistentTreeSet':
+        """
+        Returns a new version of the set with the given value inserted. The
+        current version is not modified. If an equal element is already
+        contained, the current version is returned.
+
+        :param value: the value to insert
+        :type value: E
+        :return: the version with the value
+        :rtype: PersistentTreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        root = self.__root
+        new_root = self.__insert(root, self.__key_of(value), value)
+        if new_root is root:
+            return self
+        return self.__version(self.__blacken(new_root))
+
+    def remove(self, value: E) -> 'PersistentTreeSet':
+        """
+        Returns a new version of the set without the element equal to the
+        given value. The current version is not modified. If no equal element
+        is contained, the current version is returned.
+
+        :param value: the value to remove
+        :type value: E
+        :return: the version without the value
+        :rtype: PersistentTreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        root = self.__root
+        new_root = self.__delete(root, self.__key_of(value))
+        if new_root is root:
+            return self
+        return self.__version(self.__blacken(new_root))
+
+    def contains(self, value: E) -> bool:
+        """
+        Checks if a given value is contained into the current version.
+
+        :param value: to check if it is contained
+        :type value: E
+        :return: True if value is contained else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return value in self
+
+    def contains_key(self, key: Any) -> bool:
+        """
+        Checks if the current version contains an element with the given sort
+        key. If the set has no key function, the key is an element.
+
+        :param key: the sort key to search
+        :type key: Any
+        :return: True if an element with the given key is contained else False
+        :rtype: bool
+        :raises NullPointerException: if the given key is None
+        """
+        return self.get(key) is not None
+
+    def get(self, key: Any) -> Union[E, None]:
+        """
+        Returns the element of the current version whose sort key is equal to
+        the given key.
+
+        :param key: the sort key to search
+        :type key: Any
+        :return: the element with the given key or None if it was not found
+        :rtype: Union[E, None]
+        :raises NullPointerException: if the given key is None
+        """
+        if key is None:
+            raise NullPointerException("Key cannot be None")
+
+        candidate = None
+        current = self.__root
+        while current is not self._NULL:
+            if key < current.key:
+                current = current.left
+            else:
+                candidate = current
+                current = current.right
+
+        if candidate is not None and candidate.key == key:
+            return candidate.value
+        return None
+
+    def higher(self, value: E) -> Union[E, None]:
+        """
+        Returns the least element greater than the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least greater element, or None if there is none
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(self.__key_of(value), True, False)
+
+    def lower(self, value: E) -> Union[E, None]:
+        """
+        Returns the greatest element lower than the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest lower element, or None if there is none
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(self.__key_of(value), False, False)
+
+    def ceiling(self, value: E) -> Union[E, None]:
+        """
+        Returns the least element greater than or equal to the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the least greater or equal element, or None if there is none
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(self.__key_of(value), True, True)
+
+    def floor(self, value: E) -> Union[E, None]:
+        """
+        Returns the greatest element lower than or equal to the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the greatest lower or equal element, or None if there is none
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(self.__key_of(value), False, True)
+
+    def rank(self, value: E) -> int:
+        """
+        Returns the number of elements of the current version lower than the
+        given value, in *O(log n)*.
+
+        :param value: value to compare
+        :type value: E
+        :return: the number of elements lower than the given value
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self._count_below(self.__key_of(value), False)
+
+    def select(self, index: int) -> E:
+        """
+        Returns the element of the current version at the given index, the
+        lowest element being at index 0, in *O(log n)*.
+
+        :param index: the index of the element, between 0 and size - 1
+        :type index: int
+        :return: the element at the given index
+        :rtype: E
+        :raises IndexError: if the index is out of range
+        """
+        if not 0 <= index < self.size():
+            raise IndexError(
+                f"PersistentTreeSet index out of range: {index}")
+
+        current = self.__root
+        while index != (left_size := current.left.size):
+            if index < left_size:
+                current = current.left
+            else:
+                index -= left_size + 1
+                current = current.right
+
+        return current.value
+
+    def first(self) -> E:
+        """
+        Returns the lowest element contained in the current version.
+
+        :return: the lowest contained element
+        :rtype: E
+        :raises NoSuchElementException: if there is no such element
+        """
+        return self.__extreme(False)
+
+    def last(self) -> E:
+        """
+        Returns the greatest element contained in the current version.
+
+        :return: the greatest contained element
+        :rtype: E
+        :raises NoSuchElementException: if there is no such element
+        """
+        return self.__extreme(True)
+
+    def size(self) -> int:
+        """
+        Returns the number of elements of the current version.
+
+        :return: the number of elements
+        :rtype: int
+        """
+        return self.__root.size
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the current version has no elements.
+
+        :return: True if it is empty else False
+        :rtype: bool
+        """
+        return self.__root is self._NULL
+
+    def iterator(self) -> Iterator[E]:
+        """
+        Returns an iterator over the elements in ascending order.
+
+        :return: an ascending iterator
+        :rtype: Iterator[E]
+        """
+        return iter(self)
+
+    def descending_iterator(self) -> Iterator[E]:
+        """
+        Returns an iterator over the elements in descending order.
+
+        :return: a descending iterator
+        :rtype: Iterator[E]
+        """
+        return reversed(self)
+
+    def clear(self) -> 'PersistentTreeSet':
+        """
+        Returns an empty version of the set, with the same type and key
+        function. The current version is not modified.
+
+        :return: the empty version
+        :rtype: PersistentTreeSet
+        """
+        return self.__version(self._NULL)
+
+    def count_range(self, low: E, high: E,
+                    inclusive: Tuple[bool, bool] = (True, False)) -> int:
+        """
+        Returns the number of elements of the current version between the
+        given elements, computed with two rank descents in *O(log n)*.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included,
+            by default the lower one is included and the upper one is not
+        :type inclusive: Tuple[bool, bool]
+        :return: the number of elements between both bounds, 0 if the lower
+            bound is greater than the upper one
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        count = self._count_below(self.__key_of(high), inclusive[1]) \
+            - self._count_below(self.__key_of(low), not inclusive[0])
+        return max(count, 0)
+
+    def sub_set(self, low: E, high: E,
+                inclusive: Tuple[bool, bool] = (True, False)) -> TreeSetView:
+        """
+        Returns a view of the elements of the current version between the
+        given elements. Since the version never changes, neither does the
+        view, whatever versions are created later.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included,
+            by default the lower one is included and the upper one is not
+        :type inclusive: Tuple[bool, bool]
+        :return: a view of the elements between both bounds
+        :rtype: TreeSetView
+        :raises ValueError: if the lower bound is greater than the upper one
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        low_key = self.__key_of(low)
+        high_key = self.__key_of(high)
+        if high_key < low_key:
+            raise ValueError(
+                f"Lower bound {low} is greater than upper bound {high}")
+
+        return TreeSetView(self, low_key, inclusive[0], high_key, inclusive[1])
+
+    def head_set(self, high: E, inclusive: bool = False) -> TreeSetView:
+        """
+        Returns a view of the elements of the current version lower than the
+        given element, or equal to it if inclusive is True. See
+        :meth:`sub_set`.
+
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: if True, the upper bound is included
+        :type inclusive: bool
+        :return: a view of the elements below the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return TreeSetView(self, high=self.__key_of(high),
+                           high_inclusive=inclusive)
+
+    def tail_set(self, low: E, inclusive: bool = True) -> TreeSetView:
+        """
+        Returns a view of the elements of the current version greater than or
+        equal to the given element, or only greater if inclusive is False.
+        See :meth:`sub_set`.
+
+        :param low: the lower bound element
+        :type low: E
+        :param inclusive: if True, the lower bound is included
+        :type inclusive: bool
+        :return: a view of the elements above the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return TreeSetView(self, low=self.__key_of(low),
+                           low_inclusive=inclusive)
+
+    def iter_from(self, value: E, inclusive: bool = True,
+                  reverse: bool = False) -> Iterator[E]:
+        """
+        Provides an iterator of the elements of the current version starting
+        from the given element, in ascending order or descending if reverse
+        is True. The first element is sought in *O(log n)*.
+
+        :param value: the element to start from
+        :type value: E
+        :param inclusive: if True, the given element is included if present
+        :type inclusive: bool
+        :param reverse: if True, the elements lower than the given one are
+            iterated in descending order
+        :type reverse: bool
+        :return: an iterator of the elements from the given one
+        :rtype: Iterator[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = self.__key_of(value)
+        if reverse:
+            return self._iter_range(None, True, key, inclusive, True)
+        return self._iter_range(key, inclusive, None, True)
+
+    def _validate(self, value: Any) -> None:
+        """
+        Validates the given value with the validator shared by every version
+        of the set.
+
+        :param value: value to validate
+        :type value: Any
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__validator._validate(value)
+
+    def _count_below(self, key: Any, inclusive: bool) -> int:
+        """
+        Returns the number of elements whose keys are lower than the given
+        key, or lower than or equal to it if inclusive is True, in one descent
+        that adds the sizes of the left subtrees it skips.
+
+        :param key: the sort key to compare
+        :type key: Any
+        :param inclusive: if True, the elements with the given key are counted
+        :type inclusive: bool
+        :return: the number of elements below the given key
+        :rtype: int
+        """
+        current = self.__root
+        count = 0
+        while current is not self._NULL:
+            if (not key < current.key) if inclusive else current.key < key:
+                count += current.left.size + 1
+                current = current.right
+            else:
+                current = current.left
+
+        return count
+
+    def _iter_range(self, low: Any, low_inclusive: bool, high: Any,
+                    high_inclusive: bool,
+                    reverse: bool = False) -> Iterator[E]:
+        """
+        Returns an iterator over the elements whose keys are between the
+        given bounds, in ascending order or descending if reverse is True.
+        The path to the first element is found in *O(log n)* and no element
+        out of the bounds is visited.
+
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is included
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is included
+        :type high_inclusive: bool
+        :param reverse: if True, the elements are yielded in descending order
+        :type reverse: bool
+        :return: an iterator over the elements between both bounds
+        :rtype: Iterator[E]
+        """
+        return (node.value for node in self.__nodes(
+            reverse, low, low_inclusive, high, high_inclusive))
+
+    def _keys(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the keys of the current version in ascending
+        order, without copying them.
+
+        :return: an iterator over the sorted keys
+        :rtype: Iterator[Any]
+        """
+        return (node.key for node in self.__nodes(False))
+
+    def __key_of(self, value: Any) -> Any:
+        """
+        Private method that validates the given value and returns its sort
+        key. The valid types are cached by the validator, which is shared by
+        every version of the set.
+
+        :param value: value to validate
+        :type value: Any
+        :return: the sort key of the value
+        :rtype: Any
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        validator = self.__validator
+        validator._validate(value)
+        return value if (key := validator.key) is None else key(value)
+
+    def __version(self, root: PersistentNode) -> 'PersistentTreeSet':
+        """
+        Private method that returns a new version of the set, with the same
+        validator, whose tree is the given root.
+
+        :param root: the root of the new version
+        :type root: PersistentNode
+        :return: the new version
+        :rtype: PersistentTreeSet
+        """
+        version = object.__new__(type(self))
+        version.__validator = self.__validator
+        version.__root = root
+        return version
+
+    def __nearest(self, key: Any, greater: bool, inclusive: bool) \
+            -> Union[E, None]:
+        """
+        Private method that returns the element nearest to the given key,
+        greater or lower than it, and optionally equal.
+
+        :param key: the key to compare
+        :type key: Any
+        :param greater: if True, the nearest greater element is returned,
+            else the nearest lower one
+        :type greater: bool
+        :param inclusive: if True, an element equal to the key is returned
+        :type inclusive: bool
+        :return: the nearest element, or None if there is none
+        :rtype: Union[E, None]
+        """
+        current = self.__root
+        result = None
+        while current is not self._NULL:
+            if greater:
+                found = current.key < key if inclusive \
+                    else not key < current.key
+                if found:
+                    current = current.right
+                else:
+                    result = current.value
+                    current = current.left
+            else:
+                found = key < current.key if inclusive \
+                    else not current.key < key
+                if found:
+                    current = current.left
+                else:
+                    result = current.value
+                    current = current.right
+
+        return result
+
+    def __extreme(self, last: bool) -> E:
+        """
+        Private method that returns the lowest or the greatest element.
+
+        :param last: if True, the greatest element is returned
+        :type last: bool
+        :return: the lowest or the greatest element
+        :rtype: E
+        :raises NoSuchElementException: if there is no such element
+        """
+        if self.is_empty():
+            raise NoSuchElementException()
+
+        current = self.__root
+        while (child := current.right if last else current.left) \
+                is not self._NULL:
+            current = child
+
+        return current.value
+
+    def __build(self, keys: List, values: List, start: int, end: int,
+                depth: int, red_depth: int) -> PersistentNode:
+        """
+        Private method that builds a balanced subtree with the sorted values
+        between the start (inclusive) and end (exclusive) indexes, coloring
+        red the nodes of the deepest level so every path has the same black
+        height.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :param start: index of the first value of the subtree
+        :type start: int
+        :param end: index after the last value of the subtree
+        :type end: int
+        :param depth: depth of the subtree root
+        :type depth: int
+        :param red_depth: depth of the nodes that must be colored red
+        :type red_depth: int
+        :return: the root of the built subtree
+        :rtype: PersistentNode
+        """
+        if start >= end:
+            return self._NULL
+
+        middle = (start + end) // 2
+        return PersistentNode(
+            values[middle], keys[middle],
+            self.__build(keys, values, start, middle, depth + 1, red_depth),
+            self.__build(keys, values, middle + 1, end, depth + 1,
+                         red_depth),
+            depth == red_depth)
+
+    def __insert(self, node: PersistentNode, key: Any,
+                 value: Any) -> PersistentNode:
+        """
+        Private method that returns a copy of the given subtree with the value
+        inserted, rebalancing the copied path. If the key is already in the
+        subtree, the same subtree is returned. The returned root may be red
+        with a red child, which is fixed by its black ancestor or by coloring
+        the root black.
+
+        :param node: the root of the subtree
+        :type node: PersistentNode
+        :param key: the sort key of the value
+        :type key: Any
+        :param value: the value to insert
+        :type value: Any
+        :return: the root of the new subtree
+        :rtype: PersistentNode
+        """
+        if node is self._NULL:
+            return PersistentNode(value, key, self._NULL, self._NULL,
+                                  self._RED)
+
+        if key < node.key:
+            left = self.__insert(node.left, key, value)
+            if left is node.left:
+                return node
+            if node.color:
+                return PersistentNode(node.value, node.key, left, node.right,
+                                      self._RED)
+            return self.__balance(left, node, node.right)
+
+        if node.key < key:
+            right = self.__insert(node.right, key, value)
+            if right is node.right:
+                return node
+            if node.color:
+                return PersistentNode(node.value, node.key, node.left, right,
+                                      self._RED)
+            return self.__balance(node.left, node, right)
+
+        return node
+
+    def __delete(self, node: PersistentNode, key: Any) -> PersistentNode:
+        """
+        Private method that returns a copy of the given subtree without the
+        node having the given key, rebalancing the copied path. If the key is
+        not in the subtree, the same subtree is returned. When the removed
+        path lost a black node, the returned subtree is one black level
+        shorter, which its parent compensates.
+
+        :param node: the root of the subtree
+        :type node: PersistentNode
+        :param key: the sort key to remove
+        :type key: Any
+        :return: the root of the new subtree
+        :rtype: PersistentNode
+        """
+        if node is self._NULL:
+            return node
+
+        if key < node.key:
+            left = self.__delete(node.left, key)
+            if left is node.left:
+                return node
+            if node.left.color:
+                return PersistentNode(node.value, node.key, left, node.right,
+                                      self._RED)
+            return self.__balance_left(left, node, node.right)
+
+        if node.key < key:
+            right = self.__delete(node.right, key)
+            if right is node.right:
+                return node
+            if node.right.color:
+                return PersistentNode(node.value, node.key, node.left, right,
+                                      self._RED)
+            return self.__balance_right(node.left, node, right)
+
+        return self.__append(node.left, node.right)
+
+    def __balance(self, left: PersistentNode, item: PersistentNode,
+                  right: PersistentNode) -> PersistentNode:
+        """
+        Private method that returns a black node with the element of the given
+        item and the given children, fixing a red child having a red child by
+        turning them into a red node with two black children.
+
+        :param left: the left child
+        :type left: PersistentNode
+        :param item: the node whose element is kept
+        :type item: PersistentNode
+        :param right: the right child
+        :type right: PersistentNode
+        :return: the balanced subtree
+        :rtype: PersistentNode
+        """
+        red, black = self._RED, self._BLACK
+        if left.color:
+            if right.color:
+                return PersistentNode(
+                    item.value, item.key, self.__paint(left, black),
+                    self.__paint(right, black), red)
+            if left.left.color:
+                return PersistentNode(
+                    left.value, left.key, self.__paint(left.left, black),
+                    PersistentNode(item.value, item.key, left.right, right,
+                                   black), red)
+            if left.right.color:
+                middle = left.right
+                return PersistentNode(
+                    middle.value, middle.key,
+                    PersistentNode(left.value, left.key, left.left,
+                                   middle.left, black),
+                    PersistentNode(item.value, item.key, middle.right, right,
+                                   black), red)
+        if right.color:
+            if right.right.color:
+                return PersistentNode(
+                    right.value, right.key,
+                    PersistentNode(item.value, item.key, left, right.left,
+                                   black),
+                    self.__paint(right.right, black), red)
+            if right.left.color:
+                middle = right.left
+                return PersistentNode(
+                    middle.value, middle.key,
+                    PersistentNode(item.value, item.key, left, middle.left,
+                                   black),
+                    PersistentNode(right.value, right.key, middle.right,
+                                   right.right, black), red)
+
+        return PersistentNode(item.value, item.key, left, right, black)
+
+    def __balance_left(self, left: PersistentNode, item: PersistentNode,
+                       right: PersistentNode) -> PersistentNode:
+        """
+        Private method that returns a node with the element of the given item
+        and the given children, whose left child is one black level shorter
+        than the right one, restoring the black height.
+
+        :param left: the shorter left child
+        :type left: PersistentNode
+        :param item: the node whose element is kept
+        :type item: PersistentNode
+        :param right: the right child
+        :type right: PersistentNode
+        :return: the balanced subtree
+        :rtype: PersistentNode
+        """
+        red, black = self._RED, self._BLACK
+        if left.color:
+            return PersistentNode(item.value, item.key,
+                                  self.__paint(left, black), right, red)
+        if not right.color:
+            return self.__balance(left, item, self.__paint(right, red))
+
+        middle = right.left
+        return PersistentNode(
+            middle.value, middle.key,
+            PersistentNode(item.value, item.key, left, middle.left, black),
+            self.__balance(middle.right, right,
+                           self.__paint(right.right, red)), red)
+
+    def __balance_right(self, left: PersistentNode, item: PersistentNode,
+                        right: PersistentNode) -> PersistentNode:
+        """
+        Private method that returns a node with the element of the given item
+        and the given children, whose right child is one black level shorter
+        than the left one, restoring the black height.
+
+        :param left: the left child
+        :type left: PersistentNode
+        :param item: the node whose element is kept
+        :type item: PersistentNode
+        :param right: the shorter right child
+        :type right: PersistentNode
+        :return: the balanced subtree
+        :rtype: PersistentNode
+        """
+        red, black = self._RED, self._BLACK
+        if right.color:
+            return PersistentNode(item.value, item.key, left,
+                                  self.__paint(right, black), red)
+        if not left.color:
+            return self.__balance(self.__paint(left, red), item, right)
+
+        middle = left.right
+        return PersistentNode(
+            middle.value, middle.key,
+            self.__balance(self.__paint(left.left, red), left, middle.left),
+            PersistentNode(item.value, item.key, middle.right, right, black),
+            red)
+
+    def __append(self, left: PersistentNode,
+                 right: PersistentNode) -> PersistentNode:
+        """
+        Private method that joins the two children of a removed node, every
+        key of the left one being lower than the keys of the right one, by
+        merging the inner spines of both subtrees.
+
+        :param left: the left subtree
+        :type left: PersistentNode
+        :param right: the right subtree
+        :type right: PersistentNode
+        :return: the root of the joined subtree
+        :rtype: PersistentNode
+        """
+        red, black = self._RED, self._BLACK
+        if left is self._NULL:
+            return right
+        if right is self._NULL:
+            return left
+
+        if left.color and right.color:
+            middle = self.__append(left.right, right.left)
+            if middle.color:
+                return PersistentNode(
+                    middle.value, middle.key,
+                    PersistentNode(left.value, left.key, left.left,
+                                   middle.left, red),
+                    PersistentNode(right.value, right.key, middle.right,
+                                   right.right, red), red)
+            return PersistentNode(
+                left.value, left.key, left.left,
+                PersistentNode(right.value, right.key, middle, right.right,
+                               red), red)
+
+        if not left.color and not right.color:
+            middle = self.__append(left.right, right.left)
+            if middle.color:
+                return PersistentNode(
+                    middle.value, middle.key,
+                    PersistentNode(left.value, left.key, left.left,
+                                   middle.left, black),
+                    PersistentNode(right.value, right.key, middle.right,
+                                   right.right, black), red)
+            return self.__balance_left(
+                left.left, left,
+                PersistentNode(right.value, right.key, middle, right.right,
+                               black))
+
+        if right.color:
+            return PersistentNode(right.value, right.key,
+                                  self.__append(left, right.left),
+                                  right.right, red)
+        return PersistentNode(left.value, left.key, left.left,
+                              self.__append(left.right, right), red)
+
+    def __paint(self, node: PersistentNode, color: bool) -> PersistentNode:
+        """
+        Private method that returns the given node with the given color,
+        copying it if its color is different.
+
+        :param node: the node to paint
+        :type node: PersistentNode
+        :param color: the new color
+        :type color: bool
+        :return: the node with the given color
+        :rtype: PersistentNode
+        """
+        if node.color == color:
+            return node
+        return PersistentNode(node.value, node.key, node.left, node.right,
+                              color)
+
+    def __blacken(self, root: PersistentNode) -> PersistentNode:
+        """
+        Private method that returns the given root colored black.
+
+        :param root: the root of a tree
+        :type root: PersistentNode
+        :return: the black root
+        :rtype: PersistentNode
+        """
+        return self.__paint(root, self._BLACK)
+
+    def __nodes(self, reverse: bool, low: Any = None,
+                low_inclusive: bool = True, high: Any = None,
+                high_inclusive: bool = True) -> Iterator[PersistentNode]:
+        """
+        Generator that traverses the nodes whose keys are between the given
+        bounds in order or reversed. The nodes have no parent pointers, so
+        the path to the current node is kept in a stack of *O(log n)* nodes,
+        which starts as the path to the first node within the bounds.
+
+        :param reverse: if True the route will be reversed
+        :type reverse: bool
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is included
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is included
+        :type high_inclusive: bool
+        """
+        null = self._NULL
+        stack = []
+        node = self.__root
+        if reverse:
+            start, start_inclusive, stop, stop_inclusive = \
+                high, high_inclusive, low, low_inclusive
+        else:
+            start, start_inclusive, stop, stop_inclusive = \
+                low, low_inclusive, high, high_inclusive
+
+        while node is not null:
+            if start is None:
+                outside = False
+            elif reverse:
+                outside = start < node.key if start_inclusive \
+                    else not node.key < start
+            else:
+                outside = node.key < start if start_inclusive \
+                    else not start < node.key
+            if outside:
+                node = node.left if reverse else node.right
+            else:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+        while stack:
+            node = stack.pop()
+            if stop is not None:
+                if reverse:
+                    outside = node.key < stop if stop_inclusive \
+                        else not stop < node.key
+                else:
+                    outside = stop < node.key if stop_inclusive \
+                        else not node.key < stop
+                if outside:
+                    return
+            yield node
+            node = node.left if reverse else node.right
+            while node is not null:
+                stack.append(node)
+                node = node.right if reverse else node.left
+
+    def __eq__(self, other) -> bool:
+        """
+        Check equality between the current version and a given object, which
+        must be a PersistentTreeSet or a tree with the same elements.
+        This method is called when using built-in operator '=='.
+
+        If both sets have the same key function, their sorted keys are
+        compared in a single lockstep walk that stops at the first
+        difference, in *O(n)*. Other objects are left to their own
+        comparison.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if instances are equal else False
+        :rtype: bool
+        """
+        if not isinstance(other, (PersistentTreeSet, RedBlackTree)):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+
+        if other.key is not self.key:
+            return all(value in other for value in self)
+
+        for key, other_key in zip(self._keys(), other._keys()):
+            if not key == other_key:
+                return False
+
+        return True
+
+    __hash__ = None
+
+    def __iter__(self) -> Iterator[E]:
+        """
+        Method to iterate over the elements of the current version.
+
+        :return: an iterator over the elements
+        :rtype: Iterator[E]
+        """
+        return (node.value for node in self.__nodes(False))
+
+    def __reversed__(self) -> Iterator[E]:
+        """
+        Method to iterate reversely over the elements of the current version.
+
+        :return: a descending iterator over the elements
+        :rtype: Iterator[E]
+        """
+        return (node.value for node in self.__nodes(True))
+
+    def __contains__(self, value) -> bool:
+        """
+        Check if the given value is contained in the current version or not.
+        This method is called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: Any
+        :return: True if it is contained else False
+        :rtype: bool
+        """
+        return self.get(self.__key_of(value)) is not None
+
+    def __getitem__(self, index: int) -> E:
+        """
+        Returns the element at the given index. Negative indexes count from
+        the greatest element, like in a list. This method is called when
+        using the built-in operator '[]'.
+
+        :param index: the index of the element
+        :type index: int
+        :return: the element at the given index
+        :rtype: E
+        :raises TypeError: if the index is not an integer
+        :raises IndexError: if the index is out of range
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"PersistentTreeSet indices must be integers, "
+                f"not {type(index)}")
+
+        if not -(size := self.size()) <= index < size:
+            raise IndexError(
+                f"PersistentTreeSet index out of range: {index}")
+
+        return self.select(index + size if index < 0 else index)
+
+    def __len__(self) -> int:
+        """
+        Provides the number of elements of the current version. It is used
+        with the built-in method len().
+
+        :return: the number of elements
+        :rtype: int
+        """
+        return self.__root.size
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the current version.
+
+        :return: PersistentTreeSet string representation
+        :rtype: str
+        """
+        return f"{[value for value in self]}"
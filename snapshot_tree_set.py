@@ -0,0 +1,291 @@
+"""
+snapshot_tree_set module.
+
+This module provides the SnapshotTreeSet class, a set that can be shared by
+many threads whose readers never wait for its writers. The elements are kept
+in a :class:`persistent_tree_set.PersistentTreeSet`: every update builds a new
+version of it, copying only the path to the changed element, and publishes it
+with a single assignment, so an iterator or a view keeps walking the version
+that was current when it was created while the writers go on:
+
+    shared = SnapshotTreeSet(int, range(100))
+    for value in shared:
+        shared.add(value + 100)
+    view = shared.sub_set(10, 20)
+"""
+import threading
+from functools import wraps
+from typing import *
+from persistent_tree_set import PersistentTreeSet
+
+E = TypeVar('E')
+
+
+class SnapshotTreeSet:
+    """
+    Class that represents a thread-safe set whose readers see consistent
+    snapshots. The set holds a reference to the current version of a
+    :class:`PersistentTreeSet`, whose nodes are never modified once they are
+    published.
+
+    The updates hold a lock, so the writers take turns, build the next
+    version from the current one in *O(log n)* and publish it. The queries
+    hold no lock: they read the reference once and work on that version, so
+    they never block the writers and never see a tree being rebalanced. An
+    iterator, a view or a version returned by :meth:`snapshot` keeps the
+    version it was created from, however many updates happen while it is
+    being used, and the old versions are freed when nothing uses them.
+
+    Each call works on the version current at the moment, so several queries
+    that must agree with each other are made on a single :meth:`snapshot`.
+    """
+
+    __slots__ = ("__version", "__lock")
+
+    def __init__(self, generic_type: Type, sequence: Iterable[E] = None,
+                 key: Callable[[E], Any] = None) -> None:
+        """
+        Constructor of the class.
+        Initializes a new SnapshotTreeSet whose first version is created
+        with the given arguments. See :class:`PersistentTreeSet`.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param sequence: an iterable to take items from
+        :type sequence: Iterable[E]
+        :param key: function that returns the sort key of an element
+        :type key: Callable[[E], Any]
+        :raises TypeError: if the given values does not match the instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__version = PersistentTreeSet(generic_type, sequence, key)
+        self.__lock = threading.Lock()
+
+    def _current(name: str):
+        """
+        Creates a method that calls the method of the current version with
+        the given name, without locking. The documentation of the method is
+        the one of the PersistentTreeSet.
+
+        :param name: the name of the PersistentTreeSet method
+        :type name: str
+        :return: the method working on the current version
+        :rtype: Callable
+        """
+
+        @wraps(getattr(PersistentTreeSet, name))
+        def method(self, *args, **kwargs):
+            return getattr(self.__version, name)(*args, **kwargs)
+
+        return method
+
+    contains = _current("contains")
+    contains_key = _current("contains_key")
+    get = _current("get")
+    higher = _current("higher")
+    lower = _current("lower")
+    ceiling = _current("ceiling")
+    floor = _current("floor")
+    first = _current("first")
+    last = _current("last")
+    rank = _current("rank")
+    select = _current("select")
+    count_range = _current("count_range")
+    size = _current("size")
+    is_empty = _current("is_empty")
+    iterator = _current("iterator")
+    descending_iterator = _current("descending_iterator")
+    iter_from = _current("iter_from")
+    sub_set = _current("sub_set")
+    head_set = _current("head_set")
+    tail_set = _current("tail_set")
+    __iter__ = _current("__iter__")
+    __reversed__ = _current("__reversed__")
+    __contains__ = _current("__contains__")
+    __getitem__ = _current("__getitem__")
+    __len__ = _current("__len__")
+    __str__ = _current("__str__")
+
+    @property
+    def object_type(self) -> Type:
+        """
+        Getter method to retrieve the SnapshotTreeSet object type.
+
+        :return: the SnapshotTreeSet object type
+        :rtype: Type
+        """
+        return self.__version.object_type
+
+    @property
+    def key(self) -> Union[Callable[[Any], Any], None]:
+        """
+        Getter method to retrieve the function used to compute the sort key of
+        the elements.
+
+        :return: the key function, or None if the elements are ordered using
+            its natural ordering
+        :rtype: Union[Callable[[Any], Any], None]
+        """
+        return self.__version.key
+
+    def snapshot(self) -> PersistentTreeSet:
+        """
+        Returns the current version of the set in *O(1)*. It is immutable, so
+        it can be queried and iterated as long as needed without seeing the
+        later updates and without delaying them.
+
+        :return: the current version
+        :rtype: PersistentTreeSet
+        """
+        return self.__version
+
+    def add(self, value: E) -> bool:
+        """
+        Inserts the given value into the set, publishing a new version, if no
+        equal element is contained.
+
+        :param value: the value to insert
+        :type value: E
+        :return: True if the value was inserted else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        with self.__lock:
+            version = self.__version
+            self.__version = version.add(value)
+            return self.__version is not version
+
+    def remove(self, value: E) -> bool:
+        """
+        Removes the element equal to the given value from the set, publishing
+        a new version, if it is contained.
+
+        :param value: the value to remove
+        :type value: E
+        :return: True if the value was removed else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        with self.__lock:
+            version = self.__version
+            self.__version = version.remove(value)
+            return self.__version is not version
+
+    def add_all(self, values: Iterable[E]) -> bool:
+        """
+        Inserts the given values into the set and publishes them together in
+        a single version, so the readers see all of them or none. If some
+        value is not valid, an exception is raised and no value is added.
+
+        :param values: values to insert into the set
+        :type values: Iterable[E]
+        :return: True if all values could be inserted else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        with self.__lock:
+            version = self.__version
+            inserted = True
+            for value in values:
+                newer = version.add(value)
+                inserted = inserted and newer is not version
+                version = newer
+            self.__version = version
+            return inserted
+
+    def remove_all(self, values: Iterable[E]) -> int:
+        """
+        Removes the given values from the set and publishes the removals
+        together in a single version. If some value is not valid, an exception
+        is raised and no value is removed.
+
+        :param values: values to remove from the set
+        :type values: Iterable[E]
+        :return: the number of removed values
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        with self.__lock:
+            version = old_version = self.__version
+            for value in values:
+                version = version.remove(value)
+            self.__version = version
+            return old_version.size() - version.size()
+
+    def poll_first(self) -> E:
+        """
+        Retrieves and removes the first (lowest) element, or returns None
+        if this set is empty.
+
+        :return: the first (lowest) element, or None if this set is empty
+        :rtype: Union[E, None]
+        """
+        return self.__poll(False)
+
+    def poll_last(self) -> E:
+        """
+        Retrieves and removes the last (greatest) element, or returns None
+        if this set is empty.
+
+        :return: the last (greatest) element, or None if this set is empty
+        :rtype: Union[E, None]
+        """
+        return self.__poll(True)
+
+    def clear(self) -> None:
+        """
+        Removes every element of the set by publishing an empty version. The
+        iterators and views created before keep their elements.
+        """
+        with self.__lock:
+            self.__version = self.__version.clear()
+
+    def __poll(self, last: bool) -> Any:
+        """
+        Private method that removes and returns the lowest element, or the
+        greatest one if last is True, in a single update.
+
+        :param last: if True, the greatest element is removed
+        :type last: bool
+        :return: the removed element, or None if the set is empty
+        :rtype: Any
+        """
+        with self.__lock:
+            version = self.__version
+            if version.is_empty():
+                return None
+
+            value = version.last() if last else version.first()
+            self.__version = version.remove(value)
+            return value
+
+    def __eq__(self, other) -> bool:
+        """
+        Check equality between the current version and a given object, which
+        must be a tree, a PersistentTreeSet or a SnapshotTreeSet with the
+        same elements. Other objects are left to their own comparison.
+        This method is called when using built-in operator '=='.
+
+        :param other: other instance to compare with
+        :type other: Any
+        :return: True if instances are equal else False
+        :rtype: bool
+        """
+        if isinstance(other, SnapshotTreeSet):
+            other = other.snapshot()
+        return self.__version.__eq__(other)
+
+    __hash__ = None
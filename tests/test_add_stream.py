@@ -0,0 +1,102 @@
+"""Implementation of the test class for the TreeSet streaming insertion."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+
+class TestAddStream(unittest.TestCase):
+    """Test the add_stream method of the TreeSet."""
+
+    def test_generators(self):
+        """
+        Tests inserting generators of random values with several chunk sizes
+        and modes against a Python set.
+        """
+        for engine in TreeSet._ENGINES:
+            for chunk_size in (1, 7, 4096):
+                for atomic in (False, True):
+                    items = set(random.sample(range(3000), 500))
+                    tree = TreeSet(int, items, engine=engine)
+                    values = [random.randint(0, 3000) for _ in range(1000)]
+                    inserted = tree.add_stream(
+                        (value for value in values), chunk_size, atomic)
+                    check_tree(tree)
+                    self.assertEqual(inserted, len(set(values) - items),
+                                     "Wrong number of inserted values")
+                    items.update(values)
+                    self.assertEqual(list(tree), sorted(items),
+                                     "Wrong elements")
+
+    def test_consumes_once(self):
+        """
+        Tests that the iterable is consumed once and in chunks.
+        """
+        tree = TreeSet(int)
+        consumed = []
+
+        def values():
+            for value in range(100):
+                consumed.append(value)
+                yield value
+
+        iterator = values()
+        self.assertEqual(tree.add_stream(iterator, chunk_size=30), 100,
+                         "Every value must be inserted")
+        self.assertEqual(consumed, list(range(100)),
+                         "The values must be consumed once")
+        self.assertEqual(list(iterator), [], "The iterator must be exhausted")
+
+    def test_invalid_values(self):
+        """
+        Tests that an invalid value keeps the previous chunks, unless the
+        insertion is atomic.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, engine=engine)
+            with self.assertRaises(TypeError):
+                tree.add_stream(iter([1, 2, 3, 4, "5", 6]), chunk_size=2)
+            self.assertEqual(list(tree), [1, 2, 3, 4],
+                             "The previous chunks must be kept")
+
+            tree = TreeSet(int, [10], engine=engine)
+            with self.assertRaises(NullPointerException):
+                tree.add_stream(iter([1, 2, 3, None]), 1, atomic=True)
+            self.assertEqual(list(tree), [10],
+                             "Atomic insertion must not add any value")
+            with self.assertRaises(ValueError):
+                tree.add_stream([1], chunk_size=0)
+
+    def test_keeps_elements(self):
+        """
+        Tests that the elements of the TreeSet and the first of the equal
+        streamed values are kept.
+        """
+        first = Person("First", 20)
+        tree = TreeSet(Person, [first], key=lambda person: person.age)
+        newer = Person("Newer", 30)
+        self.assertEqual(tree.add_stream(iter([Person("Other", 20), newer,
+                                               Person("Later", 30)])), 1,
+                         "Only one value must be inserted")
+        self.assertIs(tree.get(20), first, "The element must be kept")
+        self.assertIs(tree.get(30), newer, "The first value must be kept")
+
+    def test_add_all(self):
+        """
+        Tests that add_all stays atomic and returns whether every value was
+        inserted.
+        """
+        tree = TreeSet(int, [1, 2])
+        self.assertTrue(tree.add_all([3, 4]), "Every value must be inserted")
+        self.assertFalse(tree.add_all([4, 5]), "Existing value was given")
+        with self.assertRaises(TypeError):
+            tree.add_all([6, "7"])
+        with self.assertRaises(TypeError):
+            tree.add_all(value for value in [6, 7])
+        self.assertEqual(list(tree), [1, 2, 3, 4, 5], "Wrong elements")
+
+
+if __name__ == '__main__':
+    unittest.main()
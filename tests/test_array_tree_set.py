@@ -0,0 +1,138 @@
+"""Implementation of the test class for the array engine of the TreeSet."""
+import random
+import unittest
+from array_tree_set import ArrayTreeSet
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_array_red_black_tree
+from tree_set_exceptions import *
+
+
+class TestArrayTreeSet(unittest.TestCase):
+    """Test the TreeSet created with the array engine."""
+
+    def setUp(self) -> None:
+        """
+        Sets up the test fixture before exercising it.
+        """
+        self.items = list({random.randint(0, 1000) for _ in range(100)})
+        self.ordered_items = sorted(self.items)
+        self.tree = TreeSet(int, self.items, engine="array")
+
+    def test_engine(self):
+        """
+        Tests that the engine selects the ArrayTreeSet class.
+        """
+        self.assertIsInstance(self.tree, ArrayTreeSet, "Wrong engine class")
+        self.assertIsInstance(self.tree.clone(), ArrayTreeSet,
+                              "Clone must keep the engine")
+        self.assertNotIsInstance(TreeSet(int), ArrayTreeSet,
+                                 "Wrong default engine class")
+        with self.assertRaises(ValueError):
+            TreeSet(int, engine="list")
+
+    def test_bulk_load(self):
+        """
+        Tests the tree built by the constructor.
+        """
+        check_array_red_black_tree(self.tree)
+        self.assertEqual(list(self.tree), self.ordered_items,
+                         "Wrong values after bulk load")
+        self.assertEqual(list(self.tree.descending_iterator()),
+                         self.ordered_items[::-1],
+                         "Wrong values of the descending iterator")
+
+    def test_random_operations(self):
+        """
+        Tests that the tree keeps its invariants after random insertions and
+        deletions.
+        """
+        items = set(self.items)
+        for _ in range(2000):
+            item = random.randint(0, 1000)
+            if random.random() < 0.5:
+                self.assertEqual(self.tree.add(item), item not in items,
+                                 "Wrong value after adding")
+                items.add(item)
+            else:
+                self.assertEqual(self.tree.remove(item), item in items,
+                                 "Wrong value after removing")
+                items.discard(item)
+
+            check_array_red_black_tree(self.tree)
+
+        self.assertEqual(list(self.tree), sorted(items), "Wrong tree values")
+
+    def test_free_list(self):
+        """
+        Tests that the ids of the removed nodes are reused.
+        """
+        capacity = len(self.tree._ArrayTreeSet__values)
+        for item in self.items:
+            self.tree.remove(item)
+        self.tree.add_all(self.items)
+        self.assertEqual(len(self.tree._ArrayTreeSet__values), capacity,
+                         "Removed node ids must be reused")
+        check_array_red_black_tree(self.tree)
+
+    def test_navigation(self):
+        """
+        Tests the navigation methods against the node engine.
+        """
+        tree = TreeSet(int, self.items)
+        for item in range(-1, 1002):
+            self.assertEqual(self.tree.higher(item), tree.higher(item),
+                             "Wrong higher value")
+            self.assertEqual(self.tree.lower(item), tree.lower(item),
+                             "Wrong lower value")
+            self.assertEqual(self.tree.ceiling(item), tree.ceiling(item),
+                             "Wrong ceiling value")
+            self.assertEqual(self.tree.floor(item), tree.floor(item),
+                             "Wrong floor value")
+            self.assertEqual(self.tree.contains(item), tree.contains(item),
+                             "Wrong contains value")
+
+        self.assertEqual(self.tree, tree, "Both engines must be equal")
+
+    def test_poll(self):
+        """
+        Tests the poll methods.
+        """
+        self.assertEqual(self.tree.first(), self.ordered_items[0],
+                         "Wrong first value")
+        self.assertEqual(self.tree.last(), self.ordered_items[-1],
+                         "Wrong last value")
+        self.assertEqual(self.tree.poll_first(), self.ordered_items[0],
+                         "Wrong poll first value")
+        self.assertEqual(self.tree.poll_last(), self.ordered_items[-1],
+                         "Wrong poll last value")
+        self.tree.clear()
+        self.assertTrue(self.tree.is_empty(), "TreeSet must be empty")
+        self.assertIsNone(self.tree.poll_first(),
+                          "poll_first must return None on an empty TreeSet")
+
+    def test_validation(self):
+        """
+        Tests that the values are validated.
+        """
+        with self.assertRaises(NullPointerException):
+            self.tree.add(None)
+        with self.assertRaises(TypeError):
+            self.tree.add("1")
+        with self.assertRaises(ClassCastException):
+            TreeSet(Student, engine="array").add(Student("Student1", 1))
+
+    def test_person(self):
+        """
+        Tests the array engine with user defined classes.
+        """
+        items = [Person(f"Person{age}", age) for age in range(20, 40)]
+        tree = TreeSet(Person, engine="array")
+        for item in items[::-1]:
+            self.assertTrue(tree.add(item), "Wrong value after adding")
+        self.assertEqual(list(tree), items, "Wrong tree values")
+        self.assertEqual(tree.higher(items[3]), items[4], "Wrong higher value")
+
+
+if __name__ == '__main__':
+    unittest.main()
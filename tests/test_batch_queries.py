@@ -0,0 +1,118 @@
+"""Implementation of the test class for the TreeSet batched queries."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tree_set_exceptions import NullPointerException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestBatchQueries(unittest.TestCase):
+    """Test the contains_many, floor_many and ceiling_many methods."""
+
+    def test_against_single_calls(self):
+        """
+        Tests the batched queries against the single calls, with unsorted
+        and repeated queries.
+        """
+        for engine in TreeSet._ENGINES:
+            for size in (0, 1, 10, 500):
+                items = random.sample(range(3 * size + 1), size)
+                tree = TreeSet(int, items, engine=engine)
+                values = [random.randint(-5, 3 * size + 5)
+                          for _ in range(300)]
+                values += values[:50]
+                self.assertEqual(tree.contains_many(values),
+                                 [tree.contains(value) for value in values],
+                                 "Wrong contains_many results")
+                self.assertEqual(tree.floor_many(values),
+                                 [tree.floor(value) for value in values],
+                                 "Wrong floor_many results")
+                self.assertEqual(tree.ceiling_many(values),
+                                 [tree.ceiling(value) for value in values],
+                                 "Wrong ceiling_many results")
+
+    def test_after_updates(self):
+        """
+        Tests the batched queries after random insertions and deletions.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(0, 400, 2), engine=engine)
+            for item in random.sample(range(400), 300):
+                if item % 3:
+                    tree.remove(item)
+                else:
+                    tree.add(item)
+
+            values = list(range(-2, 402))
+            random.shuffle(values)
+            self.assertEqual(tree.floor_many(values),
+                             [tree.floor(value) for value in values],
+                             "Wrong floor_many results after updates")
+            self.assertEqual(tree.ceiling_many(iter(values)),
+                             [tree.ceiling(value) for value in values],
+                             "Wrong ceiling_many results after updates")
+
+    def test_key(self):
+        """
+        Tests the batched queries with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(0, 20, 2)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        queries = [Person("Other", 5), Person("Other", 4)]
+        self.assertEqual(tree.contains_many(queries), [False, True],
+                         "Wrong contains_many with key")
+        self.assertEqual(tree.floor_many(queries), [people[2], people[2]],
+                         "Wrong floor_many with key")
+        self.assertEqual(tree.ceiling_many(queries), [people[3], people[2]],
+                         "Wrong ceiling_many with key")
+
+    def test_invalid_values(self):
+        """
+        Tests that the batched queries validate every value.
+        """
+        tree = TreeSet(int, range(10))
+        with self.assertRaises(NullPointerException):
+            tree.contains_many([1, None])
+        with self.assertRaises(TypeError):
+            tree.floor_many([1, "2"])
+        self.assertEqual(tree.ceiling_many([]), [], "Empty batch")
+
+    def test_finger(self):
+        """
+        Tests that neighboring queries are answered moving a finger instead
+        of descending from the root every time.
+        """
+        height = 12
+        tree = TreeSet(CountedNumber,
+                       [CountedNumber(number)
+                        for number in range(0, 2 ** (height + 1), 2)])
+        values = [CountedNumber(number) for number in range(1001, 3001)]
+        CountedNumber.comparisons = 0
+        ceilings = tree.ceiling_many(values)
+        self.assertEqual([value.number for value in ceilings],
+                         [number + number % 2
+                          for number in range(1001, 3001)],
+                         "Wrong ceiling_many results")
+        self.assertLess(CountedNumber.comparisons, len(values) * height // 2,
+                        "Neighboring queries must not descend from the root")
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """
+        Tests the batched queries with a NumPy array.
+        """
+        tree = TreeSet(int, range(0, 100, 10))
+        values = numpy.array([35, 0, 99, -1])
+        self.assertEqual(tree.contains_many(values),
+                         [False, True, False, False], "Wrong contains_many")
+        self.assertEqual(tree.floor_many(values), [30, 0, 90, None],
+                         "Wrong floor_many")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Implementation of the test class for the TreeSet bulk load."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_red_black_tree
+from tree_set_exceptions import ClassCastException, NullPointerException
+
+
+class TestBulkLoadTreeSet(unittest.TestCase):
+    """Test the bulk load of the TreeSet."""
+
+    def test_sizes(self):
+        """
+        Tests that the built trees are valid red-black trees for every size.
+        """
+        for size in range(70):
+            tree = TreeSet(int, list(range(size)))
+            check_red_black_tree(tree)
+            self.assertEqual(list(tree), list(range(size)),
+                             "Wrong values after bulk load")
+
+    def test_unsorted_with_duplicates(self):
+        """
+        Tests the bulk load with unsorted values containing duplicates.
+        """
+        items = [random.randint(0, 500) for _ in range(1000)]
+        tree = TreeSet(int, items)
+        check_red_black_tree(tree)
+        self.assertEqual(list(tree), sorted(set(items)),
+                         "Wrong values after bulk load")
+        self.assertFalse(TreeSet(int).add_all(items),
+                         "add_all must return False if there are duplicates")
+
+    def test_sorted(self):
+        """
+        Tests the bulk load with already sorted values.
+        """
+        tree = TreeSet(int)
+        self.assertTrue(tree.add_all(range(1000)),
+                        "add_all must return True if all values were added")
+        check_red_black_tree(tree)
+        self.assertEqual(tree.first(), 0, "Wrong first value")
+        self.assertEqual(tree.last(), 999, "Wrong last value")
+
+    def test_bulk_load_non_empty(self):
+        """
+        Tests the bulk load on a non-empty tree merges both sets of values.
+        """
+        tree = TreeSet(int, range(0, 100, 2))
+        self.assertEqual(tree.bulk_load(range(0, 100, 3)), 17,
+                         "Wrong number of inserted values")
+        check_red_black_tree(tree)
+        self.assertEqual(list(tree),
+                         sorted(set(range(0, 100, 2)) | set(range(0, 100, 3))),
+                         "Wrong values after bulk load")
+
+    def test_operations_after_bulk_load(self):
+        """
+        Tests that the tree can be modified after the bulk load.
+        """
+        items = list(range(0, 200, 2))
+        tree = TreeSet(int, items)
+        for item in range(1, 200, 4):
+            self.assertTrue(tree.add(item), "Wrong value after adding")
+            check_red_black_tree(tree)
+
+        for item in items[::3]:
+            self.assertTrue(tree.remove(item), "Wrong value after removing")
+            check_red_black_tree(tree)
+
+    def test_keeps_first_equal_value(self):
+        """
+        Tests that the first of two equal values is the one kept.
+        """
+        first = Person("First", 20)
+        tree = TreeSet(Person, [Person("Other", 30), first,
+                                Person("Last", 20)])
+        self.assertIs(tree.first(), first,
+                      "The first equal value must be kept")
+
+    def test_invalid_values(self):
+        """
+        Tests that no value is inserted if some of them is not valid.
+        """
+        tree = TreeSet(int)
+        with self.assertRaises(NullPointerException):
+            tree.bulk_load([1, 2, None])
+        with self.assertRaises(TypeError):
+            tree.bulk_load([1, 2, "3"])
+        self.assertTrue(tree.is_empty(), "TreeSet must be empty")
+
+        with self.assertRaises(ClassCastException):
+            TreeSet(Student).bulk_load([Student("Student1", 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
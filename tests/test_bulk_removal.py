@@ -0,0 +1,89 @@
+"""Implementation of the test class for the TreeSet bulk removals."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+
+class TestBulkRemoval(unittest.TestCase):
+    """Test the remove_all and retain_all methods of the TreeSet."""
+
+    def test_against_python_sets(self):
+        """
+        Tests both methods with small and large batches, which follow
+        different strategies, against the Python sets.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.sample(range(6000), 2000))
+            for batch_size in (0, 1, 10, 300, 1500, 4000):
+                batch = random.sample(range(-10, 6010), batch_size)
+                for method, expected in (("remove_all", items.difference),
+                                         ("retain_all", items.intersection)):
+                    tree = TreeSet(int, items, engine=engine)
+                    remaining = sorted(expected(batch))
+                    self.assertEqual(getattr(tree, method)(batch),
+                                     len(items) - len(remaining),
+                                     f"Wrong {method} count")
+                    check_tree(tree)
+                    self.assertEqual(list(tree), remaining,
+                                     f"Wrong {method} result")
+
+    def test_duplicates_and_tree_arguments(self):
+        """
+        Tests that repeated values are counted once and that another
+        TreeSet is accepted.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            self.assertEqual(tree.remove_all([5, 5, 5, 200]), 1,
+                             "Repeated values must be removed once")
+            self.assertEqual(tree.retain_all(TreeSet(int, range(50))), 50,
+                             "Wrong retained count")
+            self.assertEqual(tree.remove_all(tree.clone()), 49,
+                             "Every element must be removed")
+            self.assertTrue(tree.is_empty(), "Tree must be empty")
+            self.assertEqual(tree.retain_all([1]), 0,
+                             "Empty tree must not remove elements")
+
+    def test_cursor(self):
+        """
+        Tests that a cursor resynchronizes after a bulk removal.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            cursor = tree.cursor(10)
+            tree.remove_all([10, 11, 50])
+            self.assertEqual(cursor.get(), 12, "Cursor must move forward")
+
+    def test_key(self):
+        """
+        Tests the bulk removals with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        self.assertEqual(tree.remove_all([Person("Other", 3),
+                                          Person("Another", 30)]), 1,
+                         "Wrong removed count")
+        self.assertEqual(tree.retain_all([Person("Other", 4),
+                                          Person("Another", 5)]), 17,
+                         "Wrong retained count")
+        self.assertEqual(list(tree), people[4:6],
+                         "The elements of the TreeSet must be kept")
+
+    def test_invalid_values(self):
+        """
+        Tests that an invalid value removes no element.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            tree.remove_all([1, "2"])
+        with self.assertRaises(NullPointerException):
+            tree.retain_all([1, None])
+        self.assertEqual(list(tree), [1, 2, 3],
+                         "Failed removals must not modify the TreeSet")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""Implementation of the test class for the TreeSet clones."""
+import gc
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+
+MUTATIONS = (
+    ("add", lambda tree: tree.add(-1)),
+    ("remove", lambda tree: tree.remove(10)),
+    ("poll_first", lambda tree: tree.poll_first()),
+    ("poll_last", lambda tree: tree.poll_last()),
+    ("clear", lambda tree: tree.clear()),
+    ("update", lambda tree: tree.update([-2, 1000])),
+    ("difference_update", lambda tree: tree.difference_update([20, 30])),
+    ("intersection_update", lambda tree: tree.intersection_update([40])),
+    ("bulk_load", lambda tree: tree.bulk_load(range(500))),
+    ("remove_range", lambda tree: tree.remove_range(10, 50)),
+    ("remove_head", lambda tree: tree.remove_head(100)),
+    ("split", lambda tree: tree.split(50)),
+    ("cursor", lambda tree: tree.cursor(20).remove_here()),
+    ("cursor", lambda tree: tree.cursor(20).insert_near(21)),
+)
+
+
+class TestClone(unittest.TestCase):
+    """Test the structural and copy-on-write clones of the TreeSet."""
+
+    def test_structural_clone(self):
+        """
+        Tests that the clone keeps the elements, the class and the key, and
+        that it is independent from the original TreeSet.
+        """
+        for engine in TreeSet._ENGINES:
+            items = random.sample(range(1000), 300)
+            tree = TreeSet(int, items, engine=engine)
+            tree.remove(items[0])
+            clone = tree.clone()
+            check_tree(clone)
+            self.assertIs(type(clone), type(tree), "Wrong clone class")
+            self.assertEqual(list(clone), list(tree), "Wrong clone elements")
+
+            clone.add(-1)
+            tree.remove(items[1])
+            check_tree(tree)
+            check_tree(clone)
+            self.assertNotIn(-1, tree, "Original must not see the clone")
+            self.assertIn(items[1], clone, "Clone must not see the original")
+
+    def test_no_comparisons(self):
+        """
+        Tests that the structural clone does not compare the elements nor
+        compute their keys again.
+        """
+        calls = []
+
+        def number(counted: CountedNumber) -> int:
+            calls.append(counted)
+            return counted.number
+
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(CountedNumber, [CountedNumber(value) for value
+                                           in range(1000)], engine=engine)
+            keyed = TreeSet(CountedNumber, tree, engine=engine, key=number)
+            CountedNumber.comparisons = 0
+            calls.clear()
+            clones = [tree.clone(), keyed.clone()]
+            self.assertEqual(CountedNumber.comparisons, 0,
+                             "The clone must not compare the elements")
+            self.assertEqual(calls, [], "The clone must not compute keys")
+            self.assertIs(clones[1].key, number, "The key must be kept")
+            self.assertEqual(clones[1].get(500).number, 500,
+                             "The keys must be kept")
+
+    def test_copy_on_write(self):
+        """
+        Tests that every modification of a copy-on-write clone or of its
+        original leaves the other one unchanged.
+        """
+        for engine in TreeSet._ENGINES:
+            for name, mutate in MUTATIONS:
+                for mutate_clone in (False, True):
+                    tree = TreeSet(int, range(0, 200, 2), engine=engine)
+                    expected = list(tree)
+                    clone = tree.clone(copy_on_write=True)
+                    written, other = (clone, tree) if mutate_clone \
+                        else (tree, clone)
+                    mutate(written)
+                    check_tree(written)
+                    check_tree(other)
+                    self.assertEqual(list(other), expected,
+                                     f"{name} must not modify the other tree")
+                    other.add(-5)
+                    check_tree(other)
+                    self.assertNotIn(-5, written,
+                                     f"Trees must be independent after "
+                                     f"{name}")
+
+    def test_copy_on_write_copies(self):
+        """
+        Tests that the nodes are copied on the first write only while they
+        are shared.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            clones = [tree.clone(copy_on_write=True) for _ in range(3)]
+            epoch = tree._epoch()
+            tree.add(100)
+            self.assertNotEqual(tree._epoch(), epoch,
+                                "The shared nodes must be copied")
+            epoch = tree._epoch()
+            tree.add(101)
+            self.assertEqual(tree._epoch(), epoch, "Nodes must be copied once")
+
+            clones[0].add(-1)
+            clones[1].add(-2)
+            epoch = clones[2]._epoch()
+            clones[2].add(-3)
+            self.assertEqual(clones[2]._epoch(), epoch,
+                             "The last owner must not copy the nodes")
+            self.assertEqual([clone.first() for clone in clones],
+                             [-1, -2, -3], "Clones must be independent")
+
+            clone = tree.clone(copy_on_write=True)
+            del clone
+            gc.collect()
+            epoch = tree._epoch()
+            tree.add(102)
+            self.assertEqual(tree._epoch(), epoch,
+                             "Destroyed clones must release the nodes")
+
+    def test_cursor(self):
+        """
+        Tests that a cursor follows its tree when it copies the shared nodes.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            cursor = tree.cursor(50)
+            clone = tree.clone(copy_on_write=True)
+            self.assertTrue(cursor.insert_near(200), "Wrong insertion")
+            self.assertEqual(cursor.remove_here(), 200, "Wrong removal")
+            self.assertIsNone(cursor.get(), "Cursor must be off the tree")
+            self.assertEqual(cursor.seek(98), 98, "Wrong sought element")
+            self.assertEqual(len(tree), 100, "Wrong size")
+            self.assertNotIn(200, clone, "Clone must not be modified")
+
+    def test_key(self):
+        """
+        Tests the copy-on-write clones with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        clone = tree.clone(copy_on_write=True)
+        clone.remove(Person("Other", 5))
+        self.assertIs(tree.get(5), people[5], "Original must keep the value")
+        self.assertIsNone(clone.get(5), "Clone must remove the value")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Implementation of the test class for the comparisons made by the TreeSet."""
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import CountedNumber
+
+
+class TestComparisonsTreeSet(unittest.TestCase):
+    """
+    Test the number of comparisons made by the TreeSet operations. The trees
+    have 2 ** 10 - 1 values, so the bulk load builds a perfect tree where
+    every descent visits 10 nodes.
+    """
+
+    HEIGHT = 10
+
+    def setUp(self) -> None:
+        """
+        Sets up the test fixture before exercising it.
+        """
+        self.numbers = [CountedNumber(number)
+                        for number in range(0, 2 * (2 ** self.HEIGHT - 1), 2)]
+        self.missing = [CountedNumber(number)
+                        for number in range(-1, 2 * 2 ** self.HEIGHT, 2)]
+        self.trees = [TreeSet(CountedNumber, self.numbers, engine=engine)
+                      for engine in TreeSet._ENGINES]
+
+    def assert_comparisons(self, operation: str, values: list,
+                           expected: int) -> None:
+        """
+        Asserts that the given operation makes at most the expected number
+        of comparisons with every value on every tree.
+
+        :param operation: name of the TreeSet method
+        :param values: values to call the method with
+        :param expected: maximum number of comparisons per call
+        """
+        for tree in self.trees:
+            method = getattr(tree, operation)
+            for value in values:
+                CountedNumber.comparisons = 0
+                method(value)
+                self.assertLessEqual(
+                    CountedNumber.comparisons, expected,
+                    f"Too many comparisons made by {operation}({value})")
+
+    def test_contains(self):
+        """
+        Tests that contains makes one comparison per level plus one.
+        """
+        self.assert_comparisons("contains", self.numbers, self.HEIGHT + 1)
+        self.assert_comparisons("contains", self.missing, self.HEIGHT + 1)
+
+    def test_add_existing(self):
+        """
+        Tests that adding a contained value makes one comparison per level
+        plus one.
+        """
+        self.assert_comparisons("add", self.numbers, self.HEIGHT + 1)
+
+    def test_navigation(self):
+        """
+        Tests that the navigation methods make one comparison per level.
+        """
+        for operation in ("higher", "lower", "ceiling", "floor"):
+            self.assert_comparisons(operation, self.numbers, self.HEIGHT)
+            self.assert_comparisons(operation, self.missing, self.HEIGHT)
+
+    def test_results(self):
+        """
+        Tests the results of the operations.
+        """
+        for tree in self.trees:
+            for index, number in enumerate(self.numbers):
+                self.assertTrue(tree.contains(number), "Wrong contains value")
+                self.assertFalse(tree.contains(self.missing[index]),
+                                 "Wrong contains value")
+                self.assertIs(tree.ceiling(self.missing[index]), number,
+                              "Wrong ceiling value")
+                self.assertIs(tree.floor(self.missing[index + 1]), number,
+                              "Wrong floor value")
+                self.assertIs(tree.ceiling(number), number,
+                              "Wrong ceiling value")
+                self.assertIs(tree.floor(number), number, "Wrong floor value")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+"""Implementation of the test class for the ConcurrentTreeSet."""
+import random
+import sys
+import threading
+import unittest
+from concurrent_tree_set import ConcurrentTreeSet, ReadWriteLock
+from persistent_tree_set import PersistentTreeSet
+from tree_set import RedBlackTree, TreeSet
+from tests.tree_invariants import check_red_black_tree, check_tree
+
+THREADS = 4
+RANGE = 500
+
+
+class TestConcurrentTreeSet(unittest.TestCase):
+    """Test the ConcurrentTreeSet under many threads."""
+
+    def setUp(self):
+        """Switches between the threads as often as possible."""
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        """Restores the switch interval of the threads."""
+        sys.setswitchinterval(self.interval)
+
+    def run_threads(self, targets) -> None:
+        """
+        Runs every given function in its own thread and raises the first
+        error found by any of them.
+        """
+        errors = []
+
+        def run(target):
+            try:
+                target()
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(target,))
+                   for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_stress(self):
+        """
+        Tests writers that modify disjoint ranges of a shared set while
+        readers query and iterate it, checking that the readers always see a
+        valid tree and that no update is lost.
+        """
+        for engine in TreeSet._ENGINES:
+            shared = ConcurrentTreeSet(int, engine=engine)
+            expected = [set() for _ in range(THREADS)]
+            done = threading.Event()
+
+            def writer(index):
+                items = expected[index]
+                low = index * RANGE
+                for _ in range(1500):
+                    value = random.randrange(low, low + RANGE)
+                    if random.random() < 0.6:
+                        self.assertEqual(shared.add(value),
+                                         value not in items)
+                        items.add(value)
+                    elif random.random() < 0.95:
+                        self.assertEqual(shared.remove(value), value in items)
+                        items.discard(value)
+                    else:
+                        start = random.randrange(low, low + RANGE)
+                        end = min(start + 20, low + RANGE)
+                        shared.remove_range(start, end)
+                        items.difference_update(range(start, end))
+
+            def reader():
+                while not done.is_set():
+                    values = list(shared)
+                    self.assertEqual(values, sorted(set(values)))
+                    value = random.randrange(THREADS * RANGE)
+                    floor = shared.floor(value)
+                    self.assertTrue(floor is None or floor <= value)
+                    shared.contains(value)
+                    with shared.reading() as tree:
+                        check_tree(tree)
+
+            def writers():
+                try:
+                    self.run_threads([lambda index=index: writer(index)
+                                      for index in range(THREADS)])
+                finally:
+                    done.set()
+
+            self.run_threads([writers] + [reader] * THREADS)
+            self.assertEqual(list(shared), sorted(set().union(*expected)),
+                             "No update must be lost")
+            with shared.reading() as tree:
+                check_tree(tree)
+
+    def test_shared_leaf(self):
+        """
+        Tests that plain trees modified by different threads do not write
+        the null leaf that they share.
+        """
+        trees = [TreeSet(int, range(2000)) for _ in range(THREADS)]
+
+        def churn(tree):
+            for _ in range(3000):
+                value = random.randrange(2000)
+                if not tree.remove(value):
+                    tree.add(value)
+
+        self.run_threads([lambda tree=tree: churn(tree) for tree in trees])
+        for tree in trees:
+            check_red_black_tree(tree)
+        null = RedBlackTree._NULL
+        self.assertIsNone(null.parent, "The leaf must not have a parent")
+        with self.assertRaises(AttributeError):
+            null.parent = trees[0]._RedBlackTree__root
+
+    def test_read_write_lock(self):
+        """
+        Tests that many readers hold the lock together and that a writer
+        waits for them and makes the new readers wait.
+        """
+        lock = ReadWriteLock()
+        lock.acquire_read()
+        lock.acquire_read()
+        written = threading.Event()
+
+        def write():
+            lock.acquire_write()
+            written.set()
+            lock.release_write()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        self.assertFalse(written.wait(0.05), "Writer must wait the readers")
+        lock.release_read()
+        self.assertFalse(written.wait(0.05), "Writer must wait the readers")
+        lock.release_read()
+        self.assertTrue(written.wait(5), "Writer must acquire the lock")
+        writer.join()
+
+        lock.acquire_write()
+        read = threading.Event()
+        reader = threading.Thread(
+            target=lambda: (lock.acquire_read(), read.set(),
+                            lock.release_read()))
+        reader.start()
+        self.assertFalse(read.wait(0.05), "Reader must wait the writer")
+        lock.release_write()
+        self.assertTrue(read.wait(5), "Reader must acquire the lock")
+        reader.join()
+
+    def test_api(self):
+        """
+        Tests the methods of the ConcurrentTreeSet in a single thread.
+        """
+        shared = ConcurrentTreeSet(int, range(10), engine="array")
+        iterator = iter(shared)
+        self.assertTrue(shared.add(10), "Wrong insertion")
+        self.assertEqual(list(iterator), list(range(10)),
+                         "The iterator must not see the later changes")
+        self.assertEqual(shared.floor(20), 10, "Wrong floor")
+        self.assertEqual(shared.remove_head(5), 5, "Wrong range removal")
+        self.assertEqual(len(shared), 6, "Wrong size")
+        self.assertIn(7, shared, "Value must be contained")
+        self.assertEqual(list(reversed(shared)), list(range(10, 4, -1)),
+                         "Wrong descending order")
+
+        other = ConcurrentTreeSet(int, range(5, 11))
+        self.assertEqual(shared, other, "Sets must be equal")
+        self.assertTrue(shared.issubset(other), "Wrong subset")
+        shared.update(other)
+        self.assertEqual(str(shared.union(other)), str(list(range(5, 11))),
+                         "Wrong union")
+        clone = shared.clone()
+        clone.add(100)
+        self.assertNotIn(100, shared, "The clone must be independent")
+        with shared.writing() as tree:
+            tree.poll_first()
+            tree.poll_last()
+        self.assertEqual(shared.first(), 6, "Wrong first element")
+        self.assertEqual(shared.add.__doc__, TreeSet.add.__doc__,
+                         "The documentation must be the TreeSet one")
+
+    def test_operators(self):
+        """
+        Tests the operators of the ConcurrentTreeSet, which accept TreeSets
+        and other ConcurrentTreeSets.
+        """
+        shared = ConcurrentTreeSet(int, range(5))
+        other = ConcurrentTreeSet(int, range(3, 8))
+        tree = TreeSet(int, range(3, 8))
+        self.assertEqual(list(shared | other), list(range(8)), "Wrong union")
+        self.assertEqual(list(shared & tree), [3, 4], "Wrong intersection")
+        self.assertEqual(list(shared - other), [0, 1, 2], "Wrong difference")
+        self.assertEqual(list(shared ^ tree), [0, 1, 2, 5, 6, 7],
+                         "Wrong symmetric difference")
+        self.assertTrue(ConcurrentTreeSet(int, [3, 4]) < other,
+                        "Wrong proper subset")
+        self.assertTrue(shared <= shared.clone(), "Wrong subset")
+        self.assertFalse(shared > tree, "Wrong proper superset")
+        self.assertTrue(other >= tree, "Wrong superset")
+        with self.assertRaises(TypeError):
+            shared | [1, 2]
+
+        original = shared
+        shared |= other
+        shared &= tree
+        shared -= ConcurrentTreeSet(int, [7])
+        shared ^= TreeSet(int, [0])
+        self.assertIs(shared, original, "In-place operators must keep it")
+        self.assertEqual(list(shared), [0, 3, 4, 5, 6], "Wrong elements")
+        self.assertEqual(list(shared.iter_from(4, reverse=True)), [4, 3, 0],
+                         "Wrong iteration from an element")
+
+        version = PersistentTreeSet(int, [0, 3, 4, 5, 6])
+        self.assertTrue(version == shared and shared == version,
+                        "Equality must be symmetric")
+
+    def test_keyword_sets(self):
+        """
+        Tests that a ConcurrentTreeSet given by keyword is copied before
+        holding the lock, so two sets updated with each other in opposite
+        orders do not deadlock.
+        """
+        first = ConcurrentTreeSet(int, range(0, 200, 2))
+        second = ConcurrentTreeSet(int, range(1, 200, 2))
+
+        def update(target, source):
+            for _ in range(300):
+                target.add_all(values=source)
+                target.update(other=source)
+
+        threads = [threading.Thread(target=update, args=(first, second),
+                                    daemon=True),
+                   threading.Thread(target=update, args=(second, first),
+                                    daemon=True)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertFalse(any(thread.is_alive() for thread in threads),
+                         "The sets must not deadlock")
+        self.assertEqual(first, second, "Both sets must have every element")
+
+
+if __name__ == '__main__':
+    unittest.main()
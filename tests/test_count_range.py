@@ -0,0 +1,103 @@
+"""Implementation of the test class for the TreeSet range counting."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tree_set_exceptions import NullPointerException
+
+INCLUSIVE = ((True, True), (True, False), (False, True), (False, False))
+
+
+def brute_force_count(items, low, high, inclusive) -> int:
+    """Counts the items between the bounds one by one."""
+    return sum(1 for item in items
+               if (low < item or (inclusive[0] and item == low))
+               and (item < high or (inclusive[1] and item == high)))
+
+
+class TestCountRange(unittest.TestCase):
+    """Test the count_range method of the TreeSet."""
+
+    def test_against_brute_force(self):
+        """
+        Tests count_range against a brute-force count with random bounds.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.randint(0, 1000) for _ in range(400))
+            tree = TreeSet(int, items, engine=engine)
+            for _ in range(200):
+                low = random.randint(-20, 1020)
+                high = random.randint(-20, 1020)
+                for inclusive in INCLUSIVE:
+                    self.assertEqual(
+                        tree.count_range(low, high, inclusive),
+                        brute_force_count(items, low, high, inclusive),
+                        f"Wrong count between {low} and {high}")
+
+    def test_after_updates(self):
+        """
+        Tests count_range after random insertions and deletions.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, engine=engine)
+            items = set()
+            for _ in range(1000):
+                item = random.randint(0, 200)
+                if random.random() < 0.6:
+                    tree.add(item)
+                    items.add(item)
+                else:
+                    tree.remove(item)
+                    items.discard(item)
+
+                low, high = sorted(random.sample(range(-5, 205), 2))
+                self.assertEqual(tree.count_range(low, high),
+                                 brute_force_count(items, low, high,
+                                                   (True, False)),
+                                 "Wrong count after updates")
+
+    def test_bounds(self):
+        """
+        Tests count_range with equal, reversed and invalid bounds.
+        """
+        tree = TreeSet(int, range(10))
+        self.assertEqual(tree.count_range(0, 10), 10, "Wrong count")
+        self.assertEqual(tree.count_range(3, 3), 0, "Wrong empty count")
+        self.assertEqual(tree.count_range(3, 3, (True, True)), 1,
+                         "Wrong single count")
+        self.assertEqual(tree.count_range(8, 2), 0, "Reversed bounds count 0")
+        self.assertEqual(TreeSet(int).count_range(0, 10), 0,
+                         "Empty TreeSet count must be 0")
+        with self.assertRaises(NullPointerException):
+            tree.count_range(None, 3)
+        with self.assertRaises(TypeError):
+            tree.count_range(1, "3")
+
+    def test_key(self):
+        """
+        Tests count_range with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(50)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        self.assertEqual(tree.count_range(Person("Low", 10),
+                                          Person("High", 20)), 10,
+                         "Wrong count with key")
+
+    def test_logarithmic(self):
+        """
+        Tests that count_range makes two descents, whatever the range size.
+        """
+        height = 10
+        tree = TreeSet(CountedNumber,
+                       [CountedNumber(number)
+                        for number in range(2 ** height - 1)])
+        CountedNumber.comparisons = 0
+        self.assertEqual(tree.count_range(CountedNumber(0),
+                                          CountedNumber(1000)), 1000,
+                         "Wrong count")
+        self.assertLessEqual(CountedNumber.comparisons, 2 * height,
+                             "count_range must make two descents")
+
+
+if __name__ == '__main__':
+    unittest.main()
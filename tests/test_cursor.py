@@ -0,0 +1,163 @@
+"""Implementation of the test class for the TreeSet cursors."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NoSuchElementException, NullPointerException
+
+
+class TestCursor(unittest.TestCase):
+    """Test the cursor of the TreeSet."""
+
+    def test_moves(self):
+        """
+        Tests the position of a cursor moving through the TreeSet.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(0, 100, 10), engine=engine)
+            cursor = tree.cursor()
+            self.assertEqual(cursor.get(), 0, "Cursor must start at first")
+            self.assertEqual(cursor.next(), 10, "Wrong next element")
+            self.assertEqual(cursor.seek(55), 60, "Wrong sought element")
+            self.assertEqual(cursor.seek(20), 20, "Wrong backward seek")
+            self.assertEqual(cursor.prev(), 10, "Wrong previous element")
+            self.assertIsNone(cursor.seek(95), "Seek past the end must fail")
+            self.assertIsNone(cursor.get(), "Cursor must be off the tree")
+            self.assertIsNone(cursor.next(), "Cursor must stay off the tree")
+            self.assertEqual(cursor.seek(-5), 0, "Seek must restart off tree")
+            self.assertIsNone(cursor.prev(), "Cursor must move off the start")
+
+            self.assertEqual(tree.cursor(35).get(), 40,
+                             "Cursor must start at the ceiling")
+            self.assertIsNone(TreeSet(int, engine=engine).cursor().get(),
+                              "Cursor of an empty TreeSet must be off")
+
+    def test_walk(self):
+        """
+        Tests walking the whole TreeSet in both directions.
+        """
+        for engine in TreeSet._ENGINES:
+            items = sorted(random.sample(range(1000), 200))
+            tree = TreeSet(int, items, engine=engine)
+            cursor = tree.cursor()
+            seen = [cursor.get()]
+            while (value := cursor.next()) is not None:
+                seen.append(value)
+            self.assertEqual(seen, items, "Wrong ascending walk")
+
+            seen = [cursor.seek(tree.last())]
+            while (value := cursor.prev()) is not None:
+                seen.append(value)
+            self.assertEqual(seen, items[::-1], "Wrong descending walk")
+
+    def test_against_set(self):
+        """
+        Tests random cursor operations against a Python set.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.sample(range(2000), 300))
+            tree = TreeSet(int, items, engine=engine)
+            cursor = tree.cursor()
+            for _ in range(1000):
+                value = random.randint(-10, 2010)
+                operation = random.random()
+                if operation < 0.3:
+                    expected = min((item for item in items if item >= value),
+                                   default=None)
+                    self.assertEqual(cursor.seek(value), expected,
+                                     "Wrong sought element")
+                elif operation < 0.6:
+                    self.assertEqual(cursor.insert_near(value),
+                                     value not in items,
+                                     "Wrong insertion result")
+                    items.add(value)
+                    self.assertEqual(cursor.get(), value,
+                                     "Cursor must move to the element")
+                elif cursor.get() is None:
+                    with self.assertRaises(NoSuchElementException):
+                        cursor.remove_here()
+                else:
+                    current = cursor.get()
+                    self.assertEqual(cursor.remove_here(), current,
+                                     "Wrong removed element")
+                    items.remove(current)
+                    self.assertEqual(cursor.get(), min(
+                        (item for item in items if item > current),
+                        default=None), "Cursor must move to the next")
+            check_tree(tree)
+            self.assertEqual(list(tree), sorted(items), "Wrong elements")
+
+    def test_external_changes(self):
+        """
+        Tests that the cursor resynchronizes after the TreeSet is modified.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(10), engine=engine)
+            cursor = tree.cursor(5)
+            tree.add(20)
+            self.assertEqual(cursor.next(), 6,
+                             "Insertions must keep the position")
+            tree.remove(6)
+            self.assertEqual(cursor.get(), 7,
+                             "Cursor must move past a removed element")
+            tree.remove(3)
+            self.assertEqual(cursor.prev(), 5, "Wrong element after removal")
+            tree.clear()
+            self.assertIsNone(cursor.get(), "Cleared tree has no elements")
+            tree.update(range(5))
+            self.assertEqual(cursor.seek(2), 2, "Wrong element after update")
+
+    def test_nearby_comparisons(self):
+        """
+        Tests that the operations near the position compare few keys.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(CountedNumber, [CountedNumber(number) for number
+                                           in range(0, 100_000, 2)],
+                           engine=engine)
+            cursor = tree.cursor(CountedNumber(50_000))
+            CountedNumber.comparisons = 0
+            for number in range(50_002, 50_202, 2):
+                cursor.seek(CountedNumber(number))
+            self.assertLess(CountedNumber.comparisons, 600,
+                            "Seeking the next element must be O(1)")
+
+            CountedNumber.comparisons = 0
+            for number in range(50_201, 50_401, 2):
+                cursor.insert_near(CountedNumber(number))
+            self.assertLess(CountedNumber.comparisons, 800,
+                            "Inserting near the position must be O(1)")
+            check_tree(tree)
+
+    def test_key(self):
+        """
+        Tests the cursor with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(0, 20, 2)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        cursor = tree.cursor(Person("Anyone", 5))
+        self.assertIs(cursor.get(), people[3], "Wrong element by key")
+        self.assertFalse(cursor.insert_near(Person("Other", 6)),
+                         "Equal key must not be inserted")
+        self.assertTrue(cursor.insert_near(Person("New", 7)),
+                        "New key must be inserted")
+        self.assertEqual(cursor.next().age, 8, "Wrong next element")
+
+    def test_invalid_values(self):
+        """
+        Tests that the cursor validates the given elements.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        cursor = tree.cursor()
+        with self.assertRaises(TypeError):
+            cursor.seek("1")
+        with self.assertRaises(NullPointerException):
+            cursor.insert_near(None)
+        with self.assertRaises(TypeError):
+            tree.cursor("1")
+        self.assertEqual(cursor.get(), 1, "Failed seeks must not move")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Implementation of the test class for the cached first and last nodes."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NoSuchElementException
+
+
+class TestFirstLast(unittest.TestCase):
+    """Test the first, last and poll methods of the TreeSet."""
+
+    def test_after_updates(self):
+        """
+        Tests first and last after random insertions, deletions and polls.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, engine=engine)
+            items = set()
+            for _ in range(2000):
+                operation = random.random()
+                item = random.randint(0, 300)
+                if operation < 0.5:
+                    tree.add(item)
+                    items.add(item)
+                elif operation < 0.8:
+                    tree.remove(item)
+                    items.discard(item)
+                elif operation < 0.9:
+                    expected = min(items) if items else None
+                    self.assertEqual(tree.poll_first(), expected,
+                                     "Wrong polled first element")
+                    items.discard(expected)
+                else:
+                    expected = max(items) if items else None
+                    self.assertEqual(tree.poll_last(), expected,
+                                     "Wrong polled last element")
+                    items.discard(expected)
+
+                check_tree(tree)
+                if items:
+                    self.assertEqual(tree.first(), min(items),
+                                     "Wrong first element")
+                    self.assertEqual(tree.last(), max(items),
+                                     "Wrong last element")
+
+    def test_priority_queue(self):
+        """
+        Tests that polling every element returns them in order.
+        """
+        for engine in TreeSet._ENGINES:
+            items = random.sample(range(10000), 1000)
+            tree = TreeSet(int, items, engine=engine)
+            polled = [tree.poll_first() for _ in range(500)]
+            polled += reversed([tree.poll_last() for _ in range(500)])
+            self.assertEqual(polled, sorted(items),
+                             "Polls must return the elements in order")
+            self.assertTrue(tree.is_empty(), "Every element must be polled")
+            check_tree(tree)
+
+    def test_empty(self):
+        """
+        Tests first, last and the polls on an empty TreeSet.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, [1], engine=engine)
+            self.assertEqual(tree.poll_last(), 1, "Wrong polled element")
+            self.assertIsNone(tree.poll_first(), "Empty poll must be None")
+            self.assertIsNone(tree.poll_last(), "Empty poll must be None")
+            with self.assertRaises(NoSuchElementException):
+                tree.first()
+            with self.assertRaises(NoSuchElementException):
+                tree.last()
+
+    def test_bulk_operations(self):
+        """
+        Tests first and last after bulk loads, set operations and splits.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100, 200), engine=engine)
+            tree.bulk_load([50, 300])
+            self.assertEqual((tree.first(), tree.last()), (50, 300),
+                             "Wrong ends after bulk load")
+            tree.update([10])
+            tree.difference_update([300])
+            self.assertEqual((tree.first(), tree.last()), (10, 199),
+                             "Wrong ends after set operations")
+            lower, _, higher = tree.split(150)
+            self.assertEqual((lower.last(), higher.first()), (149, 151),
+                             "Wrong ends after split")
+            joined = TreeSet.join(lower, None, higher)
+            self.assertEqual((joined.first(), joined.last()), (10, 199),
+                             "Wrong ends after join")
+            tree.clear()
+            self.assertIsNone(tree.poll_first(), "Cleared poll must be None")
+
+    def test_no_comparisons(self):
+        """
+        Tests that first, last and the polls make no comparison.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(CountedNumber,
+                           [CountedNumber(number) for number in range(100)],
+                           engine=engine)
+            CountedNumber.comparisons = 0
+            self.assertEqual(tree.first().number, 0, "Wrong first element")
+            self.assertEqual(tree.last().number, 99, "Wrong last element")
+            self.assertEqual(tree.poll_first().number, 0, "Wrong poll")
+            self.assertEqual(tree.poll_last().number, 99, "Wrong poll")
+            self.assertEqual(CountedNumber.comparisons, 0,
+                             "The ends must be found without comparisons")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Implementation of the test class for the TreeSet seekable iterators."""
+import random
+import unittest
+from itertools import islice
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tree_set_exceptions import NullPointerException
+
+
+class TestIterFrom(unittest.TestCase):
+    """Test the iter_from method of the TreeSet."""
+
+    def test_against_filter(self):
+        """
+        Tests iter_from in both directions against a filter of the elements.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.sample(range(1000), 300))
+            tree = TreeSet(int, items, engine=engine)
+            for value in random.sample(range(-5, 1005), 50):
+                self.assertEqual(list(tree.iter_from(value)),
+                                 sorted(item for item in items
+                                        if item >= value),
+                                 "Wrong inclusive iteration")
+                self.assertEqual(list(tree.iter_from(value, False)),
+                                 sorted(item for item in items
+                                        if item > value),
+                                 "Wrong exclusive iteration")
+                self.assertEqual(list(tree.iter_from(value, reverse=True)),
+                                 sorted((item for item in items
+                                         if item <= value), reverse=True),
+                                 "Wrong inclusive reversed iteration")
+                self.assertEqual(list(tree.iter_from(value, False, True)),
+                                 sorted((item for item in items
+                                         if item < value), reverse=True),
+                                 "Wrong exclusive reversed iteration")
+
+    def test_pagination(self):
+        """
+        Tests paginating the TreeSet resuming after the last seen element.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(0, 1000, 3), engine=engine)
+            for reverse in (False, True):
+                pages = [list(islice(tree.iter_from(
+                    tree.last() if reverse else tree.first(),
+                    reverse=reverse), 10))]
+                while pages[-1]:
+                    pages.append(list(islice(tree.iter_from(
+                        pages[-1][-1], False, reverse), 10)))
+
+                seen = [item for page in pages for item in page]
+                self.assertEqual(seen, list(reversed(tree)) if reverse
+                                 else list(tree), "Pages must cover the set")
+
+    def test_key(self):
+        """
+        Tests iter_from with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        self.assertEqual(list(tree.iter_from(Person("Other", 15))),
+                         people[15:], "Wrong iteration with key")
+
+    def test_invalid_values(self):
+        """
+        Tests that iter_from validates the value before iterating.
+        """
+        tree = TreeSet(int, range(10))
+        with self.assertRaises(NullPointerException):
+            tree.iter_from(None)
+        with self.assertRaises(TypeError):
+            tree.iter_from("1")
+
+    def test_logarithmic(self):
+        """
+        Tests that iter_from seeks the first element with one descent.
+        """
+        height = 10
+        tree = TreeSet(CountedNumber,
+                       [CountedNumber(number)
+                        for number in range(2 ** height - 1)])
+        CountedNumber.comparisons = 0
+        iterator = tree.iter_from(CountedNumber(900))
+        self.assertEqual(next(iterator).number, 900, "Wrong first element")
+        self.assertLessEqual(CountedNumber.comparisons, height + 2,
+                             "The first element must be sought in one descent")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""Implementation of the test class for the TreeSet iteration."""
+import random
+import unittest
+from data_utils import SimpleStack
+from tree_set import RedBlackTree, TreeSet
+from tests.tests_classes import *
+
+
+class TestIteration(unittest.TestCase):
+    """Test the in-order and reversed iteration of the trees."""
+
+    def test_after_updates(self):
+        """
+        Tests both iteration orders after random insertions and deletions.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, engine=engine)
+            items = set()
+            for _ in range(500):
+                item = random.randint(0, 200)
+                if random.random() < 0.6:
+                    tree.add(item)
+                    items.add(item)
+                else:
+                    tree.remove(item)
+                    items.discard(item)
+
+                self.assertEqual(list(tree), sorted(items),
+                                 "Wrong ascending iteration")
+                self.assertEqual(list(reversed(tree)),
+                                 sorted(items, reverse=True),
+                                 "Wrong descending iteration")
+
+    def test_iterators(self):
+        """
+        Tests the iterators of empty, single and interleaved iterations.
+        """
+        for engine in TreeSet._ENGINES:
+            self.assertEqual(list(TreeSet(int, engine=engine)), [],
+                             "Empty iteration must yield nothing")
+            tree = TreeSet(int, [7], engine=engine)
+            self.assertEqual(list(tree.descending_iterator()), [7],
+                             "Wrong single iteration")
+
+            tree = TreeSet(int, range(100), engine=engine)
+            ascending, descending = tree.iterator(), tree.descending_iterator()
+            pairs = list(zip(ascending, descending))
+            self.assertEqual(pairs, [(number, 99 - number)
+                                     for number in range(100)],
+                             "Iterations must be independent")
+
+    def test_red_black_tree(self):
+        """
+        Tests the iteration of a plain RedBlackTree.
+        """
+        tree = RedBlackTree(int)
+        items = random.sample(range(1000), 300)
+        for item in items:
+            tree.add(item)
+        self.assertEqual(list(tree), sorted(items), "Wrong iteration")
+        self.assertEqual(list(reversed(tree)), sorted(items, reverse=True),
+                         "Wrong reversed iteration")
+
+    def test_stackless(self):
+        """
+        Tests that the iteration does not push the nodes into a stack.
+        """
+        push = SimpleStack.push
+
+        def fail(stack, item):
+            raise AssertionError("The iteration must not use a stack")
+
+        SimpleStack.push = fail
+        try:
+            tree = TreeSet(int, range(100))
+            self.assertEqual(list(tree), list(range(100)), "Wrong iteration")
+            self.assertEqual(str(tree), str(list(range(100))),
+                             "Wrong string representation")
+        finally:
+            SimpleStack.push = push
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,191 @@
+"""Implementation of the test class for the TreeSet with a key function."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import ClassCastException, NullPointerException
+
+
+class CountedKey:
+    """Key function that counts how many times it is called."""
+
+    def __init__(self, function):
+        self.function = function
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return self.function(value)
+
+
+class Ticket:
+    """Class without comparison methods, identified by its number."""
+
+    def __init__(self, number):
+        self.number = number
+
+
+class TestKeyTreeSet(unittest.TestCase):
+    """Test the TreeSet ordered by a key function."""
+
+    def test_order_by_key(self):
+        """
+        Tests that the elements are ordered by their keys.
+        """
+        for engine in TreeSet._ENGINES:
+            people = [Person(f"Person{age}", age) for age in range(50)]
+            random.shuffle(people)
+            tree = TreeSet(Person, people, engine=engine,
+                           key=lambda person: -person.age)
+            check_tree(tree)
+            self.assertEqual([person.age for person in tree],
+                             list(range(49, -1, -1)), "Wrong order")
+            self.assertEqual(tree.first().age, 49, "Wrong first element")
+            self.assertEqual(tree.last().age, 0, "Wrong last element")
+
+    def test_not_comparable_type(self):
+        """
+        Tests that the elements do not need to be comparable if the keys are.
+        """
+        for engine in TreeSet._ENGINES:
+            tickets = [Ticket(number) for number in range(20)]
+            tree = TreeSet(Ticket, tickets[::-1], engine=engine,
+                           key=lambda ticket: ticket.number)
+            self.assertEqual(list(tree), tickets, "Wrong order")
+            self.assertIn(tickets[5], tree, "Ticket must be contained")
+            with self.assertRaises(ClassCastException):
+                TreeSet(Ticket, tickets, engine=engine,
+                        key=lambda ticket: object())
+
+        self.assertNotIn("__gt__", vars(Ticket),
+                         "The element class must not be patched")
+
+    def test_duplicated_keys(self):
+        """
+        Tests that an element is not added if its key is already contained.
+        """
+        for engine in TreeSet._ENGINES:
+            first = Student("First", 1)
+            tree = TreeSet(Student, [first, Student("Other", 1)],
+                           engine=engine, key=lambda student: student.id)
+            self.assertEqual(tree.size(), 1, "Wrong size")
+            self.assertIs(tree.get(1), first, "The first element must be kept")
+            self.assertFalse(tree.add(Student("Another", 1)),
+                             "Duplicated key must not be added")
+            self.assertTrue(tree.remove(Student("Another", 1)),
+                            "Element with equal key must be removed")
+            self.assertTrue(tree.is_empty(), "TreeSet must be empty")
+
+    def test_get(self):
+        """
+        Tests the lookups with a raw key.
+        """
+        for engine in TreeSet._ENGINES:
+            people = [Person(f"Person{age}", age) for age in range(0, 20, 2)]
+            tree = TreeSet(Person, people, engine=engine,
+                           key=lambda person: person.age)
+            for person in people:
+                self.assertIs(tree.get(person.age), person, "Wrong element")
+                self.assertTrue(tree.contains_key(person.age),
+                                "Key must be contained")
+
+            self.assertIsNone(tree.get(3), "Key must not be found")
+            self.assertFalse(tree.contains_key(3), "Key must not be contained")
+            with self.assertRaises(NullPointerException):
+                tree.get(None)
+
+            self.assertIs(TreeSet(int, [1, 2], engine=engine).get(2), 2,
+                          "Without key function the key is the element")
+
+    def test_navigation(self):
+        """
+        Tests higher, lower, ceiling and floor with a key function.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(Student, [Student(str(id), id) for id in
+                                     range(0, 20, 2)],
+                           engine=engine, key=lambda student: student.id)
+            probe = Student("Probe", 6)
+            self.assertEqual(tree.higher(probe).id, 8, "Wrong higher")
+            self.assertEqual(tree.lower(probe).id, 4, "Wrong lower")
+            self.assertEqual(tree.ceiling(probe).id, 6, "Wrong ceiling")
+            self.assertEqual(tree.floor(probe).id, 6, "Wrong floor")
+            probe = Student("Probe", 7)
+            self.assertEqual(tree.ceiling(probe).id, 8, "Wrong ceiling")
+            self.assertEqual(tree.floor(probe).id, 6, "Wrong floor")
+            self.assertIsNone(tree.higher(Student("Probe", 18)),
+                              "Wrong higher")
+
+    def test_key_computed_once(self):
+        """
+        Tests that the key of every element is computed once per operation.
+        """
+        for engine in TreeSet._ENGINES:
+            key = CountedKey(lambda person: person.age)
+            tree = TreeSet(Person, engine=engine, key=key)
+            tree.add(Person("Person0", 0))
+            self.assertEqual(key.calls, 2, "The first key is also validated")
+
+            key.calls = 0
+            for age in range(1, 100):
+                tree.add(Person(f"Person{age}", age))
+            self.assertEqual(key.calls, 99, "One key per insertion")
+
+            key.calls = 0
+            self.assertIn(Person("Probe", 50), tree, "Wrong contains")
+            tree.ceiling(Person("Probe", 50))
+            tree.get(50)
+            self.assertEqual(key.calls, 2, "One key per lookup")
+
+            key.calls = 0
+            tree.clear()
+            tree.bulk_load([Person(str(age), age)
+                            for age in range(99, -1, -1)])
+            self.assertEqual(key.calls, 100, "One key per bulk element")
+
+    def test_random_operations(self):
+        """
+        Tests random operations against a dictionary indexed by key.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(Person, engine=engine,
+                           key=lambda person: person.age)
+            items = {}
+            for _ in range(1500):
+                age = random.randint(0, 200)
+                if random.random() < 0.6:
+                    person = Person(f"Person{age}", age)
+                    self.assertEqual(tree.add(person), age not in items,
+                                     "Wrong value after adding")
+                    items.setdefault(age, person)
+                else:
+                    self.assertEqual(tree.remove(Person("", age)),
+                                     age in items,
+                                     "Wrong value after removing")
+                    items.pop(age, None)
+
+            check_tree(tree)
+            self.assertEqual(list(tree), [items[age] for age in sorted(items)],
+                             "Wrong elements")
+            tree.bulk_load([Person("", age) for age in range(0, 300, 7)])
+            check_tree(tree)
+            self.assertEqual([person.age for person in tree],
+                             sorted(set(items) | set(range(0, 300, 7))),
+                             "Wrong elements after bulk load")
+
+    def test_clone(self):
+        """
+        Tests that the clone keeps the key function.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(Student, [Student("A", 2), Student("B", 1)],
+                           engine=engine, key=lambda student: student.id)
+            clone = tree.clone()
+            self.assertIs(clone.key, tree.key, "Clone must keep the key")
+            self.assertEqual(list(clone), list(tree), "Wrong clone elements")
+            self.assertIsNone(TreeSet(int).key, "Default key must be None")
+
+
+if __name__ == '__main__':
+    unittest.main()
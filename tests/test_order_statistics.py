@@ -0,0 +1,106 @@
+"""Implementation of the test class for the TreeSet rank and select."""
+import bisect
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+
+class TestOrderStatistics(unittest.TestCase):
+    """Test the rank, select and indexing of the TreeSet."""
+
+    def test_select(self):
+        """
+        Tests select and indexing against the sorted list of values.
+        """
+        for engine in TreeSet._ENGINES:
+            items = sorted(set(random.randint(0, 5000) for _ in range(500)))
+            tree = TreeSet(int, items, engine=engine)
+            for index, item in enumerate(items):
+                self.assertEqual(tree.select(index), item, "Wrong select")
+                self.assertEqual(tree[index], item, "Wrong index")
+                self.assertEqual(tree[index - len(items)], item,
+                                 "Wrong negative index")
+
+    def test_rank(self):
+        """
+        Tests rank with contained and missing values.
+        """
+        for engine in TreeSet._ENGINES:
+            items = list(range(0, 200, 2))
+            tree = TreeSet(int, items, engine=engine)
+            for item in range(-1, 201):
+                self.assertEqual(tree.rank(item),
+                                 bisect.bisect_left(items, item),
+                                 "Wrong rank")
+
+            with self.assertRaises(NullPointerException):
+                tree.rank(None)
+            with self.assertRaises(TypeError):
+                tree.rank("1")
+
+    def test_index_errors(self):
+        """
+        Tests the out of range and not integer indexes.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, [1, 2, 3], engine=engine)
+            for index in (3, -4, 100):
+                with self.assertRaises(IndexError):
+                    tree[index]
+            for index in (3, -1):
+                with self.assertRaises(IndexError):
+                    tree.select(index)
+            with self.assertRaises(TypeError):
+                tree["1"]
+            with self.assertRaises(IndexError):
+                TreeSet(int, engine=engine)[0]
+
+    def test_random_operations(self):
+        """
+        Tests that the subtree sizes are kept after random insertions and
+        deletions.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, engine=engine)
+            items = set()
+            for _ in range(2000):
+                item = random.randint(0, 400)
+                if random.random() < 0.55:
+                    tree.add(item)
+                    items.add(item)
+                else:
+                    tree.remove(item)
+                    items.discard(item)
+
+                if random.random() < 0.05:
+                    check_tree(tree)
+
+            check_tree(tree)
+            ordered = sorted(items)
+            for index, item in enumerate(ordered):
+                self.assertEqual(tree[index], item, "Wrong index")
+                self.assertEqual(tree.rank(item), index, "Wrong rank")
+
+            tree.bulk_load(range(-50, 0))
+            check_tree(tree)
+            self.assertEqual(tree[0], -50, "Wrong index after bulk load")
+            self.assertEqual(tree[-1], ordered[-1],
+                             "Wrong index after bulk load")
+
+    def test_key(self):
+        """
+        Tests rank and select with a key function.
+        """
+        for engine in TreeSet._ENGINES:
+            people = [Person(f"Person{age}", age) for age in range(30)]
+            tree = TreeSet(Person, people[::-1], engine=engine,
+                           key=lambda person: person.age)
+            self.assertIs(tree[10], people[10], "Wrong index")
+            self.assertEqual(tree.rank(Person("Probe", 10)), 10, "Wrong rank")
+
+
+if __name__ == '__main__':
+    unittest.main()
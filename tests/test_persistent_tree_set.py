@@ -0,0 +1,194 @@
+"""Implementation of the test class for the PersistentTreeSet."""
+import random
+import unittest
+from persistent_tree_set import PersistentTreeSet
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_persistent_red_black_tree
+from tree_set_exceptions import *
+
+
+class TestPersistentTreeSet(unittest.TestCase):
+    """Test the versions of the PersistentTreeSet."""
+
+    def test_versions(self):
+        """
+        Tests random insertions and removals against Python sets, checking
+        that every old version keeps its elements.
+        """
+        for size in (0, 1, 10, 300):
+            items = set(random.sample(range(1000), size))
+            version = PersistentTreeSet(int, items)
+            check_persistent_red_black_tree(version)
+            history = [(version, set(items))]
+            for _ in range(500):
+                value = random.randrange(1000)
+                if random.random() < 0.5:
+                    version = version.add(value)
+                    items.add(value)
+                else:
+                    version = version.remove(value)
+                    items.discard(value)
+                check_persistent_red_black_tree(version)
+                history.append((version, set(items)))
+
+            for version, expected in history:
+                self.assertEqual(list(version), sorted(expected),
+                                 "Old versions must keep their elements")
+                self.assertEqual(len(version), len(expected), "Wrong size")
+
+    def test_unchanged(self):
+        """
+        Tests that adding a contained value or removing a missing one returns
+        the same version.
+        """
+        version = PersistentTreeSet(int, [1, 2, 3])
+        self.assertIs(version.add(2), version, "Version must be reused")
+        self.assertIs(version.remove(4), version, "Version must be reused")
+        self.assertEqual(list(version.add(4)), [1, 2, 3, 4], "Wrong add")
+        self.assertEqual(list(version.remove(1)), [2, 3], "Wrong remove")
+        self.assertEqual(list(version), [1, 2, 3], "Version was modified")
+
+    def test_sharing(self):
+        """
+        Tests that a new version only copies the path to the changed element
+        and shares the rest of the nodes.
+        """
+        version = PersistentTreeSet(int, range(0, 2000, 2))
+        newer = version.add(1).remove(1998)
+
+        def nodes(tree):
+            stack, found = [tree._PersistentTreeSet__root], set()
+            while stack:
+                node = stack.pop()
+                if node is not tree._NULL:
+                    found.add(id(node))
+                    stack += [node.left, node.right]
+            return found
+
+        copied = len(nodes(newer) - nodes(version))
+        self.assertLess(copied, 60, "Only the changed paths must be copied")
+
+    def test_queries(self):
+        """
+        Tests the read-only queries of a version.
+        """
+        version = PersistentTreeSet(int, range(0, 100, 10))
+        self.assertEqual(version.first(), 0, "Wrong first element")
+        self.assertEqual(version.last(), 90, "Wrong last element")
+        self.assertEqual(version.higher(40), 50, "Wrong higher")
+        self.assertEqual(version.lower(40), 30, "Wrong lower")
+        self.assertEqual(version.ceiling(45), 50, "Wrong ceiling")
+        self.assertEqual(version.floor(45), 40, "Wrong floor")
+        self.assertIsNone(version.higher(90), "No higher element")
+        self.assertIsNone(version.floor(-1), "No floor element")
+        self.assertEqual(version.rank(35), 4, "Wrong rank")
+        self.assertEqual(version.select(2), 20, "Wrong select")
+        self.assertEqual(version[-1], 90, "Wrong negative index")
+        self.assertTrue(version.contains(30), "Value must be contained")
+        self.assertFalse(35 in version, "Value must not be contained")
+        self.assertEqual(list(reversed(version)), list(range(90, -1, -10)),
+                         "Wrong descending order")
+        self.assertEqual(str(version), str(list(range(0, 100, 10))),
+                         "Wrong string")
+        self.assertEqual(version, TreeSet(int, range(0, 100, 10)),
+                         "Versions must equal the trees with their elements")
+        self.assertIs(version.__eq__(list(version)), NotImplemented,
+                      "Other objects must be left to their own comparison")
+        self.assertNotEqual(version, list(version),
+                            "Versions must not equal other objects")
+        with self.assertRaises(IndexError):
+            version.select(10)
+        with self.assertRaises(NoSuchElementException):
+            PersistentTreeSet(int).first()
+
+    def test_validation(self):
+        """
+        Tests that the values are validated like in a TreeSet.
+        """
+        version = PersistentTreeSet(int, [1])
+        with self.assertRaises(TypeError):
+            version.add("2")
+        with self.assertRaises(NullPointerException):
+            version.remove(None)
+        with self.assertRaises(TypeError):
+            PersistentTreeSet(int, [1, "2"])
+        with self.assertRaises(NullPointerException):
+            version.get(None)
+        self.assertEqual(list(version), [1], "Version was modified")
+
+    def test_key(self):
+        """
+        Tests a PersistentTreeSet ordered by a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        version = PersistentTreeSet(Person, people[::-1],
+                                    key=lambda person: person.age)
+        older = version.remove(Person("Other", 5))
+        self.assertIs(version.get(5), people[5], "Old version must keep it")
+        self.assertIsNone(older.get(5), "Value must be removed")
+        self.assertFalse(older.contains_key(5), "Key must be removed")
+        self.assertIs(version.add(Person("Other", 5)), version,
+                      "Equal keys must be considered equal")
+        check_persistent_red_black_tree(older)
+
+    def test_from_trees(self):
+        """
+        Tests that a version built from a tree with the same key function
+        does not compare the elements.
+        """
+        numbers = [CountedNumber(value) for value in range(500)]
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(CountedNumber, numbers, engine=engine)
+            CountedNumber.comparisons = 0
+            version = PersistentTreeSet(CountedNumber, tree)
+            copy = PersistentTreeSet(CountedNumber, version)
+            self.assertEqual(CountedNumber.comparisons, 0,
+                             "The elements must not be compared")
+            self.assertEqual(list(copy), numbers, "Wrong elements")
+            check_persistent_red_black_tree(copy)
+
+    def test_ranges(self):
+        """
+        Tests the range views and iterators of a version against the ones of
+        a TreeSet, and that a view does not see the later versions.
+        """
+        values = random.sample(range(1000), 300)
+        version = PersistentTreeSet(int, values)
+        tree = TreeSet(int, values)
+        for _ in range(200):
+            low, high = sorted(random.sample(range(-5, 1005), 2))
+            inclusive = (random.random() < 0.5, random.random() < 0.5)
+            view = version.sub_set(low, high, inclusive)
+            expected = tree.sub_set(low, high, inclusive)
+            self.assertEqual(list(view), list(expected), "Wrong sub set")
+            self.assertEqual(list(reversed(view)), list(reversed(expected)),
+                             "Wrong descending sub set")
+            self.assertEqual(len(view), len(expected), "Wrong view size")
+            self.assertEqual(version.count_range(low, high, inclusive),
+                             len(expected), "Wrong range count")
+            self.assertEqual(list(version.head_set(low, inclusive[0])),
+                             list(tree.head_set(low, inclusive[0])),
+                             "Wrong head set")
+            self.assertEqual(list(version.tail_set(low, inclusive[0])),
+                             list(tree.tail_set(low, inclusive[0])),
+                             "Wrong tail set")
+            self.assertEqual(list(version.iter_from(low, inclusive[1], True)),
+                             list(tree.iter_from(low, inclusive[1], True)),
+                             "Wrong descending iteration")
+
+        view = version.tail_set(500)
+        expected = list(view)
+        newer = version.add(1001).remove(expected[0])
+        self.assertEqual(list(view), expected,
+                         "The view must not see the later versions")
+        self.assertEqual(list(newer.tail_set(500)), expected[1:] + [1001],
+                         "Wrong view of the new version")
+        self.assertTrue(version.clear().is_empty(), "Wrong empty version")
+        self.assertEqual(len(version), 300, "The version must not change")
+        with self.assertRaises(ValueError):
+            version.sub_set(10, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Implementation of the test class for the RedBlackNode class."""
+import random
+import unittest
+from data_utils import RedBlackNode
+from tree_set import TreeSet
+from tests.tree_invariants import check_red_black_tree
+
+
+class TestRedBlackNode(unittest.TestCase):
+    """Test class for the RedBlackNode class."""
+
+    def test_slots(self):
+        """Test that no attributes can be added to the node."""
+        node = RedBlackNode(1, None, None)
+        with self.assertRaises(AttributeError):
+            node.next_node = None
+
+    def test_fields(self):
+        """Test the fields of a new node."""
+        parent = RedBlackNode(2, None, None, RedBlackNode.BLACK)
+        node = RedBlackNode(1, None, None, parent=parent)
+        self.assertEqual(node.value, 1, "Wrong node value")
+        self.assertIs(node.color, RedBlackNode.RED, "New node must be red")
+        self.assertIs(node.parent, parent, "Wrong node parent")
+        self.assertIs(parent.color, RedBlackNode.BLACK, "Wrong node color")
+
+    def test_random_operations(self):
+        """
+        Test that the tree keeps its invariants after random insertions and
+        deletions.
+        """
+        tree = TreeSet(int)
+        items = set()
+        for _ in range(2000):
+            item = random.randint(0, 300)
+            if random.random() < 0.5:
+                self.assertEqual(tree.add(item), item not in items,
+                                 "Wrong value after adding")
+                items.add(item)
+            else:
+                self.assertEqual(tree.remove(item), item in items,
+                                 "Wrong value after removing")
+                items.discard(item)
+
+            check_red_black_tree(tree)
+
+        self.assertEqual(list(tree), sorted(items), "Wrong tree values")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Implementation of the test class for the TreeSet range removals."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+
+class TestRemoveRange(unittest.TestCase):
+    """Test the remove_range, remove_head and remove_tail methods."""
+
+    def test_against_filter(self):
+        """
+        Tests remove_range with every inclusion against a filter.
+        """
+        for engine in TreeSet._ENGINES:
+            for size in (0, 1, 10, 300):
+                items = set(random.sample(range(3 * size + 1), size))
+                for _ in range(20):
+                    low, high = sorted(random.choices(range(-5, 3 * size + 5),
+                                                      k=2))
+                    for inclusive in ((True, False), (False, True),
+                                      (True, True), (False, False)):
+                        tree = TreeSet(int, items, engine=engine)
+                        kept = [item for item in sorted(items)
+                                if item < low or item > high
+                                or item == low and not inclusive[0]
+                                or item == high and not inclusive[1]]
+                        self.assertEqual(tree.remove_range(low, high,
+                                                           inclusive),
+                                         len(items) - len(kept),
+                                         "Wrong number of removed elements")
+                        check_tree(tree)
+                        self.assertEqual(list(tree), kept,
+                                         "Wrong remaining elements")
+
+    def test_head_and_tail(self):
+        """
+        Tests remove_head and remove_tail in both inclusions.
+        """
+        for engine in TreeSet._ENGINES:
+            for inclusive in (False, True):
+                tree = TreeSet(int, range(100), engine=engine)
+                self.assertEqual(tree.remove_head(40, inclusive),
+                                 40 + inclusive, "Wrong removed head")
+                check_tree(tree)
+                self.assertEqual(tree.first(), 40 + inclusive,
+                                 "Wrong first element")
+
+                self.assertEqual(tree.remove_tail(90, inclusive),
+                                 9 + inclusive, "Wrong removed tail")
+                check_tree(tree)
+                self.assertEqual(tree.last(), 90 - inclusive,
+                                 "Wrong last element")
+                self.assertEqual(len(tree), 51 - 2 * inclusive,
+                                 "Wrong size")
+
+            tree = TreeSet(int, range(100), engine=engine)
+            self.assertEqual(tree.remove_head(1000), 100,
+                             "Every element must be removed")
+            self.assertTrue(tree.is_empty(), "Tree must be empty")
+            check_tree(tree)
+
+    def test_empty_ranges(self):
+        """
+        Tests the ranges without elements.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(10), engine=engine)
+            self.assertEqual(tree.remove_range(7, 3), 0,
+                             "Reversed bounds must not remove elements")
+            self.assertEqual(tree.remove_range(5, 5), 0,
+                             "Empty range must not remove elements")
+            self.assertEqual(tree.remove_range(5, 5, (True, True)), 1,
+                             "Closed range must remove its element")
+            self.assertEqual(tree.remove_tail(20), 0,
+                             "Tail after the last must be empty")
+            self.assertEqual(list(tree), [0, 1, 2, 3, 4, 6, 7, 8, 9],
+                             "Wrong remaining elements")
+
+    def test_large_truncation(self):
+        """
+        Tests truncating a large TreeSet and using it afterwards.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100_000), engine=engine)
+            self.assertEqual(tree.remove_head(50_000), 50_000,
+                             "Wrong removed head")
+            self.assertEqual(tree.remove_range(60_000, 60_010), 10,
+                             "Wrong removed range")
+            check_tree(tree)
+            self.assertEqual(tree[0], 50_000, "Wrong first element")
+            self.assertEqual(tree.rank(70_000), 19_990, "Wrong rank")
+            tree.add(0)
+            self.assertTrue(tree.remove(60_020), "Tree must stay usable")
+            check_tree(tree)
+
+    def test_cursor(self):
+        """
+        Tests that a cursor moves past a removed range.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            cursor = tree.cursor(30)
+            tree.remove_range(20, 40)
+            self.assertEqual(cursor.get(), 40, "Cursor must leave the range")
+
+    def test_key(self):
+        """
+        Tests the range removals with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        self.assertEqual(tree.remove_range(Person("Low", 5),
+                                           Person("High", 10)), 5,
+                         "Wrong removed range")
+        self.assertEqual(tree.remove_head(Person("Head", 3)), 3,
+                         "Wrong removed head")
+        self.assertEqual(list(tree), people[3:5] + people[10:],
+                         "Wrong remaining elements")
+
+    def test_invalid_values(self):
+        """
+        Tests that the range removals validate the bounds.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            tree.remove_range(1, "3")
+        with self.assertRaises(NullPointerException):
+            tree.remove_head(None)
+        with self.assertRaises(TypeError):
+            tree.remove_tail("1")
+        self.assertEqual(list(tree), [1, 2, 3],
+                         "Failed removals must not modify the TreeSet")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""Implementation of the test class for the TreeSet comparisons."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+
+
+class TestSetComparisons(unittest.TestCase):
+    """Test the equality, subset, superset and disjoint comparisons."""
+
+    def test_random_sets(self):
+        """
+        Tests the comparisons of random sets of both engines against Python
+        sets, both walking in lockstep and seeking the smaller set.
+        """
+        for ratio in (TreeSet._SEEK_RATIO, 0, 1000):
+            for _ in range(100):
+                items = set(random.sample(range(300),
+                                          random.choice([0, 1, 5, 40, 200])))
+                others = set(random.sample(range(300),
+                                           random.choice([0, 3, 40, 250])))
+                if random.random() < 0.3:
+                    others |= items
+                tree = TreeSet(int, items,
+                               engine=random.choice(TreeSet._ENGINES))
+                other = TreeSet(int, others,
+                                engine=random.choice(TreeSet._ENGINES))
+                TreeSet._SEEK_RATIO, previous = ratio, TreeSet._SEEK_RATIO
+                try:
+                    self.assertEqual(tree.issubset(other), items <= others)
+                    self.assertEqual(tree.issuperset(other), items >= others)
+                    self.assertEqual(tree.isdisjoint(other),
+                                     items.isdisjoint(others))
+                    self.assertEqual(tree.issubset(list(others)),
+                                     items <= others)
+                    self.assertEqual(tree.isdisjoint(list(others)),
+                                     items.isdisjoint(others))
+                    self.assertEqual(tree == other, items == others)
+                    self.assertEqual(tree < other, items < others)
+                    self.assertEqual(tree <= other, items <= others)
+                    self.assertEqual(tree > other, items > others)
+                    self.assertEqual(tree >= other, items >= others)
+                finally:
+                    TreeSet._SEEK_RATIO = previous
+
+    def test_no_membership_checks(self):
+        """
+        Tests that the equality of two trees with the same key function makes
+        one comparison per element, and stops at the first difference.
+        """
+        numbers = [CountedNumber(value) for value in range(1000)]
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(CountedNumber, numbers, engine=engine)
+            other = TreeSet(CountedNumber, numbers, engine=engine)
+            CountedNumber.comparisons = 0
+            self.assertEqual(tree, other, "Trees must be equal")
+            self.assertEqual(CountedNumber.comparisons, 1000,
+                             "One comparison per element expected")
+
+            other.remove(numbers[0])
+            other.add(CountedNumber(-1))
+            CountedNumber.comparisons = 0
+            self.assertNotEqual(tree, other, "Trees must be different")
+            self.assertEqual(CountedNumber.comparisons, 1,
+                             "The walk must stop at the first difference")
+
+    def test_other_objects(self):
+        """
+        Tests the comparisons with objects that are not trees and with trees
+        of other types, which raise the same error whatever their sizes.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        self.assertNotEqual(tree, [1, 2, 3], "A list is not a TreeSet")
+        self.assertTrue(tree.issubset(range(5)), "Wrong subset of a range")
+        self.assertTrue(tree.issuperset([3, 1, 3]), "Wrong superset")
+        self.assertFalse(tree.isdisjoint(iter([5, 3])), "Wrong disjoint")
+        with self.assertRaises(TypeError):
+            tree <= [1, 2, 3]
+        with self.assertRaises(TypeError):
+            tree.issubset([1, "2"])
+
+        for items in (["a"], ["a", "b", "c", "d"]):
+            words = TreeSet(str, items)
+            self.assertNotEqual(tree, words, "Sets of other types differ")
+            for compare in (tree.issubset, tree.issuperset, tree.isdisjoint,
+                            words.issubset, tree.__le__, tree.__lt__,
+                            tree.__gt__, words.__lt__):
+                with self.assertRaises(TypeError):
+                    compare(words if compare.__self__ is tree else tree)
+
+    def test_key(self):
+        """
+        Tests the comparisons of trees with key functions, which compare the
+        keys of the elements.
+        """
+        key = lambda person: person.age
+        people = TreeSet(Person, [Person("A", 1), Person("B", 2)], key=key)
+        others = TreeSet(Person, [Person("C", 1), Person("D", 2),
+                                  Person("E", 3)], key=key)
+        self.assertTrue(people < others, "Equal keys must be equal elements")
+        self.assertTrue(others.issuperset([Person("F", 3)]), "Wrong superset")
+        self.assertFalse(people.isdisjoint(others), "Wrong disjoint")
+        self.assertEqual(people, TreeSet(Person, [Person("G", 2),
+                                                  Person("H", 1)], key=key))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Implementation of the test class for the TreeSet set operations."""
+import random
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+OPERATIONS = (
+    ("union", "update", "__or__", "__ior__", set.union),
+    ("intersection", "intersection_update", "__and__", "__iand__",
+     set.intersection),
+    ("difference", "difference_update", "__sub__", "__isub__",
+     set.difference),
+    ("symmetric_difference", "symmetric_difference_update", "__xor__",
+     "__ixor__", set.symmetric_difference),
+)
+
+
+class TestSetOperations(unittest.TestCase):
+    """Test the set algebra of the TreeSet."""
+
+    def random_items(self, size: int) -> set:
+        """Returns a random set of integers."""
+        return set(random.randint(0, 3 * size) for _ in range(size))
+
+    def test_against_python_sets(self):
+        """
+        Tests every operation, method and operator against the Python sets.
+        """
+        for engine in TreeSet._ENGINES:
+            for size, other_size in ((0, 50), (50, 0), (200, 200), (20, 300)):
+                items = self.random_items(size)
+                other_items = self.random_items(other_size)
+                other = TreeSet(int, other_items, engine=engine)
+                for method, in_place, operator, in_place_operator, expected \
+                        in OPERATIONS:
+                    expected = sorted(expected(items, other_items))
+                    tree = TreeSet(int, items, engine=engine)
+                    for result in (getattr(tree, method)(other),
+                                   getattr(tree, operator)(other),
+                                   getattr(tree, method)(list(other_items))):
+                        check_tree(result)
+                        self.assertIs(type(result), type(tree),
+                                      "Result must have the same class")
+                        self.assertEqual(list(result), expected,
+                                         f"Wrong {method} result")
+                    self.assertEqual(sorted(items), list(tree),
+                                     "Operands must not be modified")
+
+                    getattr(tree, in_place)(other)
+                    check_tree(tree)
+                    self.assertEqual(list(tree), expected,
+                                     f"Wrong {in_place} result")
+
+                    tree = TreeSet(int, items, engine=engine)
+                    self.assertIs(getattr(tree, in_place_operator)(other),
+                                  tree, "In-place operator must return self")
+                    self.assertEqual(list(tree), expected,
+                                     f"Wrong {in_place_operator} result")
+
+    def test_operators(self):
+        """
+        Tests the operators syntax between both engines.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        other = TreeSet(int, [3, 4], engine="array")
+        self.assertEqual(list(tree | other), [1, 2, 3, 4], "Wrong union")
+        self.assertEqual(list(tree & other), [3], "Wrong intersection")
+        self.assertEqual(list(tree - other), [1, 2], "Wrong difference")
+        self.assertEqual(list(tree ^ other), [1, 2, 4],
+                         "Wrong symmetric difference")
+        tree |= other
+        tree -= TreeSet(int, [1])
+        self.assertEqual(list(tree), [2, 3, 4], "Wrong in-place operators")
+        with self.assertRaises(TypeError):
+            tree | {1, 2}
+
+    def test_keeps_first_equal_value(self):
+        """
+        Tests that the element of the current TreeSet is kept on equality.
+        """
+        first = Person("First", 20)
+        tree = TreeSet(Person, [first])
+        other = TreeSet(Person, [Person("Other", 20), Person("Young", 10)])
+        self.assertIs((tree | other).get(first), first,
+                      "The element of the current TreeSet must be kept")
+        self.assertIs((tree & other).first(), first,
+                      "The element of the current TreeSet must be kept")
+
+    def test_key(self):
+        """
+        Tests the operations between TreeSets with key functions.
+        """
+        def age(person):
+            return person.age
+
+        people = [Person(f"Person{number}", number) for number in range(10)]
+        tree = TreeSet(Person, people[:6], key=age)
+        other = TreeSet(Person, people[4:], key=age)
+        self.assertEqual(list(tree & other), people[4:6], "Wrong result")
+        self.assertIs((tree | other).key, age, "Result must keep the key")
+
+        reversed_other = TreeSet(Person, people[4:],
+                                 key=lambda person: -person.age)
+        self.assertEqual(list(tree - reversed_other), people[:4],
+                         "Other key function must be rekeyed")
+
+    def test_invalid_values(self):
+        """
+        Tests that the operations validate the other elements.
+        """
+        tree = TreeSet(int, [1, 2, 3])
+        with self.assertRaises(TypeError):
+            tree.union(["1"])
+        with self.assertRaises(TypeError):
+            tree.update(TreeSet(str, ["1"]))
+        with self.assertRaises(NullPointerException):
+            tree.intersection_update([1, None])
+        self.assertEqual(list(tree), [1, 2, 3],
+                         "Failed operations must not modify the TreeSet")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+"""Implementation of the test class for the SnapshotTreeSet."""
+import random
+import sys
+import threading
+import unittest
+from concurrent_tree_set import ConcurrentTreeSet
+from persistent_tree_set import PersistentTreeSet
+from snapshot_tree_set import SnapshotTreeSet
+from tree_set import TreeSet
+from tree_set_exceptions import *
+from tests.tree_invariants import check_persistent_red_black_tree
+
+THREADS = 4
+RANGE = 500
+
+
+class TestSnapshotTreeSet(unittest.TestCase):
+    """Test the SnapshotTreeSet under many threads."""
+
+    def setUp(self):
+        """Switches between the threads as often as possible."""
+        self.interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        """Restores the switch interval of the threads."""
+        sys.setswitchinterval(self.interval)
+
+    def run_threads(self, targets) -> None:
+        """
+        Runs every given function in its own thread and raises the first
+        error found by any of them.
+        """
+        errors = []
+
+        def run(target):
+            try:
+                target()
+            except BaseException as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(target,))
+                   for target in targets]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+
+    def test_consistent_scans(self):
+        """
+        Tests writers that insert and remove pairs of values together while
+        readers scan the set, checking that every scan sees a whole version,
+        with both values of each pair or none of them, and that no update is
+        lost.
+        """
+        shared = SnapshotTreeSet(int)
+        expected = [set() for _ in range(THREADS)]
+        done = threading.Event()
+
+        def writer(index):
+            items = expected[index]
+            low = index * RANGE
+            for _ in range(1000):
+                value = random.randrange(low, low + RANGE, 2)
+                if random.random() < 0.6:
+                    shared.add_all([value, value + 1])
+                    items.update((value, value + 1))
+                else:
+                    self.assertEqual(shared.remove_all([value, value + 1]),
+                                     2 if value in items else 0)
+                    items.difference_update((value, value + 1))
+
+        def reader():
+            while not done.is_set():
+                snapshot = shared.snapshot()
+                values = list(shared)
+                self.assertEqual(values, sorted(set(values)))
+                self.assertTrue(all(value + 1 in values
+                                    for value in values[::2]),
+                                "A scan must see whole pairs")
+                low = random.randrange(THREADS * RANGE)
+                view = shared.tail_set(low)
+                self.assertEqual(list(view), list(view),
+                                 "A view must not change")
+                self.assertEqual(len(list(snapshot)), len(snapshot))
+                check_persistent_red_black_tree(snapshot)
+
+        def writers():
+            try:
+                self.run_threads([lambda index=index: writer(index)
+                                  for index in range(THREADS)])
+            finally:
+                done.set()
+
+        self.run_threads([writers] + [reader] * THREADS)
+        self.assertEqual(list(shared), sorted(set().union(*expected)),
+                         "No update must be lost")
+        check_persistent_red_black_tree(shared.snapshot())
+
+    def test_writers_not_blocked(self):
+        """
+        Tests that the writers finish while an iterator and a view of the
+        set are open, and that neither sees their updates.
+        """
+        shared = SnapshotTreeSet(int, range(1000))
+        iterator = iter(shared)
+        view = shared.sub_set(100, 200)
+        self.assertEqual(next(iterator), 0, "Wrong first element")
+
+        def write():
+            for value in range(1000):
+                shared.remove(value)
+                shared.add(value + 2000)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        writer.join(5)
+        self.assertFalse(writer.is_alive(), "The writer must not be blocked")
+        self.assertEqual(list(iterator), list(range(1, 1000)),
+                         "The iterator must see its snapshot")
+        self.assertEqual(list(view), list(range(100, 200)),
+                         "The view must see its snapshot")
+        self.assertEqual(list(shared), list(range(2000, 3000)),
+                         "Wrong current elements")
+
+    def test_api(self):
+        """
+        Tests the methods of the SnapshotTreeSet in a single thread.
+        """
+        shared = SnapshotTreeSet(int, range(10))
+        snapshot = shared.snapshot()
+        self.assertIs(shared.snapshot(), snapshot,
+                      "Reading must not create versions")
+        self.assertTrue(shared.add(10), "Wrong insertion")
+        self.assertFalse(shared.add(10), "Wrong repeated insertion")
+        self.assertEqual(len(snapshot), 10, "The snapshot must not change")
+        self.assertEqual(shared.poll_first(), 0, "Wrong first element")
+        self.assertEqual(shared.poll_last(), 10, "Wrong last element")
+        self.assertEqual(shared.floor(20), 9, "Wrong floor")
+        self.assertEqual(shared.count_range(3, 6), 3, "Wrong range count")
+        self.assertEqual(list(shared.iter_from(5, reverse=True)),
+                         [5, 4, 3, 2, 1], "Wrong descending iteration")
+        self.assertEqual(shared[-1], 9, "Wrong indexing")
+        self.assertIn(7, shared, "Value must be contained")
+        self.assertEqual(shared, TreeSet(int, range(1, 10)),
+                         "Sets must be equal")
+        self.assertEqual(shared, SnapshotTreeSet(int, range(1, 10)),
+                         "Sets must be equal")
+        concurrent = ConcurrentTreeSet(int, range(1, 10))
+        self.assertTrue(shared == concurrent, "Sets must be equal")
+        self.assertTrue(concurrent == shared, "Sets must be equal")
+        concurrent.add(10)
+        self.assertFalse(shared == concurrent, "Sets must be different")
+        self.assertFalse(concurrent == shared, "Sets must be different")
+        self.assertNotEqual(shared, list(shared),
+                            "Sets must not equal other objects")
+        self.assertIs(shared.__eq__(concurrent), NotImplemented,
+                      "Other objects must be left to their own comparison")
+
+        self.assertFalse(shared.add_all([20, 21, 21]), "Wrong insertions")
+        with self.assertRaises(TypeError):
+            shared.add_all([30, "31"])
+        with self.assertRaises(NullPointerException):
+            shared.remove_all([1, None])
+        self.assertEqual(list(shared), list(range(1, 10)) + [20, 21],
+                         "Failed updates must publish nothing")
+        self.assertEqual(shared.remove_all([1, 2, 50]), 2, "Wrong removals")
+
+        shared.clear()
+        self.assertTrue(shared.is_empty(), "The set must be empty")
+        self.assertIsNone(shared.poll_first(), "Wrong poll on empty set")
+        self.assertIsNone(shared.poll_last(), "Wrong poll on empty set")
+        self.assertEqual(shared.contains.__doc__,
+                         PersistentTreeSet.contains.__doc__,
+                         "The documentation must be the persistent one")
+
+    def test_key(self):
+        """
+        Tests a SnapshotTreeSet ordered by a key function.
+        """
+        shared = SnapshotTreeSet(str, ["bb", "a", "ccc"], key=len)
+        self.assertFalse(shared.add("zz"), "Keys must be unique")
+        self.assertEqual(shared.get(3), "ccc", "Wrong element by key")
+        self.assertEqual(list(shared.head_set("xx", True)), ["a", "bb"],
+                         "Wrong head set")
+        self.assertIs(shared.key, len, "Wrong key function")
+        self.assertIs(shared.object_type, str, "Wrong object type")
+
+
+if __name__ == '__main__':
+    unittest.main()
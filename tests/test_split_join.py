@@ -0,0 +1,163 @@
+"""Implementation of the test class for the split and join of the trees."""
+import random
+import unittest
+from tree_set import RedBlackTree, TreeSet
+from tests.tests_classes import *
+from tests.tree_invariants import check_tree
+from tree_set_exceptions import NullPointerException
+
+OPERATIONS = (
+    ("update", set.union),
+    ("intersection_update", set.intersection),
+    ("difference_update", set.difference),
+    ("symmetric_difference_update", set.symmetric_difference),
+)
+
+
+class TestSplitJoin(unittest.TestCase):
+    """Test the split and join of the trees and the in-place operations."""
+
+    def test_split(self):
+        """
+        Tests the split by random values, found or not, against a filter.
+        """
+        for engine in TreeSet._ENGINES:
+            for size in (0, 1, 2, 50, 500):
+                items = set(random.sample(range(3 * size + 1), size))
+                for value in range(-2, 3 * size + 3, size // 10 + 1):
+                    tree = TreeSet(int, items, engine=engine)
+                    lower, found, higher = tree.split(value)
+                    for part in (lower, higher):
+                        check_tree(part)
+                        self.assertIs(type(part), type(tree),
+                                      "Parts must have the same class")
+                    self.assertEqual(list(lower),
+                                     sorted(item for item in items
+                                            if item < value),
+                                     "Wrong lower part")
+                    self.assertEqual(list(higher),
+                                     sorted(item for item in items
+                                            if item > value),
+                                     "Wrong higher part")
+                    self.assertEqual(found, value if value in items else None,
+                                     "Wrong found value")
+                    self.assertTrue(tree.is_empty(),
+                                    "The split tree must be left empty")
+
+    def test_join_inverts_split(self):
+        """
+        Tests that joining the parts of a split restores the tree, and that
+        trees of very different black heights are joined.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.sample(range(3000), 1000))
+            for value in random.sample(range(3000), 20):
+                tree = TreeSet(int, items, engine=engine)
+                joined = RedBlackTree.join(*tree.split(value))
+                check_tree(joined)
+                self.assertEqual(list(joined), sorted(items),
+                                 "Join must restore the split tree")
+
+            for left_size, right_size in ((0, 0), (0, 100), (100, 0),
+                                          (1, 1000), (1000, 1), (300, 300)):
+                left = TreeSet(int, range(left_size), engine=engine)
+                right = TreeSet(int, range(left_size + 1,
+                                           left_size + right_size + 1),
+                                engine=engine)
+                for pivot in (left_size, None):
+                    joined = TreeSet.join(left.clone(), pivot, right.clone())
+                    check_tree(joined)
+                    middle = [] if pivot is None else [pivot]
+                    self.assertEqual(list(joined),
+                                     list(left) + middle + list(right),
+                                     "Wrong joined values")
+
+                joined = TreeSet.join(left, None, right)
+                self.assertTrue(left.is_empty() and right.is_empty(),
+                                "Joined trees must be left empty")
+
+    def test_join_errors(self):
+        """
+        Tests that joining unordered or incompatible trees raises an error
+        without modifying them.
+        """
+        for engine in TreeSet._ENGINES:
+            left = TreeSet(int, [1, 2, 3], engine=engine)
+            right = TreeSet(int, [5, 6], engine=engine)
+            for pivot in (0, 3, 5, 7):
+                with self.assertRaises(ValueError):
+                    TreeSet.join(left, pivot, right)
+            with self.assertRaises(ValueError):
+                TreeSet.join(right, None, left)
+            with self.assertRaises(TypeError):
+                TreeSet.join(left, "4", right)
+            with self.assertRaises(TypeError):
+                TreeSet.join(left, 4, TreeSet(str, ["a"], engine=engine))
+            with self.assertRaises(TypeError):
+                TreeSet.join(left, 4, TreeSet(int, [5], key=abs,
+                                              engine=engine))
+            with self.assertRaises(NullPointerException):
+                left.split(None)
+            self.assertEqual(list(left) + list(right), [1, 2, 3, 5, 6],
+                             "Failed joins must not modify the trees")
+
+        with self.assertRaises(TypeError):
+            TreeSet.join(TreeSet(int, [1]), 2,
+                         TreeSet(int, [3], engine="array"))
+
+    def test_key(self):
+        """
+        Tests the split and join of TreeSets with key functions.
+        """
+        def age(person):
+            return person.age
+
+        for engine in TreeSet._ENGINES:
+            people = [Person(f"Person{number}", number)
+                      for number in range(20)]
+            tree = TreeSet(Person, people, key=age, engine=engine)
+            lower, found, higher = tree.split(Person("Other", 8))
+            self.assertIs(found, people[8], "The stored element must be found")
+            self.assertEqual(list(lower), people[:8], "Wrong lower part")
+            self.assertIs(higher.key, age, "Parts must keep the key")
+            joined = TreeSet.join(lower, found, higher)
+            check_tree(joined)
+            self.assertEqual(list(joined), people, "Wrong joined values")
+            self.assertEqual(joined.get(8), people[8], "Keys must be kept")
+
+    def test_small_into_large(self):
+        """
+        Tests the in-place operations with a much smaller set, which update
+        the tree element by element, against the Python sets.
+        """
+        for engine in TreeSet._ENGINES:
+            items = set(random.sample(range(20000), 5000))
+            for other_size in (0, 1, 10, 100):
+                other_items = set(random.sample(range(20000), other_size))
+                other_items.update(random.sample(sorted(items), other_size))
+                for method, expected in OPERATIONS:
+                    tree = TreeSet(int, items, engine=engine)
+                    getattr(tree, method)(other_items)
+                    check_tree(tree)
+                    self.assertEqual(list(tree),
+                                     sorted(expected(items, other_items)),
+                                     f"Wrong {method} result")
+
+    def test_small_into_large_keeps_elements(self):
+        """
+        Tests that the element by element union keeps the element of the
+        current TreeSet on equality.
+        """
+        people = [Person(f"Person{number}", number) for number in range(100)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        other = [Person("Other", 50), Person("New", 200)]
+        tree.update(other)
+        check_tree(tree)
+        self.assertIs(tree.get(50), people[50],
+                      "The element of the current TreeSet must be kept")
+        self.assertIs(tree.get(200), other[1], "The new element must be added")
+        self.assertEqual(tree.size(), 101, "Wrong size")
+
+
+if __name__ == '__main__':
+    unittest.main()
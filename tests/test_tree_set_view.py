@@ -0,0 +1,162 @@
+"""Implementation of the test class for the TreeSet range views."""
+import random
+import unittest
+from tree_set import TreeSet
+from tree_set_view import TreeSetView
+from tests.tests_classes import *
+from tree_set_exceptions import NoSuchElementException, NullPointerException
+
+
+def in_range(item, low, high, inclusive) -> bool:
+    """Checks if the item is between the bounds, None meaning no bound."""
+    if low is not None and (item < low or (item == low and not inclusive[0])):
+        return False
+    if high is not None and (high < item
+                             or (item == high and not inclusive[1])):
+        return False
+    return True
+
+
+class TestTreeSetView(unittest.TestCase):
+    """Test the sub_set, head_set and tail_set views of the TreeSet."""
+
+    def views(self, tree: TreeSet, low: int, high: int):
+        """Yields every kind of view between the bounds with its range."""
+        for inclusive in ((True, True), (True, False), (False, True),
+                          (False, False)):
+            yield tree.sub_set(low, high, inclusive), low, high, inclusive
+        for inclusive in (True, False):
+            yield tree.head_set(high, inclusive), None, high, (True, inclusive)
+            yield tree.tail_set(low, inclusive), low, None, (inclusive, True)
+
+    def test_against_brute_force(self):
+        """
+        Tests every view operation against a filtered list of the values.
+        """
+        for engine in TreeSet._ENGINES:
+            items = sorted(set(random.randint(0, 300) for _ in range(150)))
+            tree = TreeSet(int, items, engine=engine)
+            for _ in range(30):
+                low, high = sorted(random.sample(range(-10, 310), 2))
+                for view, *bounds in self.views(tree, low, high):
+                    expected = [item for item in items
+                                if in_range(item, *bounds)]
+                    self.assertIsInstance(view, TreeSetView, "Wrong class")
+                    self.assertEqual(list(view), expected, "Wrong values")
+                    self.assertEqual(list(reversed(view)), expected[::-1],
+                                     "Wrong reversed values")
+                    self.assertEqual(len(view), len(expected), "Wrong size")
+                    self.assertEqual(view.is_empty(), not expected,
+                                     "Wrong is_empty")
+                    if expected:
+                        self.assertEqual(view.first(), expected[0],
+                                         "Wrong first")
+                        self.assertEqual(view.last(), expected[-1],
+                                         "Wrong last")
+
+                    probe = random.randint(-10, 310)
+                    self.assertEqual(probe in view, probe in expected,
+                                     "Wrong contains")
+                    self.assertEqual(
+                        view.higher(probe),
+                        min((i for i in expected if i > probe), default=None),
+                        "Wrong higher")
+                    self.assertEqual(
+                        view.ceiling(probe),
+                        min((i for i in expected if i >= probe), default=None),
+                        "Wrong ceiling")
+                    self.assertEqual(
+                        view.lower(probe),
+                        max((i for i in expected if i < probe), default=None),
+                        "Wrong lower")
+                    self.assertEqual(
+                        view.floor(probe),
+                        max((i for i in expected if i <= probe), default=None),
+                        "Wrong floor")
+
+    def test_backed_by_tree(self):
+        """
+        Tests that the view sees the changes of the tree.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(10), engine=engine)
+            view = tree.sub_set(3, 6)
+            self.assertEqual(list(view), [3, 4, 5], "Wrong values")
+            tree.remove(4)
+            tree.add(20)
+            self.assertEqual(list(view), [3, 5], "View must see the removal")
+            self.assertEqual(len(view), 2, "Wrong size after removal")
+            tree.clear()
+            self.assertTrue(view.is_empty(), "View must be empty")
+            with self.assertRaises(NoSuchElementException):
+                view.first()
+            with self.assertRaises(NoSuchElementException):
+                view.last()
+
+    def test_nested_views(self):
+        """
+        Tests that the views of a view are bounded by both ranges.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, range(100), engine=engine)
+            view = tree.sub_set(10, 50)
+            self.assertEqual(list(view.sub_set(40, 60)), list(range(40, 50)),
+                             "Wrong nested sub set")
+            self.assertEqual(list(view.head_set(12, True)), [10, 11, 12],
+                             "Wrong nested head set")
+            self.assertEqual(list(view.tail_set(48, False)), [49],
+                             "Wrong nested tail set")
+            self.assertEqual(len(view.tail_set(10, False).head_set(50, True)),
+                             39, "Wrong nested size")
+            self.assertEqual(list(view.sub_set(60, 70)), [],
+                             "Disjoint ranges must be empty")
+
+    def test_invalid_bounds(self):
+        """
+        Tests the views with invalid bounds.
+        """
+        tree = TreeSet(int, range(10))
+        with self.assertRaises(ValueError):
+            tree.sub_set(5, 4)
+        with self.assertRaises(NullPointerException):
+            tree.head_set(None)
+        with self.assertRaises(TypeError):
+            tree.tail_set("1")
+        with self.assertRaises(TypeError):
+            "1" in tree.sub_set(1, 5)
+        self.assertEqual(list(tree.sub_set(4, 4)), [], "Wrong empty range")
+        self.assertEqual(list(tree.sub_set(4, 4, (True, True))), [4],
+                         "Wrong single value range")
+
+    def test_key(self):
+        """
+        Tests the views of a TreeSet with a key function.
+        """
+        people = [Person(f"Person{age}", age) for age in range(20)]
+        tree = TreeSet(Person, people, key=lambda person: person.age)
+        view = tree.sub_set(Person("Low", 5), Person("High", 8))
+        self.assertEqual(list(view), people[5:8], "Wrong values")
+        self.assertIs(view.ceiling(Person("Probe", 6)), people[6],
+                      "Wrong ceiling")
+        self.assertIn(Person("Probe", 7), view, "Wrong contains")
+
+    def test_seek(self):
+        """
+        Tests that the views seek their bounds instead of scanning the tree.
+        """
+        numbers = [CountedNumber(number) for number in range(1023)]
+        tree = TreeSet(CountedNumber, numbers)
+        view = tree.sub_set(CountedNumber(1000), CountedNumber(1010))
+        CountedNumber.comparisons = 0
+        next(iter(view))
+        self.assertLessEqual(CountedNumber.comparisons, 12,
+                             "First value must be found in one descent")
+
+        CountedNumber.comparisons = 0
+        len(view)
+        self.assertLessEqual(CountedNumber.comparisons, 20,
+                             "Size must be computed in two descents")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Implementation of the test class for the TreeSet without validation."""
+import random
+import unittest
+from array_tree_set import ArrayTreeSet
+from tree_set import TreeSet
+from tests.tests_classes import *
+
+
+class TestUncheckedTreeSet(unittest.TestCase):
+    """Test the TreeSet created with validate=False."""
+
+    def test_classes(self):
+        """
+        Tests the classes of the unchecked TreeSets.
+        """
+        tree = TreeSet(int, validate=False)
+        self.assertIsInstance(tree, TreeSet, "Wrong unchecked class")
+        self.assertEqual(type(tree).__name__, "UncheckedTreeSet",
+                         "Wrong unchecked class")
+        self.assertIs(type(tree), type(TreeSet(str, validate=False)),
+                      "The unchecked class must be created once")
+        self.assertIs(type(tree.clone()), type(tree),
+                      "Clone must keep the unchecked class")
+        self.assertIsInstance(TreeSet(int, engine="array", validate=False),
+                              ArrayTreeSet, "Wrong unchecked array class")
+
+    def test_raw_methods(self):
+        """
+        Tests that the unchecked TreeSet binds the raw implementations.
+        """
+        unchecked = type(TreeSet(int, validate=False))
+        for name in ("add", "remove", "__contains__", "higher", "lower",
+                     "ceiling", "floor"):
+            self.assertIs(getattr(unchecked, name),
+                          getattr(TreeSet, name).__wrapped__,
+                          "Unchecked methods must not be decorated")
+
+    def test_same_behavior(self):
+        """
+        Tests that both TreeSets behave identically with valid values.
+        """
+        for engine in TreeSet._ENGINES:
+            items = [random.randint(0, 500) for _ in range(300)]
+            tree = TreeSet(int, items, engine=engine)
+            unchecked = TreeSet(int, items, engine=engine, validate=False)
+            for _ in range(1000):
+                item = random.randint(-1, 501)
+                self.assertEqual(unchecked.add(item), tree.add(item),
+                                 "Wrong value after adding")
+                item = random.randint(-1, 501)
+                self.assertEqual(unchecked.remove(item), tree.remove(item),
+                                 "Wrong value after removing")
+                item = random.randint(-1, 501)
+                self.assertEqual(unchecked.contains(item), tree.contains(item),
+                                 "Wrong contains value")
+                self.assertEqual(unchecked.higher(item), tree.higher(item),
+                                 "Wrong higher value")
+                self.assertEqual(unchecked.lower(item), tree.lower(item),
+                                 "Wrong lower value")
+                self.assertEqual(unchecked.ceiling(item), tree.ceiling(item),
+                                 "Wrong ceiling value")
+                self.assertEqual(unchecked.floor(item), tree.floor(item),
+                                 "Wrong floor value")
+
+            self.assertEqual(list(unchecked), list(tree), "Wrong values")
+            self.assertEqual(unchecked.poll_first(), tree.poll_first(),
+                             "Wrong poll first value")
+
+    def test_person(self):
+        """
+        Tests the unchecked TreeSet with user defined classes.
+        """
+        items = [Person(f"Person{age}", age) for age in range(20, 40)]
+        tree = TreeSet(Person, items[::-1], validate=False)
+        self.assertEqual(list(tree), items, "Wrong tree values")
+        self.assertEqual(tree.lower(items[3]), items[2], "Wrong lower value")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Implementation of the test class for the TreeSet value validation."""
+import unittest
+from tree_set import TreeSet
+from tests.tests_classes import *
+from tree_set_exceptions import *
+
+
+class ProbedPerson(Person):
+    """
+    Person that counts how many times it is compared with itself using the
+    '>' operator, which the TreeSet only does to probe its comparability.
+    """
+
+    probes = 0
+
+    def __gt__(self, other):
+        if other is self:
+            ProbedPerson.probes += 1
+        return other.age < self.age
+
+
+class TestValidationTreeSet(unittest.TestCase):
+    """Test the validation of the values given to the TreeSet."""
+
+    def setUp(self) -> None:
+        """
+        Sets up the test fixture before exercising it.
+        """
+        ProbedPerson.probes = 0
+
+    def test_probe_once_per_type(self):
+        """
+        Tests that the comparability is probed once per concrete type.
+        """
+        tree = TreeSet(Person)
+        people = [ProbedPerson(f"Person{age}", age) for age in range(10)]
+        for person in people:
+            tree.add(person)
+            tree.contains(person)
+            tree.higher(person)
+            tree.floor(person)
+
+        self.assertEqual(ProbedPerson.probes, 1,
+                         "Comparability must be probed only once")
+        tree.remove(people[0])
+        tree.add_all(people)
+        self.assertEqual(ProbedPerson.probes, 1,
+                         "Comparability must be probed only once")
+
+    def test_cache_per_tree(self):
+        """
+        Tests that every tree keeps its own cache.
+        """
+        TreeSet(Person, [ProbedPerson("Person1", 1)])
+        TreeSet(Person, [ProbedPerson("Person2", 2)])
+        self.assertEqual(ProbedPerson.probes, 2,
+                         "Every tree must probe the type once")
+
+    def test_invalid_after_cached(self):
+        """
+        Tests that invalid values are rejected after valid ones were cached.
+        """
+        for engine in TreeSet._ENGINES:
+            tree = TreeSet(int, [1, 2, 3], engine=engine)
+            self.assertTrue(tree.contains(2), "Wrong contains value")
+            with self.assertRaises(NullPointerException):
+                tree.contains(None)
+            with self.assertRaises(TypeError):
+                tree.add("1")
+            with self.assertRaises(NullPointerException):
+                tree.remove(None)
+            with self.assertRaises(TypeError):
+                tree.ceiling(1.5)
+
+    def test_not_comparable_not_cached(self):
+        """
+        Tests that a type failing the comparability check is checked again.
+        """
+        tree = TreeSet(Student)
+        for _ in range(2):
+            with self.assertRaises(ClassCastException):
+                tree.add(Student("Student1", 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
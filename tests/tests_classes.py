@@ -258,3 +258,41 @@ class Venusian(Alien):
 
     def __repr__(self):
         return f"Venusian({self.name}, {self.planet})"
+
+
+# EQ LT GT counting comparisons
+class CountedNumber:
+    """
+    Class to represent a number that counts every comparison made with it.
+    Implements eq, lt and gt methods to compare objects.
+    """
+
+    comparisons = 0
+
+    def __init__(self, number):
+        self.__number = number
+
+    @property
+    def number(self):
+        return self.__number
+
+    def __eq__(self, other):
+        CountedNumber.comparisons += 1
+        if isinstance(other, CountedNumber):
+            return self.__number == other.number
+        return False
+
+    def __lt__(self, other):
+        CountedNumber.comparisons += 1
+        if isinstance(other, CountedNumber):
+            return self.__number < other.number
+        return False
+
+    def __gt__(self, other):
+        CountedNumber.comparisons += 1
+        if isinstance(other, CountedNumber):
+            return self.__number > other.number
+        return False
+
+    def __repr__(self):
+        return f"CountedNumber({self.__number})"
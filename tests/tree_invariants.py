@@ -0,0 +1,209 @@
+"""Helper functions used by the tests to check the RedBlackTree invariants."""
+from array_tree_set import ArrayTreeSet
+from tree_set import RedBlackTree
+
+
+def check_red_black_tree(tree: RedBlackTree) -> None:
+    """
+    Checks that the given tree satisfies every red-black tree property: the
+    root is black, a red node never has a red child, every path from a node to
+    its leaves has the same number of black nodes, the keys are ordered, every
+    node caches the key of its value and the size of its subtree, the parent
+    pointers are consistent and the cached first and last nodes are the ends
+    of the tree.
+
+    :param tree: the tree to check
+    :type tree: RedBlackTree
+    :raises AssertionError: if some property is not satisfied
+    """
+    root = tree._RedBlackTree__root
+    null = RedBlackTree._NULL
+    key = tree.key
+    first = tree._RedBlackTree__first
+    last = tree._RedBlackTree__last
+    if root is null:
+        assert tree.size() == 0, "Empty tree must have size 0"
+        assert first is null and last is null, \
+            "Empty tree must not cache first and last nodes"
+        return
+
+    assert null.size == 0, "The null leaf must have size 0"
+    assert root.color == RedBlackTree._BLACK, "Root must be black"
+    assert root.parent is None, "Root must not have a parent"
+
+    def check(node, low, high):
+        if node is null:
+            return 1, 0
+
+        if key is None:
+            assert node.key is node.value, "The key must be the value"
+        else:
+            assert node.key == key(node.value), "Wrong cached key"
+
+        if low is not None:
+            assert low < node.key, "Values must be ordered"
+        if high is not None:
+            assert node.key < high, "Values must be ordered"
+
+        for child in (node.left, node.right):
+            if child is not null:
+                assert child.parent is node, "Wrong parent pointer"
+                assert not (node.color == RedBlackTree._RED
+                            and child.color == RedBlackTree._RED), \
+                    "A red node cannot have a red child"
+
+        left_height, left_size = check(node.left, low, node.key)
+        right_height, right_size = check(node.right, node.key, high)
+        assert left_height == right_height, "Black heights must be equal"
+        assert node.size == left_size + right_size + 1, "Wrong subtree size"
+
+        return (left_height + (node.color == RedBlackTree._BLACK),
+                left_size + right_size + 1)
+
+    _, size = check(root, None, None)
+    assert size == tree.size(), "Wrong tree size"
+
+    node = root
+    while node.left is not null:
+        node = node.left
+    assert first is node, "Wrong cached first node"
+    node = root
+    while node.right is not null:
+        node = node.right
+    assert last is node, "Wrong cached last node"
+
+
+def check_array_red_black_tree(tree) -> None:
+    """
+    Checks that the given ArrayTreeSet satisfies every red-black tree
+    property, the same ones checked by :func:`check_red_black_tree`.
+
+    :param tree: the tree to check
+    :type tree: ArrayTreeSet
+    :raises AssertionError: if some property is not satisfied
+    """
+    root = tree._ArrayTreeSet__root
+    values = tree._ArrayTreeSet__values
+    keys = tree._ArrayTreeSet__keys
+    key = tree.key
+    left = tree._ArrayTreeSet__left
+    right = tree._ArrayTreeSet__right
+    parent = tree._ArrayTreeSet__parent
+    colors = tree._ArrayTreeSet__colors
+    sizes = tree._ArrayTreeSet__sizes
+    first = tree._ArrayTreeSet__first
+    last = tree._ArrayTreeSet__last
+    red = tree._RED
+
+    assert colors[0] != red, "The null leaf must be black"
+    assert sizes[0] == 0, "The null leaf must have size 0"
+    assert (key is None) == (keys is values), \
+        "The keys must only be stored apart if there is a key function"
+    if not root:
+        assert tree.size() == 0, "Empty tree must have size 0"
+        assert not first and not last, \
+            "Empty tree must not cache first and last nodes"
+        return
+
+    assert colors[root] != red, "Root must be black"
+    assert not parent[root], "Root must not have a parent"
+
+    def check(node, low, high):
+        if not node:
+            return 1, 0
+
+        if key is not None:
+            assert keys[node] == key(values[node]), "Wrong cached key"
+
+        if low is not None:
+            assert low < keys[node], "Values must be ordered"
+        if high is not None:
+            assert keys[node] < high, "Values must be ordered"
+
+        for child in (left[node], right[node]):
+            if child:
+                assert parent[child] == node, "Wrong parent pointer"
+                assert not (colors[node] == red and colors[child] == red), \
+                    "A red node cannot have a red child"
+
+        left_height, left_size = check(left[node], low, keys[node])
+        right_height, right_size = check(right[node], keys[node], high)
+        assert left_height == right_height, "Black heights must be equal"
+        assert sizes[node] == left_size + right_size + 1, "Wrong subtree size"
+
+        return (left_height + (colors[node] != red),
+                left_size + right_size + 1)
+
+    _, size = check(root, None, None)
+    assert size == tree.size(), "Wrong tree size"
+
+    node = root
+    while left[node]:
+        node = left[node]
+    assert first == node, "Wrong cached first node"
+    node = root
+    while right[node]:
+        node = right[node]
+    assert last == node, "Wrong cached last node"
+
+
+def check_tree(tree: RedBlackTree) -> None:
+    """
+    Checks the red-black tree properties of the given tree with the function
+    that matches its engine.
+
+    :param tree: the tree to check
+    :type tree: RedBlackTree
+    :raises AssertionError: if some property is not satisfied
+    """
+    if isinstance(tree, ArrayTreeSet):
+        check_array_red_black_tree(tree)
+    else:
+        check_red_black_tree(tree)
+
+
+def check_persistent_red_black_tree(tree) -> None:
+    """
+    Checks that the given PersistentTreeSet satisfies every red-black tree
+    property: the root is black, a red node never has a red child, every path
+    from a node to its leaves has the same number of black nodes, the keys
+    are ordered and every node caches the key of its value and the size of
+    its subtree.
+
+    :param tree: the tree to check
+    :type tree: PersistentTreeSet
+    :raises AssertionError: if some property is not satisfied
+    """
+    root = tree._PersistentTreeSet__root
+    null = tree._NULL
+    key = tree.key
+    assert null.size == 0, "The null leaf must have size 0"
+    assert root.color == tree._BLACK, "Root must be black"
+
+    def check(node, low, high):
+        if node is null:
+            return 1
+
+        if key is None:
+            assert node.key is node.value, "The key must be the value"
+        else:
+            assert node.key == key(node.value), "Wrong cached key"
+
+        if low is not None:
+            assert low < node.key, "Values must be ordered"
+        if high is not None:
+            assert node.key < high, "Values must be ordered"
+
+        for child in (node.left, node.right):
+            assert not (node.color == tree._RED
+                        and child.color == tree._RED), \
+                "A red node cannot have a red child"
+
+        left_height = check(node.left, low, node.key)
+        assert left_height == check(node.right, node.key, high), \
+            "Black heights must be equal"
+        assert node.size == node.left.size + node.right.size + 1, \
+            "Wrong subtree size"
+        return left_height + (node.color == tree._BLACK)
+
+    check(root, None, None)
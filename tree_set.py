@@ -8,11 +8,21 @@ class extends the RedBlackTree class and provides additional methods for
 managing the set of elements.
 """
 from typing import *
-from data_utils import TreeNode, SimpleStack
+from data_utils import NullLeaf, RedBlackNode
 from tests.tests_classes import *
 from tree_set_exceptions import *
+from tree_set_view import TreeSetView
+from tree_set_cursor import TreeSetCursor
+from functools import wraps
+from itertools import islice
+import operator
 import random
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 E = TypeVar('E')
 
 
@@ -26,116 +36,145 @@ class RedBlackTree:
 
     __attributes = {
         "_RedBlackTree__root", "_RedBlackTree__size",
-        "_RedBlackTree__object_type"
+        "_RedBlackTree__object_type", "_RedBlackTree__valid_types",
+        "_RedBlackTree__key", "_RedBlackTree__first", "_RedBlackTree__last",
+        "_RedBlackTree__epoch", "_RedBlackTree__shared"
     }
 
-    _RED = TreeNode.TreeNodeUtils.RED
-    _BLACK = TreeNode.TreeNodeUtils.BLACK
-    _NULL = TreeNode(TreeNode.TreeNodeUtils.NULL, None, None,
-                     TreeNode.TreeNodeUtils.BLACK)
+    _RED = RedBlackNode.RED
+    _BLACK = RedBlackNode.BLACK
+    _NULL = NullLeaf()
+    _REBUILD_RATIO = 12
 
-    def _type_validation(function):
+    def _validation(function):
         """
-        Decorator method used to validate item type when using a TreeSet.
+        Decorator used to validate the value given to a TreeSet method. The
+        value cannot be None, its type must match the TreeSet type and it must
+        be comparable. The checks run once per concrete type: once a value of
+        some type passes them, the type is cached on the tree and the next
+        values of that type only cost a lookup in that cache.
 
         :param function: used function of the TreeSet
         :return: given function return statement
+        :raises NullPointerException: if the item is None
         :raises TypeError: if the item type does not match the TreeSet type
+        :raise ClassCastException: if the given value is not comparable
         """
 
-        def wrapper(self, item):
+        @wraps(function)
+        def wrapper(self, value):
             """
-            Wrapper function used to validate the item type.
+            Wrapper function used to validate the given value.
 
             :param self: the instance of the current TreeSet
             :type self: TreeSet
-            :param item:  item to validate
-            :type item: E
+            :param value: value to validate
+            :type value: E
             :return: the given function return statement
             :rtype: Any
+            :raises NullPointerException: if the item is None
             :raises TypeError: if the item type does not match the TreeSet type
+            :raise ClassCastException: if the given value is not comparable
             """
-            if not isinstance(item, self.object_type):
-                raise TypeError(
-                    f"Value type must be '{self.object_type}: {type(item)}'")
-
-            return function(self, item)
+            if type(value) not in self.__valid_types:
+                self._validate(value)
+            return function(self, value)
 
+        wrapper.validated = True
         return wrapper
 
-    def _null_validation(function):
+    def _validate(self, value: Any) -> None:
         """
-        Decorator used to validate if the given value is None or not.
+        Validates the given value, checking that it is not None, that its type
+        matches the tree type and that it is comparable. If the tree has a key
+        function, the key of the value is the one that must be comparable. If
+        the value is valid, its type is cached so the values of the same type
+        are not checked again.
 
-        :param function: used function of the TreeSet
-        :return: given function return statement
+        :param value: value to validate
+        :type value: Any
         :raises NullPointerException: if the item is None
+        :raises TypeError: if the item type does not match the TreeSet type
+        :raise ClassCastException: if the given value is not comparable
         """
+        if type(value) in self.__valid_types:
+            return
 
-        def wrapper(self, value):
-            """
-            Wrapper function used to validate if the given value is None or not.
+        if value is None:
+            raise NullPointerException("Value cannot be None")
 
-            :param self: the instance of the current TreeSet
-            :type self: TreeSet
-            :param value: value to validate
-            :type value: E
-            :return: the given function return statement
-            :rtype: Any
-            :raises NullPointerException: if the item is None
-            """
-            if value is None:
-                raise NullPointerException("Value cannot be None")
-            return function(self, value)
+        if not isinstance(value, self.object_type):
+            raise TypeError(
+                f"Value type must be '{self.object_type}: {type(value)}'")
 
-        return wrapper
+        self.__assert_comparable(
+            value if self.__key is None else self.__key(value))
+        self.__valid_types.add(type(value))
 
-    def _check_comparable(function):
+    @classmethod
+    def _unchecked(cls) -> Type['RedBlackTree']:
         """
-        Private decorator used to check comparability of the type specified when
-        creating the TreeSet.
+        Returns a subclass of the given class whose validated methods are the
+        raw, undecorated implementations and whose value validation does
+        nothing. It must only be used with values that are known to be valid:
+        not None, of the tree type and comparable. The subclass is created
+        once per class.
 
-        :param function: used functions of the TreeSet
-        :return: given function return statement
-        :raise ClassCastException: if the given value is not comparable
+        :return: the unchecked subclass of the class
+        :rtype: Type[RedBlackTree]
         """
+        if "_unchecked_class" in vars(cls):
+            return cls._unchecked_class
 
-        def wrapper(self, *args):
+        def _validate(self, value: Any) -> None:
             """
-            Wrapper function used to check the comparability of the given value.
+            Skips the validation of the given value.
 
-            :param self: the instance of the current TreeSet
-            :param args: arguments given dynamically
-            :return: the given function return statement
-            :rtype: Any
-            :raise ClassCastException: if the given value is not comparable
+            :param value: value that is known to be valid
+            :type value: Any
             """
 
-            def throw_exception():
-                """
-                Private method used to throw a ClassCastException exception.
+        namespace = {"_validate": _validate, "__doc__": cls.__doc__}
+        for name in dir(cls):
+            if getattr(attribute := getattr(cls, name), "validated", False):
+                namespace[name] = attribute.__wrapped__
 
-                :raises ClassCastException: always
-                """
-                raise ClassCastException(
-                    f"class {value_type} cannot be compared")
+        unchecked = type(f"Unchecked{cls.__name__}", (cls,), namespace)
+        cls._unchecked_class = unchecked
+        unchecked._unchecked_class = unchecked
+        return unchecked
 
-            item = args[0]
-            value_type = type(item)
-            if value_type.__eq__ is object.__eq__ \
-                    or (value_type.__lt__ is object.__lt__
-                        and value_type.__gt__ is object.__gt__):
-                throw_exception()
-            elif not isinstance(item, type):
-                try:
-                    if (item < item) is None or (item > item) is None:
-                        throw_exception()
-                except TypeError:
-                    throw_exception()
+    @staticmethod
+    def __assert_comparable(item: Any) -> None:
+        """
+        Private method used to check that the given item can be compared with
+        other items of its type.
+
+        :param item: the item to check
+        :type item: Any
+        :raise ClassCastException: if the given value is not comparable
+        """
 
-            return function(self, *args)
+        def throw_exception():
+            """
+            Private method used to throw a ClassCastException exception.
 
-        return wrapper
+            :raises ClassCastException: always
+            """
+            raise ClassCastException(
+                f"class {value_type} cannot be compared")
+
+        value_type = type(item)
+        if value_type.__eq__ is object.__eq__ \
+                or (value_type.__lt__ is object.__lt__
+                    and value_type.__gt__ is object.__gt__):
+            throw_exception()
+        elif not isinstance(item, type):
+            try:
+                if (item < item) is None or (item > item) is None:
+                    throw_exception()
+            except TypeError:
+                throw_exception()
 
     @classmethod
     def __complete_comparator(cls, value_type: Type):
@@ -178,14 +217,28 @@ class RedBlackTree:
 
         return value_type
 
-    def __init__(self, generic_type: Type) -> None:
+    def __init__(self, generic_type: Type,
+                 key: Callable[[Any], Any] = None) -> None:
         """
         Constructor of the class.
         Initializes a new instance of RedBlackTree.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param key: function that returns the sort key of a value. The key is
+            computed once when the value is inserted and stored in its node.
+            If it is None, the values are ordered using its natural ordering
+        :type key: Callable[[Any], Any]
         """
+        self.__shared = None
         self.__root = self._NULL
+        self.__first = self.__last = self._NULL
         self.__size = 0
-        self.__object_type = self.__complete_comparator(generic_type)
+        self.__epoch = 0
+        self.__key = key
+        self.__object_type = generic_type if key is not None \
+            else self.__complete_comparator(generic_type)
+        self.__valid_types = set()
 
     @property
     def object_type(self) -> Type:
@@ -197,9 +250,19 @@ class RedBlackTree:
         """
         return self.__object_type
 
-    @_null_validation
-    @_type_validation
-    @_check_comparable
+    @property
+    def key(self) -> Union[Callable[[Any], Any], None]:
+        """
+        Getter method to retrieve the function used to compute the sort key of
+        the values.
+
+        :return: the key function, or None if the values are ordered using
+            its natural ordering
+        :rtype: Union[Callable[[Any], Any], None]
+        """
+        return self.__key
+
+    @_validation
     def add(self, value: Any) -> bool:
         """
         Inserts a new value into the RedBlackTree.
@@ -209,20 +272,62 @@ class RedBlackTree:
         :return: False if the value already exists in the tree, True otherwise
         :rtype: bool
         """
-        if (parent := self.__contains(
-                value)) is not self._NULL and parent.value == value:
+        self._own()
+        key = value if self.__key is None else self.__key(value)
+        parent = None
+        candidate = self._NULL
+        current = self.__root
+        is_left = False
+
+        while current is not self._NULL:
+            parent = current
+            if is_left := key < current.key:
+                current = current.left
+            else:
+                candidate = current
+                current = current.right
+
+        if candidate is not self._NULL and candidate.key == key:
             return False
 
-        node = TreeNode(value, self._NULL, self._NULL, self._RED)
-        parent = None if parent is self._NULL else parent
+        self.__attach(value, key, parent, is_left)
+        return True
+
+    def __attach(self, value: Any, key: Any,
+                 parent: Union[RedBlackNode, None],
+                 is_left: bool) -> RedBlackNode:
+        """
+        Links a new node as a child of the given leaf position and rebalances
+        the tree.
 
-        node.parent = parent
+        :param value: the value of the new node
+        :type value: Any
+        :param key: the key of the value
+        :type key: Any
+        :param parent: the parent of the new node, or None if the tree is
+            empty
+        :type parent: Union[RedBlackNode, None]
+        :param is_left: if True, the new node is the left child
+        :type is_left: bool
+        :return: the new node
+        :rtype: RedBlackNode
+        """
+        node = RedBlackNode(value, self._NULL, self._NULL, self._RED, parent,
+                            key)
         if parent is None:
-            self.__root = node
-        elif node.value < parent.value:
+            self.__root = self.__first = self.__last = node
+        elif is_left:
             parent.left = node
+            if parent is self.__first:
+                self.__first = node
         else:
             parent.right = node
+            if parent is self.__last:
+                self.__last = node
+
+        while parent is not None:
+            parent.size += 1
+            parent = parent.parent
 
         if node.parent is None:
             node.color = self._BLACK
@@ -230,11 +335,242 @@ class RedBlackTree:
             self.__fix_after_insertion(node)
 
         self.__size += 1
-        return True
+        return node
+
+    def _own(self, copy: bool = True) -> None:
+        """
+        Makes the tree the only owner of its nodes before modifying them. If
+        the nodes are shared with copy-on-write clones, the tree leaves them
+        to the clones and, unless its content is about to be replaced, copies
+        them with :meth:`_copy_nodes` in *O(n)*.
+
+        :param copy: if False, the shared nodes are left without copying them
+        :type copy: bool
+        """
+        if (shared := self.__shared) is None:
+            return
+
+        self.__shared = None
+        shared[0] -= 1
+        if copy and shared[0]:
+            self._copy_nodes()
+            self.__epoch += 1
+
+    def _clone(self, copy_on_write: bool) -> 'RedBlackTree':
+        """
+        Returns a new tree of the same class and key function with the same
+        values. The clone adopts the nodes of the tree and, unless it is a
+        copy-on-write clone, copies them right away. Otherwise both trees
+        share the nodes until one of them is modified, see :meth:`_own`.
+
+        :param copy_on_write: if True, the nodes are shared until a write
+        :type copy_on_write: bool
+        :return: the clone
+        :rtype: RedBlackTree
+        """
+        clone = type(self)(self.object_type, key=self.__key)
+        clone.__valid_types.update(self.__valid_types)
+        clone._adopt_nodes(self)
+        if not copy_on_write:
+            clone._copy_nodes()
+            return clone
+
+        if self.__shared is None:
+            self.__shared = [1]
+        self.__shared[0] += 1
+        clone.__shared = self.__shared
+        return clone
+
+    def _adopt_nodes(self, other: 'RedBlackTree') -> None:
+        """
+        Makes the current empty tree hold the nodes of the given one, without
+        copying them.
+
+        :param other: the tree whose nodes are adopted
+        :type other: RedBlackTree
+        """
+        self.__root, self.__size = other.__root, other.__size
+        self.__first, self.__last = other.__first, other.__last
+
+    def _copy_nodes(self) -> None:
+        """
+        Replaces the nodes of the tree with copies that keep their shape,
+        colors and subtree sizes, in *O(n)* and without comparing any key.
+        """
+        self.__root = self.__copy(self.__root, None)
+        self.__reset_ends()
+
+    def __copy(self, node: RedBlackNode,
+               parent: Union[RedBlackNode, None]) -> RedBlackNode:
+        """
+        Returns a copy of the given subtree.
+
+        :param node: the root of the subtree
+        :type node: RedBlackNode
+        :param parent: the parent of the copy
+        :type parent: Union[RedBlackNode, None]
+        :return: the root of the copy
+        :rtype: RedBlackNode
+        """
+        if node is self._NULL:
+            return node
+
+        copy = RedBlackNode(node.value, self._NULL, self._NULL, node.color,
+                            parent, node.key, node.size)
+        copy.left = self.__copy(node.left, copy)
+        copy.right = self.__copy(node.right, copy)
+        return copy
+
+    def _epoch(self) -> int:
+        """
+        Returns the number of times that nodes have left the tree, through
+        removals, clears and rebuilds. The insertions keep every node, so they
+        do not change it, and a cursor whose epoch is still the current one
+        knows that its node is still in the tree.
+
+        :return: the current epoch of the tree
+        :rtype: int
+        """
+        return self.__epoch
+
+    def _insert_before(self, node: RedBlackNode, value: Any,
+                       key: Any) -> RedBlackNode:
+        """
+        Inserts a new value just before the given node, without comparing any
+        key: it becomes the left child of the node or, if it already has one,
+        the right child of its predecessor. The key must be between the keys
+        of the predecessor and the node, since it is not checked.
+
+        :param node: the node that follows the new value, or the null leaf to
+            insert it after the last node
+        :type node: RedBlackNode
+        :param value: the value to insert
+        :type value: Any
+        :param key: the key of the value
+        :type key: Any
+        :return: the new node
+        :rtype: RedBlackNode
+        """
+        if node is self._NULL:
+            parent, is_left = self.__last, False
+        elif node.left is self._NULL:
+            parent, is_left = node, True
+        else:
+            parent, is_left = self.__end(node.left, True), False
+        return self.__attach(value, key,
+                             None if parent is self._NULL else parent,
+                             is_left)
+
+    def _remove_node(self, node: RedBlackNode) -> RedBlackNode:
+        """
+        Removes the given node from the tree without searching it.
+
+        :param node: the node to remove
+        :type node: RedBlackNode
+        :return: the node that followed the removed one, or the null leaf
+        :rtype: RedBlackNode
+        """
+        following = self._step(node, False)
+        self.__unlink(node)
+        return following
+
+    def _step(self, node: RedBlackNode, reverse: bool) -> RedBlackNode:
+        """
+        Returns the node that follows the given one in order, or the one that
+        precedes it if reverse is True, through the parent pointers.
+
+        :param node: the current node
+        :type node: RedBlackNode
+        :param reverse: if True, the previous node is returned
+        :type reverse: bool
+        :return: the next or previous node, or the null leaf
+        :rtype: RedBlackNode
+        """
+        if (child := node.left if reverse else node.right) is not self._NULL:
+            return self.__end(child, reverse)
+
+        parent = node.parent
+        while parent is not None \
+                and node is (parent.left if reverse else parent.right):
+            node, parent = parent, parent.parent
+        return self._NULL if parent is None else parent
+
+    def _item(self, node: RedBlackNode) -> Tuple[Any, Any]:
+        """
+        Returns the key and the value of the given node.
+
+        :param node: the node
+        :type node: RedBlackNode
+        :return: the key and the value, both None for the null leaf
+        :rtype: Tuple[Any, Any]
+        """
+        return node.key, node.value
+
+    def _finger(self, node: Union[RedBlackNode, None], key: Any,
+                reverse: bool = False) -> RedBlackNode:
+        """
+        Finds the node with the least key greater than or equal to the given
+        one, or the greatest key lower than or equal to it if reverse is True,
+        starting from the given node instead of the root. The search climbs
+        from the node to the lowest ancestor whose subtree bounds the key,
+        comparing only at the turns of the path, and descends from there, so
+        it costs *O(log d)* comparisons for a key d nodes away.
+
+        :param node: the node to start from, None to start from the root or
+            the null leaf if a lower key (a greater one if reverse is True)
+            had no answer
+        :type node: Union[RedBlackNode, None]
+        :param key: the key to seek
+        :type key: Any
+        :param reverse: if True, the floor of the key is sought
+        :type reverse: bool
+        :return: the found node or the null leaf
+        :rtype: RedBlackNode
+        """
+        null = self._NULL
+        candidate = null
+        if node is None:
+            current = self.__root
+        elif node is null:
+            return null
+        elif reverse:
+            current = node
+            ahead = bool(key < node.key)
+            while (parent := current.parent) is not None:
+                if (current is parent.right) == ahead \
+                        and (not key < parent.key) == ahead:
+                    if ahead:
+                        candidate = parent
+                    break
+                current = parent
+        else:
+            current = node
+            ahead = bool(node.key < key)
+            while (parent := current.parent) is not None:
+                if (current is parent.left) == ahead \
+                        and (not parent.key < key) == ahead:
+                    if ahead:
+                        candidate = parent
+                    break
+                current = parent
+
+        if reverse:
+            while current is not null:
+                if key < current.key:
+                    current = current.left
+                else:
+                    candidate = current
+                    current = current.right
+        else:
+            while current is not null:
+                if current.key < key:
+                    current = current.right
+                else:
+                    candidate = current
+                    current = current.left
+        return candidate
 
-    @_null_validation
-    @_type_validation
-    @_check_comparable
+    @_validation
     def remove(self, value) -> bool:
         """
         Deletes a value from the RedBlackTree.
@@ -244,27 +580,81 @@ class RedBlackTree:
         :return: False if the value does not exist in the tree, True otherwise
         :rtype: bool
         """
-        if (
-                node := self.__contains(
-                    value)) is self._NULL or node.value != value:
+        self._own()
+        key = value if self.__key is None else self.__key(value)
+        if (node := self.__contains(key)) is self._NULL:
             return False
 
+        self.__unlink(node)
+        return True
+
+    def _extreme(self, last: bool) -> Any:
+        """
+        Returns the lowest value of the tree, or the greatest one if last is
+        True, in *O(1)* from the cached first and last nodes.
+
+        :param last: if True, the greatest value is returned
+        :type last: bool
+        :return: the lowest or greatest value, or None if the tree is empty
+        :rtype: Any
+        """
+        return (self.__last if last else self.__first).value
+
+    def _poll(self, last: bool) -> Any:
+        """
+        Removes and returns the lowest value of the tree, or the greatest one
+        if last is True. The cached node is unlinked directly, without
+        searching it from the root.
+
+        :param last: if True, the greatest value is removed
+        :type last: bool
+        :return: the removed value, or None if the tree is empty
+        :rtype: Any
+        """
+        self._own()
+        if (node := self.__last if last else self.__first) is self._NULL:
+            return None
+
+        self.__unlink(node)
+        return node.value
+
+    def __unlink(self, node: RedBlackNode) -> None:
+        """
+        Removes the given node from the tree, updating the cached first and
+        last nodes.
+
+        :param node: the node to remove
+        :type node: RedBlackNode
+        """
+        self.__epoch += 1
+        if node is self.__first:
+            self.__first = self.__next_end(node, False)
+        if node is self.__last:
+            self.__last = self.__next_end(node, True)
+
         successor = node
+        if node.left is not self._NULL and node.right is not self._NULL:
+            successor = self.__symmetrical_successor(node.right)
+
+        ancestor = successor.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
         successor_color = successor.color
         if node.left is self._NULL:
-            replacement = node.right
+            replacement, parent = node.right, node.parent
             self.__replace(node, node.right)
         elif node.right is self._NULL:
-            replacement = node.left
+            replacement, parent = node.left, node.parent
             self.__replace(node, node.left)
         else:
-            successor = self.__symmetrical_successor(node.right)
-            successor_color = successor.color
             replacement = successor.right
 
-            if successor.parent == node:
-                replacement.parent = successor
+            if successor.parent is node:
+                parent = successor
             else:
+                parent = successor.parent
                 self.__replace(successor, successor.right)
                 successor.right = node.right
                 successor.right.parent = successor
@@ -273,12 +663,55 @@ class RedBlackTree:
             successor.left = node.left
             successor.left.parent = successor
             successor.color = node.color
+            successor.size = node.size
 
-        if successor_color == self._BLACK:
-            self.__fix_after_deletion(replacement)
+        if successor_color is self._BLACK:
+            self.__fix_after_deletion(replacement, parent)
 
         self.__size -= 1
-        return True
+
+    def __end(self, node: RedBlackNode, last: bool) -> RedBlackNode:
+        """
+        Returns the first node of the given subtree, or the last one if last
+        is True.
+
+        :param node: the root of the subtree
+        :type node: RedBlackNode
+        :param last: if True, the last node is returned
+        :type last: bool
+        :return: the first or last node, or the null leaf if it is empty
+        :rtype: RedBlackNode
+        """
+        while node is not self._NULL \
+                and (child := node.right if last else node.left) \
+                is not self._NULL:
+            node = child
+        return node
+
+    def __next_end(self, node: RedBlackNode, last: bool) -> RedBlackNode:
+        """
+        Returns the node that becomes the first node of the tree when the
+        given first node is removed, or the last node if last is True. Since
+        the first node has no left child, it is the first node of its right
+        subtree or, if it is empty, its parent.
+
+        :param node: the first or last node of the tree
+        :type node: RedBlackNode
+        :param last: if True, the given node is the last one
+        :type last: bool
+        :return: the next first or last node, or the null leaf
+        :rtype: RedBlackNode
+        """
+        if (child := node.left if last else node.right) is not self._NULL:
+            return self.__end(child, last)
+        return self._NULL if node.parent is None else node.parent
+
+    def __reset_ends(self) -> None:
+        """
+        Finds the first and last nodes of the tree after it is replaced.
+        """
+        self.__first = self.__end(self.__root, False)
+        self.__last = self.__end(self.__root, True)
 
     def size(self) -> int:
         """
@@ -302,19 +735,710 @@ class RedBlackTree:
         """
         Clears the RedBlackTree.
         """
-        self.__root = self._NULL
+        self._own(False)
+        self.__root = self.__first = self.__last = self._NULL
         self.__size = 0
+        self.__epoch += 1
+
+    def bulk_load(self, values: Iterable) -> int:
+        """
+        Inserts all the given values at once building a balanced RedBlackTree
+        bottom-up. The values are validated and sorted once (already sorted
+        input is detected and not sorted again), duplicates are discarded and
+        the tree is built in *O(n)* without any rotation. If the tree is not
+        empty, its values are merged with the given ones and the tree is
+        rebuilt. If some value is not valid, no value will be inserted. If the
+        tree has a key function, every key is computed once.
+
+        :param values: values to insert into the RedBlackTree
+        :type values: Iterable
+        :return: the number of inserted values
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        keys, values = self.__sorted_unique(values)
+
+        if not self.is_empty():
+            keys, values = self.__merge(*self._sorted_items(), keys, values,
+                                        True, True, True)
+
+        old_size = self.size()
+        self._load_sorted(keys, values)
+        return self.size() - old_size
+
+    @_validation
+    def split(self, value: Any) -> Tuple['RedBlackTree', Any,
+                                          'RedBlackTree']:
+        """
+        Splits the RedBlackTree by the given value in *O(log n)*, moving its
+        nodes to two new trees of the same class and key function: the
+        values lower than the given one and the values greater than it. The
+        value equal to the given one, if any, is returned between both trees.
+        The nodes are relinked with joins instead of copied, so this tree is
+        left empty.
+
+        :param value: the value to split by
+        :type value: Any
+        :return: the tree with the lower values, the value equal to the given
+            one or None, and the tree with the greater values
+        :rtype: Tuple[RedBlackTree, Any, RedBlackTree]
+        """
+        self._own()
+        key = value if (key_function := self.__key) is None \
+            else key_function(value)
+        root = self.__root
+        lower, lower_height, found, higher, higher_height = self.__split(
+            root, self.__black_height(root), key)
+        self.clear()
+        return (self.__wrap(lower), None if found is None else found.value,
+                self.__wrap(higher))
+
+    @staticmethod
+    def join(left: 'RedBlackTree', pivot: Any,
+             right: 'RedBlackTree') -> 'RedBlackTree':
+        """
+        Joins two trees and a pivot value into a new tree, the inverse of
+        :meth:`split`. Every value of the left tree must be lower than the
+        pivot and every value of the right tree must be greater than it. The
+        pivot may be None to join both trees alone. The shorter tree is hung
+        from the spine of the taller one at the node of its same black height
+        and the colors are fixed upwards, so it runs in *O(log n)*. The nodes
+        are moved, so both given trees are left empty.
+
+        :param left: the tree with the lower values
+        :type left: RedBlackTree
+        :param pivot: the value between both trees, or None
+        :type pivot: Any
+        :param right: the tree with the greater values
+        :type right: RedBlackTree
+        :return: a new tree with the values of both trees and the pivot
+        :rtype: RedBlackTree
+        :raises TypeError: if the trees do not share the engine, type and key
+            function, or the pivot type does not match them
+        :raises ValueError: if the values are not ordered
+        :raises ClassCastException: if the pivot is not comparable
+        """
+        return left._join(pivot, right)
+
+    def _join(self, pivot: Any, right: 'RedBlackTree') -> 'RedBlackTree':
+        """
+        Joins the current tree, the pivot and the given tree. See
+        :meth:`join`.
+
+        :param pivot: the value between both trees, or None
+        :type pivot: Any
+        :param right: the tree with the greater values
+        :type right: RedBlackTree
+        :return: a new tree with the values of both trees and the pivot
+        :rtype: RedBlackTree
+        """
+        self._check_joinable(right)
+        key = self._pivot_key(pivot, self.__last.key, right.__first.key)
+        self._own()
+        right._own()
+
+        left_height = self.__black_height(self.__root)
+        right_height = self.__black_height(right.__root)
+        if pivot is None:
+            root, _ = self.__join_pair(self.__root, left_height,
+                                       right.__root, right_height)
+        else:
+            node = RedBlackNode(pivot, self._NULL, self._NULL, self._RED,
+                                None, key)
+            root, _ = self.__join(self.__root, left_height, node,
+                                  right.__root, right_height)
+
+        self.clear()
+        right.clear()
+        return self.__wrap(root)
+
+    def _check_joinable(self, right: 'RedBlackTree') -> None:
+        """
+        Checks that the given tree can be joined with the current one, which
+        requires the same storage engine, type and key function.
+
+        :param right: the tree to join with
+        :type right: RedBlackTree
+        :raises TypeError: if the trees cannot be joined
+        """
+        if not isinstance(right, RedBlackTree) \
+                or type(right)._join is not type(self)._join \
+                or right.key is not self.key \
+                or right.object_type is not self.object_type:
+            raise TypeError("Only trees with the same engine, type and key "
+                            "function can be joined")
+
+    def _pivot_key(self, pivot: Any, last: Any, first: Any) -> Any:
+        """
+        Validates the pivot of a join and checks that the last key of the
+        left tree, the pivot key and the first key of the right tree are
+        strictly increasing. The missing keys are given as None.
+
+        :param pivot: the value between both trees, or None
+        :type pivot: Any
+        :param last: the last key of the left tree, or None if it is empty
+        :type last: Any
+        :param first: the first key of the right tree, or None if it is empty
+        :type first: Any
+        :return: the key of the pivot, or None if there is no pivot
+        :rtype: Any
+        :raises TypeError: if the pivot type does not match the tree type
+        :raises ValueError: if the keys are not ordered
+        :raises ClassCastException: if the pivot is not comparable
+        """
+        key = None
+        if pivot is not None:
+            if type(pivot) not in self.__valid_types:
+                self._validate(pivot)
+            key = pivot if self.__key is None else self.__key(pivot)
+
+        keys = [item for item in (last, key, first) if item is not None]
+        if not all(map(operator.lt, keys, islice(keys, 1, None))):
+            raise ValueError("The values of the left tree must be lower than "
+                             "the pivot and the values of the right tree")
+        return key
+
+    def _sorted_items(self) -> Tuple[List, List]:
+        """
+        Returns the keys of the tree in order and the list of their values.
+
+        :return: the sorted list of keys and the list of their values
+        :rtype: Tuple[List, List]
+        """
+        nodes = list(self.__inorder(True))
+        values = [node.value for node in nodes]
+        if self.__key is None:
+            return values, values
+        return [node.key for node in nodes], values
+
+    def _keys(self) -> Iterator[Any]:
+        """
+        Returns an iterator over the keys of the tree in ascending order,
+        without copying them.
+
+        :return: an iterator over the sorted keys
+        :rtype: Iterator[Any]
+        """
+        return map(operator.attrgetter("key"), self.__inorder(True))
+
+    def _load_sorted(self, keys: List, values: List) -> None:
+        """
+        Replaces the content of the tree with the given values, building a
+        balanced tree bottom-up in *O(n)*. The keys must be sorted and unique
+        and the values must be valid, since they are not checked.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        """
+        self._own(False)
+        self.__root = self.__detach(self.__build(
+            keys, values, 0, len(values), 0, len(values).bit_length() - 1,
+            None))
+        self.__size = len(values)
+        self.__epoch += 1
+        self.__reset_ends()
+
+    def _merge_sorted(self, keys: List, values: List, left: bool,
+                      both: bool, right: bool) -> None:
+        """
+        Replaces the content of the tree with its merge with the given sorted
+        and unique keys, with the same flags as :meth:`__merge`. If the given
+        keys are few compared with the values of the tree, they are applied
+        one by one with :meth:`__merge_each`, without rebuilding the tree.
+        Otherwise, both are merged linearly and the tree is rebuilt in
+        *O(n + m)*.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :param left: if True, the keys only found in the tree are kept
+        :type left: bool
+        :param both: if True, the keys found in both are kept
+        :type both: bool
+        :param right: if True, the keys only found in the given list are kept
+        :type right: bool
+        """
+        size = self.size()
+        if len(values) * size.bit_length() < self._REBUILD_RATIO * size:
+            self._own()
+            self.__merge_each(keys, values, left, both, right)
+        else:
+            self._load_sorted(*self.__merge(*self._sorted_items(), keys,
+                                            values, left, both, right))
+
+    def __merge_each(self, keys: List, values: List, left: bool, both: bool,
+                     right: bool) -> None:
+        """
+        Private method that merges the given sorted and unique keys into the
+        tree one by one, with the same flags as :meth:`__merge`. A finger is
+        moved from each key to the next one with :meth:`_finger`, and every
+        found key is removed, or every missing key inserted, at the finger
+        without searching it again, in *O(m log n)*. For an intersection, the
+        found values are collected and the tree is rebuilt with them.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :param left: if True, the keys only found in the tree are kept
+        :type left: bool
+        :param both: if True, the keys found in both are kept
+        :type both: bool
+        :param right: if True, the keys only found in the given list are kept
+        :type right: bool
+        """
+        finger = None
+        if not left:
+            found_keys, found_values = [], []
+            for key in keys:
+                finger = self._finger(finger, key)
+                found_key, value = self._item(finger)
+                if found_key is None:
+                    break
+                if not key < found_key:
+                    found_keys.append(found_key)
+                    found_values.append(value)
+            self._load_sorted(found_keys, found_values)
+            return
+
+        for key, value in zip(keys, values):
+            finger = self._finger(finger, key)
+            found_key = self._item(finger)[0]
+            if found_key is not None and not key < found_key:
+                if not both:
+                    finger = self._remove_node(finger)
+            elif right:
+                finger = self._insert_before(finger, value, key)
+            elif found_key is None:
+                break
+
+    def _remove_range(self, low: Any, low_inclusive: bool, high: Any,
+                      high_inclusive: bool) -> int:
+        """
+        Removes the nodes whose keys are between the given bounds, which must
+        be ordered. The tree is split by both bounds and the outer trees are
+        joined back, so the nodes of the range are detached as whole
+        subtrees, without rebalancing the tree once per node, in *O(log n)*.
+
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is removed
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is removed
+        :type high_inclusive: bool
+        :return: the number of removed nodes
+        :rtype: int
+        """
+        null = self._NULL
+        if self.__root is null:
+            return 0
+
+        self._own()
+        lower, lower_height = null, 0
+        higher, higher_height = null, 0
+        middle = self.__root
+        middle_height = self.__black_height(middle)
+        if low is not None:
+            lower, lower_height, found, middle, middle_height = self.__split(
+                middle, middle_height, low)
+            if found is not None and not low_inclusive:
+                lower, lower_height = self.__join(lower, lower_height, found,
+                                                  null, 0)
+        if high is not None:
+            middle, middle_height, found, higher, higher_height = \
+                self.__split(middle, middle_height, high)
+            if found is not None and not high_inclusive:
+                higher, higher_height = self.__join(null, 0, found, higher,
+                                                    higher_height)
+
+        root, _ = self.__join_pair(lower, lower_height, higher, higher_height)
+        removed = self.__size - root.size
+        self.__root = self.__detach(root)
+        self.__size = root.size
+        self.__epoch += 1
+        self.__reset_ends()
+        return removed
+
+    def __sorted_unique(self, values: Iterable) -> Tuple[List, List]:
+        """
+        Validates the given values and returns them sorted by key and without
+        duplicates, along with their keys. If two values have equal keys, the
+        first one is kept. If the tree has no key function, both lists hold
+        the same values.
+
+        :param values: values to validate and sort
+        :type values: Iterable
+        :return: the sorted list of unique keys and the list of their values
+        :rtype: Tuple[List, List]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        values = list(values)
+        valid_types = self.__valid_types
+        for value in values:
+            if type(value) not in valid_types:
+                self._validate(value)
+
+        key = self.__key
+        keys = values if key is None else list(map(key, values))
+        if all(map(operator.lt, keys, islice(keys, 1, None))):
+            return keys, values
+
+        if key is None:
+            values.sort()
+            unique = values[:1]
+            for value in islice(values, 1, None):
+                if not value == unique[-1]:
+                    unique.append(value)
+
+            return unique, unique
+
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        unique_keys, unique = [], []
+        for index in order:
+            if not unique_keys or not keys[index] == unique_keys[-1]:
+                unique_keys.append(keys[index])
+                unique.append(values[index])
+
+        return unique_keys, unique
+
+    @staticmethod
+    def __merge(keys: List, values: List, other_keys: List, others: List,
+                left: bool, both: bool, right: bool) -> Tuple[List, List]:
+        """
+        Merges two sorted lists of unique keys in one linear pass, keeping the
+        keys found only in the first list if left is True, the keys found in
+        both lists if both is True and the keys found only in the second list
+        if right is True. If a key is kept from both lists, the value from the
+        first list is kept.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :param other_keys: sorted list of unique keys
+        :type other_keys: List
+        :param others: values of the other keys
+        :type others: List
+        :param left: if True, the keys only found in the first list are kept
+        :type left: bool
+        :param both: if True, the keys found in both lists are kept
+        :type both: bool
+        :param right: if True, the keys only found in the second list are kept
+        :type right: bool
+        :return: the merged list of keys and the list of their values
+        :rtype: Tuple[List, List]
+        """
+        merged_keys, merged = [], []
+        i = j = 0
+        while i < len(keys) and j < len(other_keys):
+            if keys[i] < other_keys[j]:
+                if left:
+                    merged_keys.append(keys[i])
+                    merged.append(values[i])
+                i += 1
+            elif other_keys[j] < keys[i]:
+                if right:
+                    merged_keys.append(other_keys[j])
+                    merged.append(others[j])
+                j += 1
+            else:
+                if both:
+                    merged_keys.append(keys[i])
+                    merged.append(values[i])
+                i += 1
+                j += 1
+
+        if left:
+            merged_keys.extend(islice(keys, i, None))
+            merged.extend(islice(values, i, None))
+        if right:
+            merged_keys.extend(islice(other_keys, j, None))
+            merged.extend(islice(others, j, None))
+        return merged_keys, merged
+
+    def __build(self, keys: List, values: List, start: int, end: int,
+                depth: int, red_depth: int,
+                parent: Union[RedBlackNode, None]) -> RedBlackNode:
+        """
+        Builds a balanced subtree with the sorted values between the start
+        (inclusive) and end (exclusive) indexes. Since the subtrees of every
+        node differ at most by one in size, all the leaves are found in the
+        last two levels, so coloring red the nodes of the deepest level keeps
+        the same black height in every path.
+
+        :param keys: sorted list of unique keys
+        :type keys: List
+        :param values: values of the keys
+        :type values: List
+        :param start: index of the first value of the subtree
+        :type start: int
+        :param end: index after the last value of the subtree
+        :type end: int
+        :param depth: depth of the subtree root
+        :type depth: int
+        :param red_depth: depth of the nodes that must be colored red
+        :type red_depth: int
+        :param parent: parent of the subtree root
+        :type parent: Union[RedBlackNode, None]
+        :return: the root of the built subtree
+        :rtype: RedBlackNode
+        """
+        if start >= end:
+            return self._NULL
+
+        middle = (start + end) // 2
+        node = RedBlackNode(values[middle], self._NULL, self._NULL,
+                            depth == red_depth, parent, keys[middle],
+                            end - start)
+        node.left = self.__build(keys, values, start, middle, depth + 1,
+                                 red_depth, node)
+        node.right = self.__build(keys, values, middle + 1, end, depth + 1,
+                                  red_depth, node)
+        return node
+
+    def __wrap(self, root: RedBlackNode) -> 'RedBlackTree':
+        """
+        Returns a new tree of the same class and key function whose root is
+        the given detached subtree.
+
+        :param root: the root of the subtree
+        :type root: RedBlackNode
+        :return: the new tree
+        :rtype: RedBlackTree
+        """
+        tree = type(self)(self.object_type, key=self.__key)
+        tree.__valid_types.update(self.__valid_types)
+        tree.__root = self.__detach(root)
+        tree.__size = root.size
+        tree.__reset_ends()
+        return tree
+
+    def __detach(self, root: RedBlackNode) -> RedBlackNode:
+        """
+        Makes the given node the root of a valid tree, removing its parent
+        and coloring it black.
+
+        :param root: the root of the subtree
+        :type root: RedBlackNode
+        :return: the given node
+        :rtype: RedBlackNode
+        """
+        if root is not self._NULL:
+            root.parent = None
+            root.color = self._BLACK
+        return root
+
+    def __black_height(self, node: RedBlackNode) -> int:
+        """
+        Returns the black height of the given subtree, the number of black
+        nodes in any path from its root to a leaf.
 
-    def __fix_after_insertion(self, node: TreeNode) -> None:
+        :param node: the root of the subtree
+        :type node: RedBlackNode
+        :return: the black height of the subtree
+        :rtype: int
+        """
+        height = 0
+        while node is not self._NULL:
+            height += node.color is self._BLACK
+            node = node.left
+        return height
+
+    def __join(self, left: RedBlackNode, left_height: int,
+               pivot: RedBlackNode, right: RedBlackNode,
+               right_height: int) -> Tuple[RedBlackNode, int]:
+        """
+        Joins two detached subtrees and a pivot node whose key is between
+        them. If both subtrees have the same black height, they become the
+        children of the black pivot. Otherwise, the spine of the taller one is
+        descended until the black node with the black height of the shorter
+        one, the red pivot takes its place with both as children and the red
+        violation is fixed as after an insertion. It runs in
+        *O(|left_height - right_height| + 1)*.
+
+        :param left: the root of the subtree with the lower keys
+        :type left: RedBlackNode
+        :param left_height: the black height of the left subtree
+        :type left_height: int
+        :param pivot: the node to place between both subtrees
+        :type pivot: RedBlackNode
+        :param right: the root of the subtree with the greater keys
+        :type right: RedBlackNode
+        :param right_height: the black height of the right subtree
+        :type right_height: int
+        :return: the root of the joined subtree, which is detached and black,
+            and its black height
+        :rtype: Tuple[RedBlackNode, int]
+        """
+        if left.color is self._RED:
+            left.color = self._BLACK
+            left_height += 1
+        if right.color is self._RED:
+            right.color = self._BLACK
+            right_height += 1
+
+        if left_height == right_height:
+            pivot.color = self._BLACK
+            pivot.parent = None
+            self.__link(pivot, left, right)
+            return pivot, left_height + 1
+
+        taller = left_height > right_height
+        parent, node = None, left if taller else right
+        height = max(left_height, right_height)
+        while height > min(left_height, right_height) \
+                or node.color is self._RED:
+            height -= node.color is self._BLACK
+            parent, node = node, node.right if taller else node.left
+
+        pivot.color = self._RED
+        pivot.parent = parent
+        if taller:
+            parent.right = pivot
+            self.__link(pivot, node, right)
+        else:
+            parent.left = pivot
+            self.__link(pivot, left, node)
+
+        while parent is not None:
+            parent.size += pivot.size - node.size
+            parent = parent.parent
+
+        self.__root = left if taller else right
+        height = max(left_height, right_height)
+        if pivot.parent.color is self._RED:
+            height += self.__fix_after_insertion(pivot)
+        return self.__root, height
+
+    def __link(self, node: RedBlackNode, left: RedBlackNode,
+               right: RedBlackNode) -> None:
+        """
+        Sets the children of the given node and updates its size.
+
+        :param node: the parent node
+        :type node: RedBlackNode
+        :param left: the new left child
+        :type left: RedBlackNode
+        :param right: the new right child
+        :type right: RedBlackNode
+        """
+        node.left, node.right = left, right
+        if left is not self._NULL:
+            left.parent = node
+        if right is not self._NULL:
+            right.parent = node
+        node.size = left.size + right.size + 1
+
+    def __join_pair(self, left: RedBlackNode, left_height: int,
+                    right: RedBlackNode,
+                    right_height: int) -> Tuple[RedBlackNode, int]:
+        """
+        Joins two detached subtrees without a pivot, splitting the last node
+        of the left subtree off to use it as the pivot.
+
+        :param left: the root of the subtree with the lower keys
+        :type left: RedBlackNode
+        :param left_height: the black height of the left subtree
+        :type left_height: int
+        :param right: the root of the subtree with the greater keys
+        :type right: RedBlackNode
+        :param right_height: the black height of the right subtree
+        :type right_height: int
+        :return: the root of the joined subtree and its black height
+        :rtype: Tuple[RedBlackNode, int]
+        """
+        if left is self._NULL:
+            return right, right_height
+        if right is self._NULL:
+            return left, left_height
+
+        left, left_height, last, _, _ = self.__split(
+            left, left_height, self.__end(left, True).key)
+        return self.__join(left, left_height, last, right, right_height)
+
+    def __split(self, node: RedBlackNode, height: int, key: Any) \
+            -> Tuple[RedBlackNode, int, Union[RedBlackNode, None],
+                     RedBlackNode, int]:
+        """
+        Splits a detached subtree by the given key. The subtrees hanging from
+        the search path are joined back on each side from the bottom up, and
+        since their black heights grow along the path, the joins cost
+        *O(log n)* in total.
+
+        :param node: the root of the subtree
+        :type node: RedBlackNode
+        :param height: the black height of the subtree
+        :type height: int
+        :param key: the key to split by
+        :type key: Any
+        :return: the subtree with the lower keys and its black height, the
+            node with the given key or None, and the subtree with the greater
+            keys and its black height
+        :rtype: Tuple[RedBlackNode, int, Union[RedBlackNode, None],
+            RedBlackNode, int]
+        """
+        if node is self._NULL:
+            return node, 0, None, node, 0
+
+        left, height, right = self.__children(node, height)
+        if key < node.key:
+            lower, lower_height, found, higher, higher_height = self.__split(
+                left, height, key)
+            higher, higher_height = self.__join(higher, higher_height, node,
+                                                right, height)
+        elif node.key < key:
+            lower, lower_height, found, higher, higher_height = self.__split(
+                right, height, key)
+            lower, lower_height = self.__join(left, height, node, lower,
+                                              lower_height)
+        else:
+            return left, height, node, right, height
+        return lower, lower_height, found, higher, higher_height
+
+    def __children(self, node: RedBlackNode,
+                   height: int) -> Tuple[RedBlackNode, int, RedBlackNode]:
+        """
+        Detaches the children of the given node.
+
+        :param node: the node whose children are detached
+        :type node: RedBlackNode
+        :param height: the black height of the node
+        :type height: int
+        :return: the left child, the black height of both children and the
+            right child
+        :rtype: Tuple[RedBlackNode, int, RedBlackNode]
+        """
+        left, right = node.left, node.right
+        if left is not self._NULL:
+            left.parent = None
+        if right is not self._NULL:
+            right.parent = None
+        return left, height - (node.color is self._BLACK), right
+
+    def __fix_after_insertion(self, node: RedBlackNode) -> bool:
         """
         Fixes the RedBlackTree after an insertion operation.
 
         :param node: the node that was inserted
+        :return: True if the root had to be recolored black, so the black
+            height of the tree grew by one
+        :rtype: bool
         """
-        while node.parent.color == self._RED:
-            if node.parent == node.parent.parent.right:
+        while node.parent.color is self._RED:
+            if node.parent is node.parent.parent.right:
                 uncle = node.parent.parent.left
-                if uncle.color == self._RED:
+                if uncle.color is self._RED:
                     uncle.color = self._BLACK
                     node.parent.color = self._BLACK
                     node.parent.parent.color = self._RED
@@ -329,7 +1453,7 @@ class RedBlackTree:
             else:
                 uncle = node.parent.parent.right
 
-                if uncle.color == self._RED:
+                if uncle.color is self._RED:
                     uncle.color = self._BLACK
                     node.parent.color = self._BLACK
                     node.parent.parent.color = self._RED
@@ -341,17 +1465,19 @@ class RedBlackTree:
                     node.parent.color = self._BLACK
                     node.parent.parent.color = self._RED
                     self.__right_rotation(node.parent.parent)
-            if node == self.__root:
+            if node is self.__root:
                 break
 
+        grown = self.__root.color is self._RED
         self.__root.color = self._BLACK
+        return grown
 
-    def __left_rotation(self, node: TreeNode) -> None:
+    def __left_rotation(self, node: RedBlackNode) -> None:
         """
         Performs a left rotation on a node.
 
         :param node: the node to perform the rotation on
-        :type node: TreeNode
+        :type node: RedBlackNode
         """
         other = node.right
         node.right = other.left
@@ -361,19 +1487,21 @@ class RedBlackTree:
         other.parent = node.parent
         if node.parent is None:
             self.__root = other
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = other
         else:
             node.parent.right = other
         other.left = node
         node.parent = other
+        other.size = node.size
+        node.size = node.left.size + node.right.size + 1
 
-    def __right_rotation(self, node: TreeNode) -> None:
+    def __right_rotation(self, node: RedBlackNode) -> None:
         """
         Performs a right rotation on a node.
 
         :param node: The node to perform the rotation on
-        :type node: TreeNode
+        :type node: RedBlackNode
         """
         other = node.left
         node.left = other.right
@@ -383,147 +1511,187 @@ class RedBlackTree:
         other.parent = node.parent
         if node.parent is None:
             self.__root = other
-        elif node == node.parent.right:
+        elif node is node.parent.right:
             node.parent.right = other
         else:
             node.parent.left = other
         other.right = node
         node.parent = other
+        other.size = node.size
+        node.size = node.left.size + node.right.size + 1
 
-    def __fix_after_deletion(self, node) -> None:
+    def __fix_after_deletion(self, node: RedBlackNode,
+                             parent: Union[RedBlackNode, None]) -> None:
         """
-        Fixes the RedBlackTree after a deletion operation.
+        Fixes the RedBlackTree after a deletion operation. The parent of the
+        node is given apart, since the node may be the null leaf, which is
+        shared by every tree and never modified.
 
-        :param node: the node that was deleted
-        :type node: TreeNode
+        :param node: the node that replaced the deleted one
+        :type node: RedBlackNode
+        :param parent: the parent of the node, or None if it is the root
+        :type parent: Union[RedBlackNode, None]
         """
-        while node is not self.__root and node.color == self._BLACK:
-            if node == node.parent.left:
-                sibling = node.parent.right
-                if sibling.color == self._RED:
+        while node is not self.__root and node.color is self._BLACK:
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.color is self._RED:
                     sibling.color = self._BLACK
-                    node.parent.color = self._RED
-                    self.__left_rotation(node.parent)
-                    sibling = node.parent.right
+                    parent.color = self._RED
+                    self.__left_rotation(parent)
+                    sibling = parent.right
 
-                if sibling.left.color == self._BLACK \
-                        and sibling.right.color == self._BLACK:
+                if sibling.left.color is self._BLACK \
+                        and sibling.right.color is self._BLACK:
                     sibling.color = self._RED
-                    node = node.parent
+                    node, parent = parent, parent.parent
                 else:
-                    if sibling.right.color == self._BLACK:
+                    if sibling.right.color is self._BLACK:
                         sibling.left.color = self._BLACK
                         sibling.color = self._RED
                         self.__right_rotation(sibling)
-                        sibling = node.parent.right
+                        sibling = parent.right
 
-                    sibling.color = node.parent.color
-                    node.parent.color = self._BLACK
+                    sibling.color = parent.color
+                    parent.color = self._BLACK
                     sibling.right.color = self._BLACK
-                    self.__left_rotation(node.parent)
+                    self.__left_rotation(parent)
                     node = self.__root
             else:
-                sibling = node.parent.left
-                if sibling.color == self._RED:
+                sibling = parent.left
+                if sibling.color is self._RED:
                     sibling.color = self._BLACK
-                    node.parent.color = self._RED
-                    self.__right_rotation(node.parent)
-                    sibling = node.parent.left
+                    parent.color = self._RED
+                    self.__right_rotation(parent)
+                    sibling = parent.left
 
-                if sibling.right.color == self._BLACK \
-                        and sibling.right.color == self._BLACK:
+                if sibling.right.color is self._BLACK \
+                        and sibling.left.color is self._BLACK:
                     sibling.color = self._RED
-                    node = node.parent
+                    node, parent = parent, parent.parent
                 else:
-                    if sibling.left.color == self._BLACK:
+                    if sibling.left.color is self._BLACK:
                         sibling.right.color = self._BLACK
                         sibling.color = self._RED
                         self.__left_rotation(sibling)
-                        sibling = node.parent.left
+                        sibling = parent.left
 
-                    sibling.color = node.parent.color
-                    node.parent.color = self._BLACK
+                    sibling.color = parent.color
+                    parent.color = self._BLACK
                     sibling.left.color = self._BLACK
-                    self.__right_rotation(node.parent)
+                    self.__right_rotation(parent)
                     node = self.__root
 
-        node.color = self._BLACK
+        if node is not self._NULL:
+            node.color = self._BLACK
 
-    def __replace(self, node: TreeNode, other: TreeNode) -> None:
+    def __replace(self, node: RedBlackNode, other: RedBlackNode) -> None:
         """
         Replaces a node with another node.
 
         :param node: the node to be replaced
-        :type node: TreeNode
+        :type node: RedBlackNode
         :param other: the node to replace with
-        :type other: TreeNode
+        :type other: RedBlackNode
         """
-        if not node.parent:
+        if node.parent is None:
             self.__root = other
-        elif node == node.parent.left:
+        elif node is node.parent.left:
             node.parent.left = other
         else:
             node.parent.right = other
-        other.parent = node.parent
+        if other is not self._NULL:
+            other.parent = node.parent
 
-    def __symmetrical_successor(self, node) -> TreeNode:
+    def __symmetrical_successor(self, node) -> RedBlackNode:
         """
         Finds the symmetrical successor of a node.
 
         :param node: the node to find the symmetrical successor of
-        :type node: TreeNode
+        :type node: RedBlackNode
         :return: the symmetrical successor of the node
-        :rtype: TreeNode
+        :rtype: RedBlackNode
         """
         while node.left is not self._NULL:
             node = node.left
         return node
 
-    def __contains(self, value) -> TreeNode:
+    def __contains(self, key) -> RedBlackNode:
         """
-        Checks if the given value is contained in the current RedBlackTree and
-        returns the TreeNode where it is contained or a leaf.
+        Searches the node having the given key in the current RedBlackTree.
+        The descent makes a single ordering comparison per level, keeping the
+        last node whose key is not greater than the given one, and only checks
+        the equality of that node at the end.
 
-        :param value: the value to check
-        :type value: Any
-        :return: TreeNode having the searched value or a leaf
-        :rtype: TreeNode
+        :param key: the key to search
+        :type key: Any
+        :return: RedBlackNode having the searched key or the null leaf
+        :rtype: RedBlackNode
         """
-        parent = self._NULL
+        candidate = self._NULL
         current = self.__root
 
         while current is not self._NULL:
-            if current.value == value:
-                return current
-
-            parent = current
-            if value < current.value:
+            if key < current.key:
                 current = current.left
             else:
+                candidate = current
                 current = current.right
 
-        return parent
+        if candidate is not self._NULL and candidate.key == key:
+            return candidate
 
-    def __inorder(self, inorder: bool) -> Any:
+        return self._NULL
+
+    def __inorder(self, inorder: bool) -> Iterator[RedBlackNode]:
         """
-        Generator that traverses the RedBlackTree in-order or reversed.
+        Generator that traverses the RedBlackTree in-order or reversed,
+        starting from the cached first or last node.
 
         :param inorder: if True the route will be in-order else reversed
         :type inorder: bool
         """
-        stack = SimpleStack()
-        current = self.__root
-
-        while True:
-            if current is not self._NULL:
-                stack.push(current)
-                current = current.left if inorder else current.right
-            elif not stack.is_empty():
-                current = stack.pull()
-                yield current
-                current = current.right if inorder else current.left
-            else:
-                break
+        return self.__walk(self.__first if inorder else self.__last,
+                           not inorder)
+
+    def __walk(self, node: RedBlackNode,
+               reverse: bool) -> Iterator[RedBlackNode]:
+        """
+        Generator that traverses the RedBlackTree from the given node, in
+        order or reversed, stepping from every node to its successor through
+        the parent pointers. No stack is kept, so it uses *O(1)* extra memory
+        and every node is visited at most three times.
+
+        :param node: the first node, or the null leaf to traverse nothing
+        :type node: RedBlackNode
+        :param reverse: if True the route will be reversed
+        :type reverse: bool
+        """
+        null = self._NULL
+        if reverse:
+            while node is not null:
+                yield node
+                if node.left is not null:
+                    node = node.left
+                    while node.right is not null:
+                        node = node.right
+                else:
+                    parent = node.parent
+                    while parent is not None and node is parent.left:
+                        node, parent = parent, parent.parent
+                    node = null if parent is None else parent
+        else:
+            while node is not null:
+                yield node
+                if node.right is not null:
+                    node = node.right
+                    while node.left is not null:
+                        node = node.left
+                else:
+                    parent = node.parent
+                    while parent is not None and node is parent.right:
+                        node, parent = parent, parent.parent
+                    node = null if parent is None else parent
 
     def __nodes_color_arrays(self):
         """
@@ -543,41 +1711,47 @@ class RedBlackTree:
         Check equality between the current instance and a given object.
         This method is called when using built-in operator '=='.
 
+        If both trees have the same key function, their sorted keys are
+        compared in a single lockstep walk that stops at the first
+        difference, in *O(n)*. Otherwise, every element is searched in the
+        other tree. Other objects are left to their own comparison.
+
         :param other: other instance to compare with
         :type other: Any
         :return: True if instances are equal else False
         :rtype: bool
         """
-        if isinstance(other, RedBlackTree):
-            if self.size() != other.size():
-                return False
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        if self.size() != other.size():
+            return False
 
-            for value in self:
-                if value not in other:
-                    return False
+        if other.key is not self.__key:
+            return all(value in other for value in self)
 
-            return True
-        else:
-            return False
+        for key, other_key in zip(self._keys(), other._keys()):
+            if not key == other_key:
+                return False
+
+        return True
 
-    def __iter__(self) -> Any:
+    def __iter__(self) -> Iterator[Any]:
         """
         Method to iterate over the RedBlackTree instance.
+
         :return: an iterator over the RedBlackTree instance
-        :return: Any
+        :rtype: Iterator[Any]
         """
-        for node in self.__inorder(True):
-            yield node.value
+        return map(operator.attrgetter("value"), self.__inorder(True))
 
-    def __reversed__(self) -> Any:
+    def __reversed__(self) -> Iterator[Any]:
         """
         Method to iterate reversely over the RedBlackTree instance.
 
         :return: an iterator over the RedBlackTree instance
-        :rtype: Any
+        :rtype: Iterator[Any]
         """
-        for node in self.__inorder(False):
-            yield node.value
+        return map(operator.attrgetter("value"), self.__inorder(False))
 
     def __str__(self) -> str:
         """
@@ -588,9 +1762,7 @@ class RedBlackTree:
         """
         return f"{[value for value in self]}"
 
-    @_null_validation
-    @_type_validation
-    @_check_comparable
+    @_validation
     def __contains__(self, value) -> bool:
         """
         Check if the given value is contained in the RedBlackTree or not.
@@ -601,7 +1773,8 @@ class RedBlackTree:
         :return: True if it is contained else False
         :rtype: bool
         """
-        return self.__contains(value).value == value
+        return self.__contains(value if self.__key is None
+                               else self.__key(value)) is not self._NULL
 
     def __len__(self) -> int:
         """
@@ -613,6 +1786,14 @@ class RedBlackTree:
         """
         return self.__size
 
+    def __del__(self) -> None:
+        """
+        Leaves the nodes shared with copy-on-write clones when the tree is
+        destroyed, so the last of them does not copy them.
+        """
+        if (shared := self.__shared) is not None:
+            shared[0] -= 1
+
     def __setattr__(self, key, value) -> None:
         """
         Method called when trying to set a value to an attribute that does not
@@ -632,16 +1813,61 @@ class RedBlackTree:
 class TreeSet(RedBlackTree):
     """
     Class that represents a set based on a tree. The elements are ordered
-    using its natural ordering.
+    using its natural ordering, or by the keys returned by the given key
+    function. Each key is computed once, when its element is inserted, so the
+    descents compare the stored keys instead of the elements.
 
     Since this implementation uses a Red-Black Tree, it provides guaranteed
     *O(log n)* time cost for the basic operations.
 
     TreeSet string representation will be provided inorder.
+
+    The storage engine can be selected when creating the TreeSet. The default
+    ``"node"`` engine keeps one node object per element, while the ``"array"``
+    engine (see :class:`array_tree_set.ArrayTreeSet`) keeps the elements and
+    the tree links in parallel arrays indexed by integer node ids.
     """
 
-    def __init__(self, generic_type: Type,
-                 sequence: Collection[E] = None) -> None:
+    _ENGINES = ("node", "array")
+    _SEEK_RATIO = 4
+
+    def __new__(cls, generic_type: Type, sequence: Collection[E] = None,
+                engine: str = "node", validate: bool = True,
+                key: Callable[[E], Any] = None) -> 'TreeSet':
+        """
+        Creates a new TreeSet instance of the class matching the given
+        storage engine and validation mode.
+
+        :param generic_type: the generic type of the class
+        :type generic_type: type
+        :param sequence: a collection to take items from
+        :type sequence: Collection[E]
+        :param engine: the storage engine, "node" or "array"
+        :type engine: str
+        :param validate: if False, the values are not validated
+        :type validate: bool
+        :param key: function that returns the sort key of an element
+        :type key: Callable[[E], Any]
+        :return: a new TreeSet instance
+        :rtype: TreeSet
+        :raises ValueError: if the given engine does not exist
+        """
+        if engine not in cls._ENGINES:
+            raise ValueError(f"Engine must be one of {cls._ENGINES} "
+                             f"but '{engine}' was given")
+
+        if engine == "array" and cls is TreeSet:
+            from array_tree_set import ArrayTreeSet
+            cls = ArrayTreeSet
+
+        if not validate:
+            cls = cls._unchecked()
+
+        return super().__new__(cls)
+
+    def __init__(self, generic_type: Type, sequence: Collection[E] = None,
+                 engine: str = "node", validate: bool = True,
+                 key: Callable[[E], Any] = None) -> None:
         """
         Initialize an empty TreeSet if type is given or constructs one with the
         elements contained into the given collection.
@@ -651,11 +1877,22 @@ class TreeSet(RedBlackTree):
         :param: sequence: a collection to take items from and add them to
             the TreeSet
         :type sequence: Collection[E]
+        :param engine: the storage engine, "node" (default) or "array"
+        :type engine: str
+        :param validate: if False, the values given to the TreeSet are not
+            validated. It must only be used when the values are known to be
+            not None, of the TreeSet type and comparable
+        :type validate: bool
+        :param key: function that returns the sort key of an element, like
+            ``key=lambda person: person.age``. If it is None, the elements are
+            ordered using its natural ordering
+        :type key: Callable[[E], Any]
         :raises TypeError: if the given values does not match the instance type
+        :raises ValueError: if the given engine does not exist
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
         """
-        super().__init__(generic_type)
+        super().__init__(generic_type, key)
 
         if not sequence:
             return
@@ -671,7 +1908,8 @@ class TreeSet(RedBlackTree):
         """
         Inserts the given values into the current TreeSet. If the type of some
         value does not match the instance TreeSet type, an exception will
-        be thrown, and no element will be added.
+        be thrown, and no element will be added. The values are validated in
+        one pass and merged like in :meth:`add_stream` with atomic True.
 
         :param values: values to insert into the TreeSet.
         :type values: Collection[E]
@@ -687,28 +1925,634 @@ class TreeSet(RedBlackTree):
                 f"Second argument must be a sequence but {type(values)} was given"
             )
 
-        for value in values:
-            if value is None:
-                raise NullPointerException("Value cannot be None")
-
-            if not isinstance(value, self.object_type):
-                raise TypeError(
-                    f"Value type must be '{self.object_type}: {type(value)}'")
+        return self.add_stream(values, atomic=True) == len(values)
+
+    def add_stream(self, values: Iterable[E], chunk_size: int = 4096,
+                   atomic: bool = False) -> int:
+        """
+        Inserts the values of any iterable, like a generator, into the current
+        TreeSet consuming it only once. The values are read in chunks of the
+        given size, and every chunk is validated, sorted and merged into the
+        TreeSet like in :meth:`update`, so only one chunk is held in memory
+        at a time. If some value is not valid, an exception will be thrown
+        and the values of its chunk will not be added, but the previous
+        chunks stay in the TreeSet. If atomic is True, no value is added
+        unless every value is valid: the whole iterable is validated and
+        held before merging it at once.
+
+        :param values: values to insert into the TreeSet
+        :type values: Iterable[E]
+        :param chunk_size: the number of values read and merged at once
+        :type chunk_size: int
+        :param atomic: if True, no value is added if some value is not valid
+        :type atomic: bool
+        :return: the number of inserted values
+        :rtype: int
+        :raises ValueError: if the chunk size is lower than 1
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive but {chunk_size} "
+                             f"was given")
 
         old_size = self.size()
-        for value in values:
-            super().add(value)
+        sorted_unique = self._RedBlackTree__sorted_unique
+        if atomic:
+            self._merge_sorted(*sorted_unique(values), True, True, True)
+        else:
+            iterator = iter(values)
+            while chunk := list(islice(iterator, chunk_size)):
+                self._merge_sorted(*sorted_unique(chunk), True, True, True)
+        return self.size() - old_size
+
+    def remove_all(self, values: Iterable[E]) -> int:
+        """
+        Removes all the given values from the current TreeSet. The values are
+        validated, sorted and deduplicated first, so if some value is not
+        valid, no value will be removed. Then the strategy is chosen by the
+        number of values: a few values are removed one by one, moving a
+        finger from each one to the next, and many values are filtered out of
+        the elements in one linear merge that rebuilds the tree. See
+        :meth:`difference_update`.
+
+        :param values: values to remove from the TreeSet
+        :type values: Iterable[E]
+        :return: the number of removed values
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        old_size = self.size()
+        self.difference_update(values)
+        return old_size - self.size()
 
-        return old_size == self.size() - len(values)
+    def retain_all(self, values: Iterable[E]) -> int:
+        """
+        Removes the elements of the current TreeSet that are not in the given
+        values, choosing the strategy by the number of values like
+        :meth:`remove_all`: a few values are sought one by one and the tree is
+        rebuilt with the found ones, and many values are merged linearly with
+        the elements. See :meth:`intersection_update`.
 
-    def clone(self) -> 'TreeSet':
+        :param values: values to keep in the TreeSet
+        :type values: Iterable[E]
+        :return: the number of removed elements
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        old_size = self.size()
+        self.intersection_update(values)
+        return old_size - self.size()
+
+    def clone(self, copy_on_write: bool = False) -> 'TreeSet':
         """
-        Clones the current TreeSet and returns that clone.
+        Clones the current TreeSet and returns that clone. The structure of
+        the tree is copied directly in *O(n)*, without validating, comparing
+        or rebalancing any element. If copy_on_write is True, the clone
+        shares the nodes with the current TreeSet in *O(1)* and the first of
+        them that is modified copies the nodes then. Every node knows its
+        parent, so a node cannot be shared by two different paths, and the
+        whole tree is copied on that first write, not only the written path.
 
+        :param copy_on_write: if True, the nodes are copied on the first write
+        :type copy_on_write: bool
         :return: a shallow copy of the current TreeSet instance.
         :rtype: TreeSet
         """
-        return TreeSet(self.object_type, self)
+        return self._clone(copy_on_write)
+
+    def union(self, other: Iterable[E]) -> 'TreeSet':
+        """
+        Returns a new TreeSet with the elements of the current TreeSet and
+        the given ones. If an element is in both, the one of the current
+        TreeSet is kept. The elements of both sets are merged in one linear
+        pass and the result is built bottom-up, so it runs in *O(n + m)*.
+        This method is called when using the built-in operator '|'.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: a new TreeSet with the union of both sets
+        :rtype: TreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__combine(other, True, True, True)
+
+    def intersection(self, other: Iterable[E]) -> 'TreeSet':
+        """
+        Returns a new TreeSet with the elements of the current TreeSet that
+        are also in the given ones, merging both sets in *O(n + m)*. This
+        method is called when using the built-in operator '&'.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: a new TreeSet with the intersection of both sets
+        :rtype: TreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__combine(other, False, True, False)
+
+    def difference(self, other: Iterable[E]) -> 'TreeSet':
+        """
+        Returns a new TreeSet with the elements of the current TreeSet that
+        are not in the given ones, merging both sets in *O(n + m)*. This
+        method is called when using the built-in operator '-'.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: a new TreeSet with the difference of both sets
+        :rtype: TreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__combine(other, True, False, False)
+
+    def symmetric_difference(self, other: Iterable[E]) -> 'TreeSet':
+        """
+        Returns a new TreeSet with the elements that are either in the current
+        TreeSet or in the given ones but not in both, merging both sets in
+        *O(n + m)*. This method is called when using the built-in operator
+        '^'.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: a new TreeSet with the symmetric difference of both sets
+        :rtype: TreeSet
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__combine(other, True, False, True)
+
+    def update(self, other: Iterable[E]) -> None:
+        """
+        Adds the given elements to the current TreeSet. If they are few
+        compared with the elements of the TreeSet, they are inserted one by
+        one in *O(m log n)*, moving a finger from each element to the next
+        one. Otherwise, both sets are merged in *O(n + m)* and the tree is
+        rebuilt. This method is called when using the built-in operator '|='.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._merge_sorted(*self.__other_items(other), True, True, True)
+
+    def intersection_update(self, other: Iterable[E]) -> None:
+        """
+        Keeps only the elements of the current TreeSet that are also in the
+        given ones, combining both sets like :meth:`update`. This method is
+        called when using the built-in operator '&='.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._merge_sorted(*self.__other_items(other), False, True, False)
+
+    def difference_update(self, other: Iterable[E]) -> None:
+        """
+        Removes the given elements from the current TreeSet, combining both
+        sets like :meth:`update`. This method is called when using the
+        built-in operator '-='.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._merge_sorted(*self.__other_items(other), True, False, False)
+
+    def symmetric_difference_update(self, other: Iterable[E]) -> None:
+        """
+        Keeps the elements that are either in the current TreeSet or in the
+        given ones but not in both, combining both sets like :meth:`update`.
+        This method is called when using the built-in operator '^='.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._merge_sorted(*self.__other_items(other), True, False, True)
+
+    def issubset(self, other: Iterable[E]) -> bool:
+        """
+        Checks if every element of the current TreeSet is in the given
+        elements. The sorted keys of both sets are compared in a single
+        lockstep walk that stops at the first missing element, in
+        *O(n + m)*. If the other set is a TreeSet much larger than this one,
+        the elements are sought in it with a finger instead, in
+        *O(n log(m / n))*.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: True if the current TreeSet is a subset of the other
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        keys, size, tree = self.__other_keys(other)
+        return self.__includes(keys, size, tree, self._keys(), self.size())
+
+    def issuperset(self, other: Iterable[E]) -> bool:
+        """
+        Checks if every one of the given elements is in the current TreeSet,
+        comparing the sorted keys of both sets like :meth:`issubset`.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: True if the current TreeSet is a superset of the other
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        keys, size, tree = self.__other_keys(other)
+        return self.__includes(self._keys(), self.size(), self, keys, size)
+
+    def isdisjoint(self, other: Iterable[E]) -> bool:
+        """
+        Checks if the current TreeSet has no element in common with the given
+        elements. The sorted keys of both sets are compared in a single
+        lockstep walk that stops at the first common element, in
+        *O(n + m)*. If one of the sets is a TreeSet much larger than the
+        other one, the elements of the smaller set are sought in it with a
+        finger instead.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: True if both sets have no common element
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        keys, size, tree = self.__other_keys(other)
+        if self.__seeks(size, self.size(), self):
+            return not any(self.__found(self, list(keys)))
+        if self.__seeks(self.size(), size, tree):
+            return not any(self.__found(tree, list(self._keys())))
+
+        keys = iter(keys)
+        other_key = next(keys, None)
+        for key in self._keys():
+            while other_key is not None and other_key < key:
+                other_key = next(keys, None)
+            if other_key is None:
+                return True
+            if not key < other_key:
+                return False
+
+        return True
+
+    def __other_keys(self, other: Iterable[E]) \
+            -> Tuple[Iterable, int, Union['TreeSet', None]]:
+        """
+        Private method that returns the sorted keys of the given elements to
+        compare them with the current TreeSet. If the other set is a tree
+        with the same key function and a compatible type, its keys are walked
+        without copying them. Otherwise, the given elements are validated,
+        sorted and deduplicated first.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: the sorted unique keys, their number and the other tree, or
+            None if the other set is not a tree
+        :rtype: Tuple[Iterable, int, Union[TreeSet, None]]
+        """
+        if isinstance(other, RedBlackTree) and other.key is self.key \
+                and issubclass(other.object_type, self.object_type):
+            return other._keys(), other.size(), other
+        keys = self._RedBlackTree__sorted_unique(other)[0]
+        return keys, len(keys), None
+
+    def __includes(self, keys: Iterable, size: int,
+                   tree: Union['TreeSet', None], other_keys: Iterable,
+                   other_size: int) -> bool:
+        """
+        Private method that checks if every one of the other sorted keys is
+        one of the sorted keys. If the keys belong to a tree much larger than
+        the other keys, each other key is sought in it with a finger.
+        Otherwise, both keys are walked in lockstep.
+
+        :param keys: the sorted unique keys that must include the others
+        :type keys: Iterable
+        :param size: the number of keys
+        :type size: int
+        :param tree: the tree of the keys, or None if they are not a tree
+        :type tree: Union[TreeSet, None]
+        :param other_keys: the sorted unique keys to search
+        :type other_keys: Iterable
+        :param other_size: the number of other keys
+        :type other_size: int
+        :return: True if every other key is one of the keys
+        :rtype: bool
+        """
+        if other_size > size:
+            return False
+        if self.__seeks(other_size, size, tree):
+            return all(self.__found(tree, list(other_keys)))
+
+        keys = iter(keys)
+        for other_key in other_keys:
+            for key in keys:
+                if not key < other_key:
+                    break
+            else:
+                return False
+            if not key == other_key:
+                return False
+
+        return True
+
+    def __seeks(self, size: int, tree_size: int,
+                tree: Union['TreeSet', None]) -> bool:
+        """
+        Private method that decides whether the given number of keys must be
+        sought in the given tree instead of walking both in lockstep, which
+        is the case when the tree is much larger than the sought keys.
+
+        :param size: the number of keys to seek
+        :type size: int
+        :param tree_size: the number of elements of the tree
+        :type tree_size: int
+        :param tree: the tree, or None if the keys cannot be sought
+        :type tree: Union[TreeSet, None]
+        :return: True if the keys must be sought in the tree
+        :rtype: bool
+        """
+        return tree is not None \
+            and size * tree_size.bit_length() < self._SEEK_RATIO * tree_size
+
+    @staticmethod
+    def __found(tree: 'TreeSet', keys: List) -> Iterator[bool]:
+        """
+        Private method that seeks the given ascending keys in the given tree,
+        moving a finger from each answer to the next one, and returns whether
+        each key was found.
+
+        :param tree: the tree to search
+        :type tree: TreeSet
+        :param keys: the sorted keys to seek
+        :type keys: List
+        :return: an iterator telling whether each key is in the tree
+        :rtype: Iterator[bool]
+        """
+        found = tree._seek_many(keys, False)[0]
+        return (key is not None and key == sought
+                for key, sought in zip(found, keys))
+
+    def __combine(self, other: Iterable[E], left: bool, both: bool,
+                  right: bool) -> 'TreeSet':
+        """
+        Private method that returns a new TreeSet, of the same class and with
+        the same key function, built from the merge of the current TreeSet
+        and the given elements.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :param left: if True, the elements only found in this set are kept
+        :type left: bool
+        :param both: if True, the elements found in both sets are kept
+        :type both: bool
+        :param right: if True, the elements only found in the other are kept
+        :type right: bool
+        :return: a new TreeSet with the merged elements
+        :rtype: TreeSet
+        """
+        result = type(self)(self.object_type, key=self.key)
+        result._load_sorted(*self._RedBlackTree__merge(
+            *self._sorted_items(), *self.__other_items(other), left, both,
+            right))
+        return result
+
+    def __other_items(self, other: Iterable[E]) -> Tuple[List, List]:
+        """
+        Private method that returns the sorted keys and values of the given
+        elements to merge them with the current TreeSet. If the other set is
+        a tree with the same key function and a compatible type, its in-order
+        elements are used directly. Otherwise, the given elements are
+        validated, sorted and deduplicated first.
+
+        :param other: a TreeSet or any iterable of elements
+        :type other: Iterable[E]
+        :return: the sorted list of unique keys and the list of their values
+        :rtype: Tuple[List, List]
+        """
+        if isinstance(other, RedBlackTree) and other.key is self.key \
+                and issubclass(other.object_type, self.object_type):
+            return other._sorted_items()
+        return self._RedBlackTree__sorted_unique(other)
+
+    def __or__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Returns the union of the current TreeSet and the given one. This
+        method is called when using the built-in operator '|'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: a new TreeSet with the union of both sets
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Returns the intersection of the current TreeSet and the given one.
+        This method is called when using the built-in operator '&'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: a new TreeSet with the intersection of both sets
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.intersection(other)
+
+    def __sub__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Returns the difference of the current TreeSet and the given one. This
+        method is called when using the built-in operator '-'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: a new TreeSet with the difference of both sets
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.difference(other)
+
+    def __xor__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Returns the symmetric difference of the current TreeSet and the given
+        one. This method is called when using the built-in operator '^'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: a new TreeSet with the symmetric difference of both sets
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.symmetric_difference(other)
+
+    def __ior__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Adds the elements of the given TreeSet to the current one. This method
+        is called when using the built-in operator '|='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: the current TreeSet
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        self.update(other)
+        return self
+
+    def __iand__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Keeps only the elements of the current TreeSet that are in the given
+        one. This method is called when using the built-in operator '&='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: the current TreeSet
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Removes the elements of the given TreeSet from the current one. This
+        method is called when using the built-in operator '-='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: the current TreeSet
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other: 'TreeSet') -> 'TreeSet':
+        """
+        Keeps the elements that are in the current TreeSet or in the given one
+        but not in both. This method is called when using the built-in
+        operator '^='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: the current TreeSet
+        :rtype: TreeSet
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        self.symmetric_difference_update(other)
+        return self
+
+    def __le__(self, other: 'TreeSet') -> bool:
+        """
+        Checks if the current TreeSet is a subset of the given one.
+        This method is called when using the built-in operator '<='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: True if the current TreeSet is a subset of the other
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.issubset(other)
+
+    def __lt__(self, other: 'TreeSet') -> bool:
+        """
+        Checks if the current TreeSet is a proper subset of the given
+        one, a subset with fewer elements.
+        This method is called when using the built-in operator '<'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: True if the current TreeSet is a proper subset of the other
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        keys, size, tree = self.__other_keys(other)
+        return self.size() < size \
+            and self.__includes(keys, size, tree, self._keys(), self.size())
+
+    def __ge__(self, other: 'TreeSet') -> bool:
+        """
+        Checks if the current TreeSet is a superset of the given one.
+        This method is called when using the built-in operator '>='.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: True if the current TreeSet is a superset of the other
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        return self.issuperset(other)
+
+    def __gt__(self, other: 'TreeSet') -> bool:
+        """
+        Checks if the current TreeSet is a proper superset of the given
+        one, a superset with more elements.
+        This method is called when using the built-in operator '>'.
+
+        :param other: another TreeSet
+        :type other: TreeSet
+        :return: True if the current TreeSet is a proper superset of the other
+        :rtype: bool
+        """
+        if not isinstance(other, RedBlackTree):
+            return NotImplemented
+        keys, size, tree = self.__other_keys(other)
+        return self.size() > size \
+            and self.__includes(self._keys(), self.size(), self, keys, size)
 
     def contains(self, value: E) -> bool:
         """
@@ -727,9 +2571,37 @@ class TreeSet(RedBlackTree):
         """
         return value in self
 
-    @RedBlackTree._null_validation
-    @RedBlackTree._type_validation
-    @RedBlackTree._check_comparable
+    def contains_key(self, key: Any) -> bool:
+        """
+        Checks if the current TreeSet contains an element with the given sort
+        key. If the TreeSet has no key function, the key is an element.
+
+        :param key: the sort key to search
+        :type key: Any
+        :return: True if an element with the given key is contained else False
+        :rtype: bool
+        :raises NullPointerException: if the given key is None
+        """
+        return self.get(key) is not None
+
+    def get(self, key: Any) -> Union[E, None]:
+        """
+        Returns the element of the current TreeSet whose sort key is equal to
+        the given key. If the TreeSet has no key function, the key is an
+        element and the stored element equal to it is returned.
+
+        :param key: the sort key to search
+        :type key: Any
+        :return: the element with the given key or None if it was not found
+        :rtype: Union[E, None]
+        :raises NullPointerException: if the given key is None
+        """
+        if key is None:
+            raise NullPointerException("Key cannot be None")
+
+        return self._RedBlackTree__contains(key).value
+
+    @RedBlackTree._validation
     def higher(self, value: E) -> Union[E, None]:
         """
         Returns the next higher value in the tree compared to the given
@@ -743,11 +2615,13 @@ class TreeSet(RedBlackTree):
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
         """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
         current = self._RedBlackTree__root
         result = None
 
         while current is not RedBlackTree._NULL:
-            if current.value > value:
+            if key < current.key:
                 result = current.value
                 current = current.left
             else:
@@ -755,9 +2629,7 @@ class TreeSet(RedBlackTree):
 
         return result
 
-    @RedBlackTree._null_validation
-    @RedBlackTree._type_validation
-    @RedBlackTree._check_comparable
+    @RedBlackTree._validation
     def lower(self, value: E) -> Union[E, None]:
         """
         Returns the contiguous lower element of the given value from the
@@ -773,11 +2645,13 @@ class TreeSet(RedBlackTree):
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
         """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
         current = self._RedBlackTree__root
         result = None
 
         while current is not RedBlackTree._NULL:
-            if current.value < value:
+            if current.key < key:
                 result = current.value
                 current = current.right
             else:
@@ -785,9 +2659,7 @@ class TreeSet(RedBlackTree):
 
         return result
 
-    @RedBlackTree._null_validation
-    @RedBlackTree._type_validation
-    @RedBlackTree._check_comparable
+    @RedBlackTree._validation
     def ceiling(self, value: E) -> Union[E, None]:
         """
         Returns the least element in this set greater than
@@ -804,23 +2676,21 @@ class TreeSet(RedBlackTree):
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
         """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
         current = self._RedBlackTree__root
         result = None
 
         while current is not RedBlackTree._NULL:
-            if current.value == value:
-                return value
-            elif current.value > value:
+            if current.key < key:
+                current = current.right
+            else:
                 result = current.value
                 current = current.left
-            else:
-                current = current.right
 
         return result
 
-    @RedBlackTree._null_validation
-    @RedBlackTree._type_validation
-    @RedBlackTree._check_comparable
+    @RedBlackTree._validation
     def floor(self, value: E) -> Union[E, None]:
         """
         Returns the greatest element in this set less than or
@@ -837,23 +2707,502 @@ class TreeSet(RedBlackTree):
         :raises NullPointerException: if the given value is None
         :raises ClassCastException: if the given value is not comparable
         """
+        key = value if (key_function := self._RedBlackTree__key) is None \
+            else key_function(value)
         current = self._RedBlackTree__root
         result = None
 
         while current is not RedBlackTree._NULL:
-            if current.value == value:
-                return value
-            elif current.value < value:
+            if key < current.key:
+                current = current.left
+            else:
                 result = current.value
                 current = current.right
+
+        return result
+
+    def contains_many(self, values: Iterable[E]) -> List[bool]:
+        """
+        Checks which of the given elements are contained in the TreeSet. The
+        queries are sorted once and answered in a single walk that moves a
+        finger from each answer to the next one, so close queries only climb
+        and descend a few levels instead of starting from the root. A NumPy
+        array is also accepted when NumPy is installed.
+
+        :param values: the elements to look for
+        :type values: Iterable[E]
+        :return: a list with True for every contained element and False for
+            the others, in the order of the given elements
+        :rtype: List[bool]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        keys, order = self.__queries(values, False)
+        found, _ = self._seek_many([keys[index] for index in order], False)
+        result = [False] * len(keys)
+        for index, key in zip(order, found):
+            result[index] = key is not None and not keys[index] < key
+        return result
+
+    def floor_many(self, values: Iterable[E]) -> List[Union[E, None]]:
+        """
+        Returns the greatest element lower than or equal to each of the given
+        elements. See :meth:`floor` and :meth:`contains_many`.
+
+        :param values: the elements to look for
+        :type values: Iterable[E]
+        :return: a list with the floor of every element, or None if it has
+            no floor, in the order of the given elements
+        :rtype: List[Union[E, None]]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest_many(values, True)
+
+    def ceiling_many(self, values: Iterable[E]) -> List[Union[E, None]]:
+        """
+        Returns the least element greater than or equal to each of the given
+        elements. See :meth:`ceiling` and :meth:`contains_many`.
+
+        :param values: the elements to look for
+        :type values: Iterable[E]
+        :return: a list with the ceiling of every element, or None if it has
+            no ceiling, in the order of the given elements
+        :rtype: List[Union[E, None]]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest_many(values, False)
+
+    def __nearest_many(self, values: Iterable[E],
+                       reverse: bool) -> List[Union[E, None]]:
+        """
+        Private method that returns the ceiling of every given element, or
+        the floor if reverse is True, in the order of the given elements.
+
+        :param values: the elements to look for
+        :type values: Iterable[E]
+        :param reverse: if True, the floors are returned
+        :type reverse: bool
+        :return: the ceiling or floor of every element, or None
+        :rtype: List[Union[E, None]]
+        """
+        keys, order = self.__queries(values, reverse)
+        _, found = self._seek_many([keys[index] for index in order], reverse)
+        result = [None] * len(keys)
+        for index, value in zip(order, found):
+            result[index] = value
+        return result
+
+    def __queries(self, values: Iterable[E],
+                  reverse: bool) -> Tuple[List, List[int]]:
+        """
+        Private method that validates the given elements and returns their
+        keys and the indexes of the keys in ascending order, or descending if
+        reverse is True.
+
+        :param values: the elements to look for
+        :type values: Iterable[E]
+        :param reverse: if True, the indexes are sorted in descending order
+        :type reverse: bool
+        :return: the keys of the elements and their sorted indexes
+        :rtype: Tuple[List, List[int]]
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = values.tolist()
+        values = list(values)
+        valid_types = self._RedBlackTree__valid_types
+        for value in values:
+            if type(value) not in valid_types:
+                self._validate(value)
+
+        keys = values if self.key is None else list(map(self.key, values))
+        return keys, sorted(range(len(keys)), key=keys.__getitem__,
+                            reverse=reverse)
+
+    @RedBlackTree._validation
+    def rank(self, value: E) -> int:
+        """
+        Returns the number of elements of the TreeSet lower than the given
+        value, which is the index of the value if it is contained. Every node
+        stores the size of its subtree, so it runs in *O(log n)*.
+
+        :param value: value to compare
+        :type value: E
+        :return: the number of elements lower than the given value
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self._count_below(
+            value if (key_function := self._RedBlackTree__key) is None
+            else key_function(value), False)
+
+    def _count_below(self, key: Any, inclusive: bool) -> int:
+        """
+        Returns the number of elements whose keys are lower than the given
+        key, or lower than or equal to it if inclusive is True, in one descent
+        that adds the sizes of the left subtrees it skips.
+
+        :param key: the sort key to compare
+        :type key: Any
+        :param inclusive: if True, the elements with the given key are counted
+        :type inclusive: bool
+        :return: the number of elements below the given key
+        :rtype: int
+        """
+        current = self._RedBlackTree__root
+        count = 0
+
+        while current is not RedBlackTree._NULL:
+            if (not key < current.key) if inclusive else current.key < key:
+                count += current.left.size + 1
+                current = current.right
             else:
                 current = current.left
 
+        return count
+
+    def _iter_range(self, low: Any, low_inclusive: bool, high: Any,
+                    high_inclusive: bool,
+                    reverse: bool = False) -> Iterator[E]:
+        """
+        Generator that yields the elements whose keys are between the given
+        bounds, in ascending order or descending if reverse is True. The first
+        element is found with one descent in *O(log n)* and the next ones are
+        reached through the parent pointers, so no element out of the bounds
+        is visited.
+
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is included
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is included
+        :type high_inclusive: bool
+        :param reverse: if True, the elements are yielded in descending order
+        :type reverse: bool
+        """
+        walk = self._RedBlackTree__walk
+        if reverse:
+            for node in walk(self.__seek(high, high_inclusive, True), True):
+                if low is not None and (node.key < low if low_inclusive
+                                        else not low < node.key):
+                    return
+                yield node.value
+        else:
+            for node in walk(self.__seek(low, low_inclusive, False), False):
+                if high is not None and (high < node.key if high_inclusive
+                                         else not node.key < high):
+                    return
+                yield node.value
+
+    def __seek(self, key: Any, inclusive: bool,
+               reverse: bool) -> RedBlackNode:
+        """
+        Private method that finds the node with the least key greater than
+        the given one, or the greatest key lower than it if reverse is True,
+        making a single ordering comparison per level.
+
+        :param key: the key to seek, or None to seek the first node
+        :type key: Any
+        :param inclusive: if True, the node with the given key is found
+        :type inclusive: bool
+        :param reverse: if True, seeks the greatest node below the key
+        :type reverse: bool
+        :return: the found node or the null leaf
+        :rtype: RedBlackNode
+        """
+        null = RedBlackTree._NULL
+        current = self._RedBlackTree__root
+        result = null
+
+        while current is not null:
+            if key is None:
+                right = reverse
+            elif reverse:
+                right = (not key < current.key) if inclusive \
+                    else current.key < key
+            else:
+                right = current.key < key if inclusive \
+                    else not key < current.key
+
+            if right == reverse:
+                result = current
+            current = current.right if right else current.left
+
         return result
 
+    def _seek_many(self, keys: List, reverse: bool) -> Tuple[List, List]:
+        """
+        Finds the node with the least key greater than or equal to each of the
+        given ascending keys, or the greatest key lower than or equal to each
+        of the given descending keys if reverse is True. The answer of every
+        key is the finger for the next one: if it still answers the next key
+        it is reused without any comparison, otherwise the next key is sought
+        from it with :meth:`_finger`.
+
+        :param keys: the sorted keys to seek
+        :type keys: List
+        :param reverse: if True, the keys are descending and the floors are
+            sought
+        :type reverse: bool
+        :return: the keys and the values of the found nodes, or None for the
+            keys without answer, in the order of the given keys
+        :rtype: Tuple[List, List]
+        """
+        null = RedBlackTree._NULL
+        found_keys, found_values = [], []
+        finger = None
+        for key in keys:
+            if finger is None or finger is not null and (
+                    (key < finger.key) if reverse else (finger.key < key)):
+                finger = self._finger(finger, key, reverse)
+            found_keys.append(finger.key)
+            found_values.append(finger.value)
+
+        return found_keys, found_values
+
+    def select(self, index: int) -> E:
+        """
+        Returns the element of the TreeSet at the given index, the lowest
+        element being at index 0. Every node stores the size of its subtree,
+        so it runs in *O(log n)*.
+
+        :param index: the index of the element, between 0 and size - 1
+        :type index: int
+        :return: the element at the given index
+        :rtype: E
+        :raises IndexError: if the index is out of range
+        """
+        if not 0 <= index < self.size():
+            raise IndexError(f"TreeSet index out of range: {index}")
+
+        current = self._RedBlackTree__root
+        while index != (left_size := current.left.size):
+            if index < left_size:
+                current = current.left
+            else:
+                index -= left_size + 1
+                current = current.right
+
+        return current.value
+
+    def __getitem__(self, index: int) -> E:
+        """
+        Returns the element of the TreeSet at the given index. Negative
+        indexes count from the greatest element, like in a list. This method
+        is called when using the built-in operator '[]'.
+
+        :param index: the index of the element
+        :type index: int
+        :return: the element at the given index
+        :rtype: E
+        :raises TypeError: if the index is not an integer
+        :raises IndexError: if the index is out of range
+        """
+        if not isinstance(index, int):
+            raise TypeError(
+                f"TreeSet indices must be integers, not {type(index)}")
+
+        if not -(size := self.size()) <= index < size:
+            raise IndexError(f"TreeSet index out of range: {index}")
+
+        return self.select(index + size if index < 0 else index)
+
+    def count_range(self, low: E, high: E,
+                    inclusive: Tuple[bool, bool] = (True, False)) -> int:
+        """
+        Returns the number of elements of the TreeSet between the given
+        elements. It is computed with two rank descents in *O(log n)*, no
+        matter how many elements are in the range.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included,
+            by default the lower one is included and the upper one is not
+        :type inclusive: Tuple[bool, bool]
+        :return: the number of elements between both bounds, 0 if the lower
+            bound is greater than the upper one
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        self._validate(high)
+        key = self.key
+        count = self._count_below(high if key is None else key(high),
+                                  inclusive[1]) \
+            - self._count_below(low if key is None else key(low),
+                                not inclusive[0])
+        return max(count, 0)
+
+    def sub_set(self, low: E, high: E,
+                inclusive: Tuple[bool, bool] = (True, False)) -> TreeSetView:
+        """
+        Returns a view of the elements of the TreeSet between the given
+        elements. The view is backed by the TreeSet, so it does not copy any
+        element and it sees the later changes of the TreeSet.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included,
+            by default the lower one is included and the upper one is not
+        :type inclusive: Tuple[bool, bool]
+        :return: a view of the elements between both bounds
+        :rtype: TreeSetView
+        :raises ValueError: if the lower bound is greater than the upper one
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        self._validate(high)
+        key = self.key
+        low_key = low if key is None else key(low)
+        high_key = high if key is None else key(high)
+        if high_key < low_key:
+            raise ValueError(
+                f"Lower bound {low} is greater than upper bound {high}")
+
+        return TreeSetView(self, low_key, inclusive[0], high_key, inclusive[1])
+
+    def head_set(self, high: E, inclusive: bool = False) -> TreeSetView:
+        """
+        Returns a view of the elements of the TreeSet lower than the given
+        element, or equal to it if inclusive is True. See :meth:`sub_set`.
+
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: if True, the upper bound is included
+        :type inclusive: bool
+        :return: a view of the elements below the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(high)
+        return TreeSetView(self, high=high if self.key is None
+                           else self.key(high), high_inclusive=inclusive)
+
+    def tail_set(self, low: E, inclusive: bool = True) -> TreeSetView:
+        """
+        Returns a view of the elements of the TreeSet greater than or equal to
+        the given element, or only greater if inclusive is False. See
+        :meth:`sub_set`.
+
+        :param low: the lower bound element
+        :type low: E
+        :param inclusive: if True, the lower bound is included
+        :type inclusive: bool
+        :return: a view of the elements above the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        return TreeSetView(self, low=low if self.key is None
+                           else self.key(low), low_inclusive=inclusive)
+
+    def remove_range(self, low: E, high: E,
+                     inclusive: Tuple[bool, bool] = (True, False)) -> int:
+        """
+        Removes the elements of the TreeSet between the given elements. The
+        TreeSet is split by both bounds and joined back without the range, so
+        the range is detached at once instead of removing and rebalancing
+        every element.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included,
+            by default the lower one is included and the upper one is not
+        :type inclusive: Tuple[bool, bool]
+        :return: the number of removed elements, 0 if the lower bound is
+            greater than the upper one
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        self._validate(high)
+        key = self.key
+        low_key = low if key is None else key(low)
+        high_key = high if key is None else key(high)
+        if high_key < low_key \
+                or not low_key < high_key and not all(inclusive):
+            return 0
+        return self._remove_range(low_key, inclusive[0], high_key,
+                                  inclusive[1])
+
+    def remove_head(self, high: E, inclusive: bool = False) -> int:
+        """
+        Removes the elements of the TreeSet lower than the given element, or
+        equal to it if inclusive is True. See :meth:`remove_range`.
+
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: if True, the upper bound is removed
+        :type inclusive: bool
+        :return: the number of removed elements
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(high)
+        return self._remove_range(None, True, high if self.key is None
+                                  else self.key(high), inclusive)
+
+    def remove_tail(self, low: E, inclusive: bool = True) -> int:
+        """
+        Removes the elements of the TreeSet greater than or equal to the given
+        element, or only greater if inclusive is False. See
+        :meth:`remove_range`.
+
+        :param low: the lower bound element
+        :type low: E
+        :param inclusive: if True, the lower bound is removed
+        :type inclusive: bool
+        :return: the number of removed elements
+        :rtype: int
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(low)
+        return self._remove_range(low if self.key is None else self.key(low),
+                                  inclusive, None, True)
+
     def first(self) -> E:
         """
-        Returns the lowest element contained in the current TreeSet instance.
+        Returns the lowest element contained in the current TreeSet instance,
+        in *O(1)* from the cached first node.
 
         :return: the lowest contained element
         :rtype: E
@@ -862,12 +3211,12 @@ class TreeSet(RedBlackTree):
         if self.is_empty():
             raise NoSuchElementException()
 
-        return next(self.iterator())
+        return self._extreme(False)
 
     def last(self) -> E:
         """
         Return the greatest element contained in the current TreeSet
-        instance.
+        instance, in *O(1)* from the cached last node.
 
         :return: the greatest contained element
         :rtype: E
@@ -876,37 +3225,29 @@ class TreeSet(RedBlackTree):
         if self.is_empty():
             raise NoSuchElementException()
 
-        return next(self.descending_iterator())
+        return self._extreme(True)
 
     def poll_first(self) -> E:
         """
         Retrieves and removes the first (lowest) element, or returns None
-        if this set is empty.
+        if this set is empty. The cached first node is unlinked directly, so
+        it runs in *O(log n)* without searching it.
 
         :return: the first (lowest) element, or None if this set is empty
         :rtype: Union[E, None]
-        :raises NoSuchElementException: if there is no such element
         """
-        try:
-            self.remove(item := self.first())
-            return item
-        except NoSuchElementException:
-            return None
+        return self._poll(False)
 
     def poll_last(self) -> E:
         """
-        Retrieves and removes the first (lowest) element, or returns None
-        if this set is empty.
+        Retrieves and removes the last (greatest) element, or returns None
+        if this set is empty. The cached last node is unlinked directly, so
+        it runs in *O(log n)* without searching it.
 
-        :return: the first (lowest) element, or None if this set is empty
+        :return: the last (greatest) element, or None if this set is empty
         :rtype: Union[E, None]
-        :raises NoSuchElementException: if there is no such element
         """
-        try:
-            self.remove(item := self.last())
-            return item
-        except NoSuchElementException:
-            return None
+        return self._poll(True)
 
     def iterator(self) -> Iterator[E]:
         """
@@ -927,6 +3268,53 @@ class TreeSet(RedBlackTree):
         """
         return iter(reversed(self))
 
+    def iter_from(self, value: E, inclusive: bool = True,
+                  reverse: bool = False) -> Iterator[E]:
+        """
+        Provides an iterator of the elements of the TreeSet starting from the
+        given element, in ascending order or descending if reverse is True.
+        The first element is sought in *O(log n)* and the next ones are
+        streamed lazily, so resuming a scan after the last seen element costs
+        *O(log n + k)* for k elements.
+
+        :param value: the element to start from
+        :type value: E
+        :param inclusive: if True, the given element is included if present
+        :type inclusive: bool
+        :param reverse: if True, the elements lower than the given one are
+            iterated in descending order
+        :type reverse: bool
+        :return: an iterator of the elements from the given one
+        :rtype: Iterator[E]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self._validate(value)
+        key = value if self.key is None else self.key(value)
+        if reverse:
+            return self._iter_range(None, True, key, inclusive, True)
+        return self._iter_range(key, inclusive, None, True)
+
+    def cursor(self, value: E = None) -> TreeSetCursor:
+        """
+        Returns a cursor (see the tree_set_cursor module) positioned at the
+        least element greater than or equal to the given one, or at the first
+        element if no element is given. The cursor remembers its node, so the
+        seeks, insertions and removals near its position compare *O(log d)*
+        keys for an element d positions away instead of *O(log n)*.
+
+        :param value: the element to position the cursor at, or None
+        :type value: E
+        :return: a cursor over the TreeSet
+        :rtype: TreeSetCursor
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return TreeSetCursor(self, value)
+
 
 if __name__ == "__main__":
     items = list(range(150))
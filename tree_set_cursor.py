@@ -0,0 +1,213 @@
+"""
+tree_set_cursor module.
+
+This module provides the TreeSetCursor class, a cursor that remembers a
+position in a TreeSet. The operations of a cursor start from the node of its
+position instead of the root, so seeking, inserting or removing an element d
+positions away from the previous one costs *O(log d)* comparisons instead of
+*O(log n)*, which makes the nearby operations of a sweep cheap.
+
+A TreeSetCursor is created through the TreeSet method:
+
+    cursor = tree.cursor()
+    cursor = tree.cursor(10)
+"""
+from typing import *
+from tree_set_exceptions import NoSuchElementException
+
+
+class TreeSetCursor:
+    """
+    Class that represents a cursor over the elements of a TreeSet. The cursor
+    is positioned at an element of the tree, or off the tree after moving
+    past either end.
+
+    The cursor supports get, seek, next, prev, insert_near and remove_here.
+    Every operation starts from the node of the current position: a seek
+    climbs from it to the lowest ancestor whose subtree bounds the sought
+    key and descends from there, comparing *O(log d)* keys for an element d
+    positions away. The insertions and removals still rebalance the tree and
+    update the subtree sizes of the ancestors, which takes *O(log n)* pointer
+    steps but no comparison.
+
+    The cursor holds a node of the tree, so it remembers the epoch of the
+    tree, which changes whenever nodes leave the tree. If the tree has
+    removed any node since the last operation of the cursor, the node may not
+    be in the tree anymore, and the cursor seeks its element again from the
+    root before going on. The same happens when the tree copies the nodes
+    that it shared with a copy-on-write clone before being modified.
+    """
+
+    __slots__ = ("__tree", "__node", "__key", "__epoch")
+
+    def __init__(self, tree, value: Any = None) -> None:
+        """
+        Constructor of the class.
+        Initializes a new cursor of the given tree, positioned at the least
+        element greater than or equal to the given one, or at the first
+        element if no value is given.
+
+        :param tree: the TreeSet to move through
+        :type tree: TreeSet
+        :param value: the element to position the cursor at, or None
+        :type value: Any
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__tree = tree
+        self.__node = None
+        self.__key = None
+        self.__epoch = tree._epoch()
+        if value is None:
+            if not tree.is_empty():
+                self.seek(tree.first())
+        else:
+            self.seek(value)
+
+    def get(self) -> Any:
+        """
+        Returns the element at the position of the cursor.
+
+        :return: the current element, or None if the cursor is off the tree
+        :rtype: Any
+        """
+        node = self.__position()
+        return None if node is None else self.__tree._item(node)[1]
+
+    def seek(self, value: Any) -> Any:
+        """
+        Moves the cursor to the least element greater than or equal to the
+        given one, starting from the current position.
+
+        :param value: the element to seek
+        :type value: Any
+        :return: the found element, or None if every element is lower than
+            the given one, in which case the cursor is left off the tree
+        :rtype: Any
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        tree = self.__tree
+        tree._validate(value)
+        key = value if tree.key is None else tree.key(value)
+        return self.__move(tree._finger(self.__position(), key))
+
+    def next(self) -> Any:
+        """
+        Moves the cursor to the next element.
+
+        :return: the next element, or None if the cursor was at the last
+            element or off the tree, in which case the cursor is left off
+            the tree
+        :rtype: Any
+        """
+        return self.__advance(False)
+
+    def prev(self) -> Any:
+        """
+        Moves the cursor to the previous element.
+
+        :return: the previous element, or None if the cursor was at the first
+            element or off the tree, in which case the cursor is left off
+            the tree
+        :rtype: Any
+        """
+        return self.__advance(True)
+
+    def insert_near(self, value: Any) -> bool:
+        """
+        Inserts the given element into the tree, seeking its place from the
+        current position, and moves the cursor to it. If an equal element is
+        already in the tree, the tree is not modified and the cursor is moved
+        to that element.
+
+        :param value: the element to insert
+        :type value: Any
+        :return: True if the element was inserted, False if it was present
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        tree = self.__tree
+        tree._validate(value)
+        key = value if tree.key is None else tree.key(value)
+        tree._own()
+        ceiling = tree._finger(self.__position(), key)
+        ceiling_key = tree._item(ceiling)[0]
+        if ceiling_key is not None and not key < ceiling_key:
+            self.__move(ceiling)
+            return False
+
+        self.__move(tree._insert_before(ceiling, value, key))
+        return True
+
+    def remove_here(self) -> Any:
+        """
+        Removes the element at the position of the cursor from the tree and
+        moves the cursor to the next element.
+
+        :return: the removed element
+        :rtype: Any
+        :raises NoSuchElementException: if the cursor is off the tree
+        """
+        tree = self.__tree
+        tree._own()
+        node = self.__position()
+        if node is None:
+            raise NoSuchElementException("The cursor is off the tree")
+
+        value = tree._item(node)[1]
+        self.__move(tree._remove_node(node))
+        return value
+
+    def __advance(self, reverse: bool) -> Any:
+        """
+        Moves the cursor to the next element, or the previous one if reverse
+        is True.
+
+        :param reverse: if True, the cursor moves backwards
+        :type reverse: bool
+        :return: the reached element, or None if the cursor is off the tree
+        :rtype: Any
+        """
+        node = self.__position()
+        if node is None:
+            return None
+        return self.__move(self.__tree._step(node, reverse))
+
+    def __position(self) -> Any:
+        """
+        Returns the node of the current position, seeking the element of the
+        cursor again from the root if the tree has removed any node since the
+        last operation of the cursor. If the element was removed, the cursor
+        is moved to the next element.
+
+        :return: the current node, or None if the cursor is off the tree
+        :rtype: Any
+        """
+        tree = self.__tree
+        if self.__node is not None and self.__epoch != tree._epoch():
+            self.__move(tree._finger(None, self.__key))
+        return self.__node
+
+    def __move(self, node: Any) -> Any:
+        """
+        Moves the cursor to the given node, or off the tree if it is the null
+        leaf, and remembers the current epoch of the tree.
+
+        :param node: the node to move to
+        :type node: Any
+        :return: the element of the node, or None for the null leaf
+        :rtype: Any
+        """
+        tree = self.__tree
+        key, value = tree._item(node)
+        self.__node = None if key is None else node
+        self.__key = key
+        self.__epoch = tree._epoch()
+        return value
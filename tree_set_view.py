@@ -0,0 +1,404 @@
+"""
+tree_set_view module.
+
+This module provides the TreeSetView class, a lazy view of the elements of a
+TreeSet between two bounds. A view does not copy any element: it is backed by
+the live tree, so the changes of the tree are seen by the view, and every
+operation seeks the bounds of the view in the tree in *O(log n)*.
+
+A TreeSetView is created through the TreeSet methods:
+
+    view = tree.sub_set(10, 20)
+    view = tree.head_set(20, inclusive=True)
+    view = tree.tail_set(10)
+"""
+from typing import *
+from tree_set_exceptions import NoSuchElementException
+
+
+class TreeSetView:
+    """
+    Class that represents a view of the elements of a TreeSet whose keys are
+    between a lower and an upper bound. Each bound can be inclusive or
+    exclusive, and it can be missing, so the view has no limit on that side.
+
+    The view supports iteration, len, contains, first, last, higher, lower,
+    ceiling and floor without materializing its elements, and new views can
+    be created from it, bounded by the intersection of both ranges.
+    """
+
+    __slots__ = ("__tree", "__low", "__low_inclusive", "__high",
+                 "__high_inclusive")
+
+    def __init__(self, tree, low: Any = None, low_inclusive: bool = True,
+                 high: Any = None, high_inclusive: bool = False) -> None:
+        """
+        Constructor of the class.
+        Initializes a new view of the given tree between the given key
+        bounds.
+
+        :param tree: the TreeSet backing the view
+        :type tree: TreeSet
+        :param low: the lower key bound, or None if there is no lower bound
+        :type low: Any
+        :param low_inclusive: if True, the lower bound is included
+        :type low_inclusive: bool
+        :param high: the upper key bound, or None if there is no upper bound
+        :type high: Any
+        :param high_inclusive: if True, the upper bound is included
+        :type high_inclusive: bool
+        """
+        self.__tree = tree
+        self.__low = low
+        self.__low_inclusive = low_inclusive
+        self.__high = high
+        self.__high_inclusive = high_inclusive
+
+    def sub_set(self, low: Any, high: Any,
+                inclusive: Tuple[bool, bool] = (True, False)) -> 'TreeSetView':
+        """
+        Returns a view of the elements of this view between the given
+        elements.
+
+        :param low: the lower bound element
+        :type low: E
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: whether the lower and the upper bounds are included
+        :type inclusive: Tuple[bool, bool]
+        :return: a view of the elements between both bounds
+        :rtype: TreeSetView
+        :raises ValueError: if the lower bound is greater than the upper one
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__narrow(self.__tree.sub_set(low, high, inclusive))
+
+    def head_set(self, high: Any, inclusive: bool = False) -> 'TreeSetView':
+        """
+        Returns a view of the elements of this view lower than the given
+        element, or equal to it if inclusive is True.
+
+        :param high: the upper bound element
+        :type high: E
+        :param inclusive: if True, the upper bound is included
+        :type inclusive: bool
+        :return: a view of the elements below the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__narrow(self.__tree.head_set(high, inclusive))
+
+    def tail_set(self, low: Any, inclusive: bool = True) -> 'TreeSetView':
+        """
+        Returns a view of the elements of this view greater than or equal to
+        the given element, or only greater if inclusive is False.
+
+        :param low: the lower bound element
+        :type low: E
+        :param inclusive: if True, the lower bound is included
+        :type inclusive: bool
+        :return: a view of the elements above the bound
+        :rtype: TreeSetView
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__narrow(self.__tree.tail_set(low, inclusive))
+
+    def size(self) -> int:
+        """
+        Returns the number of elements of the view, computed with two rank
+        descents in *O(log n)*.
+
+        :return: the number of elements of the view
+        :rtype: int
+        """
+        tree = self.__tree
+        high = tree.size() if self.__high is None \
+            else tree._count_below(self.__high, self.__high_inclusive)
+        low = 0 if self.__low is None \
+            else tree._count_below(self.__low, not self.__low_inclusive)
+        return max(high - low, 0)
+
+    def is_empty(self) -> bool:
+        """
+        Checks if the view has no elements.
+
+        :return: True if the view is empty else False
+        :rtype: bool
+        """
+        return next(iter(self), None) is None
+
+    def contains(self, value: Any) -> bool:
+        """
+        Checks if the given value is contained in the view.
+
+        :param value: to check if it is contained
+        :type value: E
+        :return: True if value is contained else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return value in self
+
+    def first(self) -> Any:
+        """
+        Returns the lowest element of the view.
+
+        :return: the lowest element of the view
+        :rtype: E
+        :raises NoSuchElementException: if the view is empty
+        """
+        if (value := next(iter(self), None)) is None:
+            raise NoSuchElementException()
+        return value
+
+    def last(self) -> Any:
+        """
+        Returns the greatest element of the view.
+
+        :return: the greatest element of the view
+        :rtype: E
+        :raises NoSuchElementException: if the view is empty
+        """
+        if (value := next(reversed(self), None)) is None:
+            raise NoSuchElementException()
+        return value
+
+    def higher(self, value: Any) -> Any:
+        """
+        Returns the least element of the view greater than the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the found element or None if there is no such element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(value, False, False)
+
+    def lower(self, value: Any) -> Any:
+        """
+        Returns the greatest element of the view lower than the given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the found element or None if there is no such element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(value, False, True)
+
+    def ceiling(self, value: Any) -> Any:
+        """
+        Returns the least element of the view greater than or equal to the
+        given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the found element or None if there is no such element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(value, True, False)
+
+    def floor(self, value: Any) -> Any:
+        """
+        Returns the greatest element of the view lower than or equal to the
+        given value.
+
+        :param value: value to compare
+        :type value: E
+        :return: the found element or None if there is no such element
+        :rtype: Union[E, None]
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        return self.__nearest(value, True, True)
+
+    def __nearest(self, value: Any, inclusive: bool, reverse: bool) -> Any:
+        """
+        Private method that returns the first element of the view found from
+        the given value, upwards or downwards if reverse is True.
+
+        :param value: value to compare
+        :type value: E
+        :param inclusive: if True, the element equal to the value is found
+        :type inclusive: bool
+        :param reverse: if True, searches downwards
+        :type reverse: bool
+        :return: the found element or None if there is no such element
+        :rtype: Union[E, None]
+        """
+        key = self.__key_of(value)
+        low, low_inclusive = self.__low, self.__low_inclusive
+        high, high_inclusive = self.__high, self.__high_inclusive
+        if reverse:
+            high, high_inclusive = self.__upper(high, high_inclusive, key,
+                                                inclusive)
+        else:
+            low, low_inclusive = self.__lower(low, low_inclusive, key,
+                                              inclusive)
+
+        return next(self.__tree._iter_range(low, low_inclusive, high,
+                                            high_inclusive, reverse), None)
+
+    def __key_of(self, value: Any) -> Any:
+        """
+        Private method that validates the given value and returns its key.
+
+        :param value: the value to validate
+        :type value: E
+        :return: the sort key of the value
+        :rtype: Any
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        self.__tree._validate(value)
+        return value if (key := self.__tree.key) is None else key(value)
+
+    def __narrow(self, view: 'TreeSetView') -> 'TreeSetView':
+        """
+        Private method that returns a view bounded by the intersection of the
+        ranges of this view and the given one.
+
+        :param view: a view of the same tree
+        :type view: TreeSetView
+        :return: the narrowed view
+        :rtype: TreeSetView
+        """
+        low, low_inclusive = self.__lower(
+            self.__low, self.__low_inclusive, view.__low, view.__low_inclusive)
+        high, high_inclusive = self.__upper(
+            self.__high, self.__high_inclusive, view.__high,
+            view.__high_inclusive)
+        return TreeSetView(self.__tree, low, low_inclusive, high,
+                           high_inclusive)
+
+    @staticmethod
+    def __lower(key: Any, inclusive: bool, other: Any,
+                other_inclusive: bool) -> Tuple[Any, bool]:
+        """
+        Private method that returns the tighter of two lower bounds.
+
+        :param key: a lower bound, or None if there is no bound
+        :param inclusive: if True, the bound is included
+        :param other: another lower bound, or None if there is no bound
+        :param other_inclusive: if True, the other bound is included
+        :return: the tighter bound and whether it is included
+        :rtype: Tuple[Any, bool]
+        """
+        if other is None or (key is not None and other < key):
+            return key, inclusive
+        if key is None or key < other:
+            return other, other_inclusive
+        return key, inclusive and other_inclusive
+
+    @staticmethod
+    def __upper(key: Any, inclusive: bool, other: Any,
+                other_inclusive: bool) -> Tuple[Any, bool]:
+        """
+        Private method that returns the tighter of two upper bounds.
+
+        :param key: an upper bound, or None if there is no bound
+        :param inclusive: if True, the bound is included
+        :param other: another upper bound, or None if there is no bound
+        :param other_inclusive: if True, the other bound is included
+        :return: the tighter bound and whether it is included
+        :rtype: Tuple[Any, bool]
+        """
+        if other is None or (key is not None and key < other):
+            return key, inclusive
+        if key is None or other < key:
+            return other, other_inclusive
+        return key, inclusive and other_inclusive
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Method to iterate over the view, seeking its first element in
+        *O(log n)*.
+
+        :return: an iterator over the view
+        :rtype: Iterator[E]
+        """
+        return self.__tree._iter_range(self.__low, self.__low_inclusive,
+                                       self.__high, self.__high_inclusive)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """
+        Method to iterate reversely over the view, seeking its last element in
+        *O(log n)*.
+
+        :return: a descending iterator over the view
+        :rtype: Iterator[E]
+        """
+        return self.__tree._iter_range(self.__low, self.__low_inclusive,
+                                       self.__high, self.__high_inclusive,
+                                       True)
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check if the given value is contained in the view. This method is
+        called when using built-in operator 'in'.
+
+        :param value: the value to check
+        :type value: E
+        :return: True if it is contained else False
+        :rtype: bool
+        :raises TypeError: if the given values does not match the
+            instance type
+        :raises NullPointerException: if the given value is None
+        :raises ClassCastException: if the given value is not comparable
+        """
+        key = self.__key_of(value)
+        if self.__low is not None and (
+                key < self.__low if self.__low_inclusive
+                else not self.__low < key):
+            return False
+        if self.__high is not None and (
+                self.__high < key if self.__high_inclusive
+                else not key < self.__high):
+            return False
+        return self.__tree.contains_key(key)
+
+    def __len__(self) -> int:
+        """
+        Provides the number of elements of the view. It is used with the
+        built-in method len().
+
+        :return: the number of elements of the view
+        :rtype: int
+        """
+        return self.size()
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the view.
+
+        :return: view string representation
+        :rtype: str
+        """
+        return f"{[value for value in self]}"